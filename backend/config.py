@@ -1,5 +1,5 @@
 import os
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -14,6 +14,26 @@ def load_enabled_modules(all_modules: Dict[str, str]) -> Dict[str, str]:
     selected = [k.strip().upper() for k in enabled.split(',') if k.strip()]
     return {k: v for k, v in all_modules.items() if k in selected}
 
+def load_cascade_bands(default_bands: Dict[int, Tuple[float, float]]) -> Dict[int, Tuple[float, float]]:
+    """
+    환경변수 CASCADE_BANDS(예: "1:0.3-0.8,3:0.1-0.9")로 보안 레벨별 불확실 구간을 덮어씁니다.
+    """
+    bands = dict(default_bands)
+    raw = os.getenv("CASCADE_BANDS", "")
+
+    for entry in raw.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            level, band = entry.split(':')
+            low, high = band.split('-')
+            bands[int(level)] = (float(low), float(high))
+        except ValueError:
+            print(f"[WARNING] CASCADE_BANDS 항목 형식 오류 무시: {entry}")
+
+    return bands
+
 class Config:
 
     # ===== 시스템 설정 =====
@@ -29,6 +49,227 @@ class Config:
     BASIC_THRESHOLD: float = float(os.getenv("BASIC_THRESHOLD", 0.9))
     """Basic AI 모듈 임계값 (0.0 ~ 1.0)"""
 
+    BASIC_BATCH_SIZE: int = int(os.getenv("BASIC_BATCH_SIZE", 32))
+    """Basic AI 모듈 1회 추론 시 최대 배치 크기 (긴 댓글의 메모리 사용량 제한)"""
+
+    BASIC_MODULE_MODE: str = os.getenv("BASIC_MODULE_MODE", "word").lower()
+    """Basic AI 모듈 판정 방식 (word: 단어별 분류, sentence: 댓글 전체 1회 분류 + 가림(occlusion) 기여도로 적발 단어 추출)"""
+
+    BASIC_MAX_LENGTH: int = int(os.getenv("BASIC_MAX_LENGTH", 128))
+    """Basic AI 모듈 입력 최대 토큰 수 (sentence 모드에서 긴 댓글이 잘리는 길이)"""
+
+    BASIC_OCCLUSION_MIN_DROP: float = float(os.getenv("BASIC_OCCLUSION_MIN_DROP", 0.2))
+    """sentence 모드에서 단어를 가렸을 때 악성 확률이 이 값 이상 떨어지면 적발 단어로 봄"""
+
+    PIPELINE_WINDOW_SIZE: int = int(os.getenv("PIPELINE_WINDOW_SIZE", 100))
+    """유튜브 분석 시 한 번에 묶어서 처리할 댓글 수 (Basic 모듈 교차 배치 단위)"""
+
+    STREAM_WINDOW_SIZE: int = int(os.getenv("STREAM_WINDOW_SIZE", 20))
+    """스트리밍 분석 시 한 번에 판정하여 내보내는 댓글 수 (작을수록 첫 결과가 빨리 나감)"""
+
+    BATCH_MAX_ITEMS: int = int(os.getenv("BATCH_MAX_ITEMS", 1000))
+    """일괄 분석 API(/api/workflow/analyze-batch) 1회 요청의 최대 텍스트 수"""
+
+    BASIC_CACHE_SIZE: int = int(os.getenv("BASIC_CACHE_SIZE", 20000))
+    """Basic AI 모듈 단어별 확률 캐시 크기 (0이면 사용 안 함)"""
+
+    BASIC_CACHE_PATH: str = os.getenv("BASIC_CACHE_PATH", "")
+    """단어별 확률 캐시 저장 경로 (비어 있으면 디스크에 저장하지 않음)"""
+
+    BASIC_MODULE_RUNTIME: str = os.getenv("BASIC_MODULE_RUNTIME", "torch").lower()
+    """Basic AI 모듈 실행 방식 (torch: PyTorch, onnx: tools/export_basic_module.py로 만든 ONNX 모델을 ONNX Runtime으로 실행)"""
+
+    BASIC_ONNX_PATH: str = os.getenv("BASIC_ONNX_PATH", "")
+    """ONNX 모델 경로 (비어 있으면 basic_ai_module/model.onnx)"""
+
+    BASIC_ONNX_THREADS: int = int(os.getenv("BASIC_ONNX_THREADS", 0))
+    """ONNX Runtime 연산 스레드 수 (0이면 코어 수에 맞춰 자동)"""
+
+    # ===== LLM 호출 =====
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "")
+    """OpenAI 호환 API 주소 (비어 있으면 기본 주소, 로컬 스텁 서버 테스트용)"""
+
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", 8))
+    """비동기 LLM 동시 호출 수 (커넥션 풀 크기와 동일)"""
+
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", 3))
+    """429/5xx/타임아웃 시 재시도 횟수"""
+
+    LLM_CALL_DEADLINE: float = float(os.getenv("LLM_CALL_DEADLINE", 30))
+    """LLM 호출 1건의 마감 시간 (초, 재시도 포함)"""
+
+    LLM_BREAKER_FAILURES: int = int(os.getenv("LLM_BREAKER_FAILURES", 5))
+    """서킷 브레이커가 열리는 연속 실패 횟수"""
+
+    LLM_BREAKER_RECOVERY: float = float(os.getenv("LLM_BREAKER_RECOVERY", 30))
+    """서킷 브레이커가 열린 뒤 재시도까지 기다리는 시간 (초)"""
+
+    # ===== LLM 판정 캐시 =====
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "True").lower() == "true"
+    """LLM 판정 결과 캐시 사용 여부"""
+
+    LLM_CACHE_PATH: str = os.getenv(
+        "LLM_CACHE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "cache", "llm_verdict_cache.sqlite3")
+    )
+    """LLM 판정 캐시 SQLite 파일 경로 (':memory:'이면 메모리에만 저장)"""
+
+    LLM_CACHE_TTL: float = float(os.getenv("LLM_CACHE_TTL", 7 * 24 * 3600))
+    """LLM 판정 캐시 유효 시간 (초, 0이면 만료 없음)"""
+
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 100000))
+    """LLM 판정 캐시 최대 항목 수"""
+
+    # ===== LLM 묶음 프롬프트 =====
+    LLM_PACK_ENABLED: bool = os.getenv("LLM_PACK_ENABLED", "True").lower() == "true"
+    """여러 댓글을 하나의 LLM 요청으로 묶어서 처리할지 여부 (유튜브 분석 등 배치 처리 시)"""
+
+    LLM_PACK_TOKEN_BUDGET: int = int(os.getenv("LLM_PACK_TOKEN_BUDGET", 3000))
+    """묶음 요청 1건의 입력 토큰 예산 (판단 기준 포함, 추정치)"""
+
+    LLM_PACK_MAX_ITEMS: int = int(os.getenv("LLM_PACK_MAX_ITEMS", 25))
+    """묶음 요청 1건에 포함할 최대 댓글 수"""
+
+    # ===== 추론 스케줄러 (동시 요청 배치 처리) =====
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "True").lower() == "true"
+    """동시 요청의 Basic 모듈 추론을 묶어서 실행할지 여부"""
+
+    SCHEDULER_MAX_BATCH_SIZE: int = int(os.getenv("SCHEDULER_MAX_BATCH_SIZE", 64))
+    """스케줄러가 한 번에 실행할 최대 단어 수"""
+
+    SCHEDULER_MAX_WAIT_MS: float = float(os.getenv("SCHEDULER_MAX_WAIT_MS", 5))
+    """배치를 채우기 위해 기다리는 최대 시간 (ms)"""
+
+    SCHEDULER_MAX_QUEUE_SIZE: int = int(os.getenv("SCHEDULER_MAX_QUEUE_SIZE", 1024))
+    """스케줄러 대기열 최대 길이 (초과 시 호출 스레드에서 바로 실행)"""
+
+    # ===== 1차 필터 =====
+    FIRST_PASS_MATCH_MODE: str = os.getenv("FIRST_PASS_MATCH_MODE", "token").lower()
+    """사전 매칭 방식 ('token': 형태소 경계에 맞는 출현만, 'substring': 모든 출현)"""
+
+    FIRST_PASS_TOKENIZER: str = os.getenv("FIRST_PASS_TOKENIZER", "okt").lower()
+    """토큰 경계 추출 방식 ('okt': KoNLPy Okt 형태소 분석, 'regex': JVM 없는 정규식/음절 분절)"""
+
+    POS_CACHE_SIZE: int = int(os.getenv("POS_CACHE_SIZE", 50000))
+    """형태소 분석 결과 캐시 크기 (정규화된 전체 텍스트 단위, 0이면 사용 안 함)"""
+
+    POS_PHRASE_CACHE_SIZE: int = int(os.getenv("POS_PHRASE_CACHE_SIZE", 20000))
+    """형태소 분석 결과 캐시 크기 (어절 단위, 0이면 전체 텍스트 단위로만 캐시)"""
+
+    POS_CACHE_MAX_BYTES: int = int(os.getenv("POS_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+    """형태소 분석 캐시의 추정 메모리 상한 (바이트, 0이면 개수로만 제한)"""
+
+    FIRST_PASS_VARIANTS: bool = os.getenv("FIRST_PASS_VARIANTS", "True").lower() == "true"
+    """자모 분해/숫자 삽입/유사 문자 등 회피 변형 매칭 사용 여부"""
+
+    VARIANT_MAX_DISTANCE: int = int(os.getenv("VARIANT_MAX_DISTANCE", 1))
+    """변형 인덱스에서 허용할 최대 자모 편집 거리"""
+
+    VARIANT_MIN_LENGTH: int = int(os.getenv("VARIANT_MIN_LENGTH", 7))
+    """편집 거리 매칭을 적용할 최소 자모 길이 (짧은 단어는 접은 형태가 정확히 같을 때만 매칭)"""
+
+    FIRST_PASS_WORKERS: int = int(os.getenv("FIRST_PASS_WORKERS", 0))
+    """
+    묶음 분석 시 1차 필터를 실행할 워커 프로세스 수 (0이면 사용 안 함, 워커마다 JVM 1개).
+    워커는 spawn 방식으로 시작되어 실행 스크립트를 다시 읽으므로 `uvicorn main:app`으로 실행하는 것을 권장
+    """
+
+    FIRST_PASS_CHUNK_SIZE: int = int(os.getenv("FIRST_PASS_CHUNK_SIZE", 32))
+    """워커 프로세스에 한 번에 보낼 텍스트 수"""
+
+    # ===== 실행 계층 (스레드 풀 / 입장 제한) =====
+    CPU_WORKERS: int = int(os.getenv("CPU_WORKERS", 0))
+    """CPU 작업(1차 필터, Basic 모듈 등) 스레드 풀 크기 (0이면 코어 수)"""
+
+    IO_WORKERS: int = int(os.getenv("IO_WORKERS", 16))
+    """블로킹 I/O(YouTube API 등) 스레드 풀 크기"""
+
+    ANALYSIS_MAX_INFLIGHT: int = int(os.getenv("ANALYSIS_MAX_INFLIGHT", 8))
+    """동시에 실행하는 분석 요청 수"""
+
+    ANALYSIS_MAX_QUEUE: int = int(os.getenv("ANALYSIS_MAX_QUEUE", 32))
+    """실행 대기할 수 있는 분석 요청 수 (초과 시 429 응답)"""
+
+    ANALYSIS_RETRY_AFTER: int = int(os.getenv("ANALYSIS_RETRY_AFTER", 1))
+    """429 응답의 최소 Retry-After (초)"""
+
+    # ===== YouTube 수집 =====
+    YOUTUBE_API_BASE_URL: str = os.getenv("YOUTUBE_API_BASE_URL", "https://www.googleapis.com/youtube/v3")
+    """YouTube Data API 주소 (로컬 스텁 서버 테스트용으로 변경 가능)"""
+
+    YOUTUBE_PREFETCH_PAGES: int = int(os.getenv("YOUTUBE_PREFETCH_PAGES", 2))
+    """댓글 분석 중 미리 받아 둘 다음 페이지 수"""
+
+    YOUTUBE_MAX_CONNECTIONS: int = int(os.getenv("YOUTUBE_MAX_CONNECTIONS", 10))
+    """YouTube API 공유 커넥션 풀 크기"""
+
+    YOUTUBE_HTTP_TIMEOUT: float = float(os.getenv("YOUTUBE_HTTP_TIMEOUT", 10.0))
+    """YouTube API 요청 제한 시간 (초)"""
+
+    YOUTUBE_FETCH_REPLIES: bool = os.getenv("YOUTUBE_FETCH_REPLIES", "False").lower() == "true"
+    """
+    답글(reply)도 수집하여 분석할지 여부.
+    켜면 분석 결과(results)에 답글이 parent_id와 함께 추가되고, 답글 목록 요청만큼 쿼터를 더 사용합니다.
+    """
+
+    YOUTUBE_REPLY_CONCURRENCY: int = int(os.getenv("YOUTUBE_REPLY_CONCURRENCY", 4))
+    """답글 목록(comments.list) 동시 요청 수"""
+
+    YOUTUBE_REPLY_BUDGET: int = int(os.getenv("YOUTUBE_REPLY_BUDGET", 50))
+    """댓글 수집 1회(영상 분석 1건)당 답글 요청에 쓸 수 있는 최대 쿼터 단위"""
+
+    # ===== YouTube 응답 캐시 / 쿼터 =====
+    YOUTUBE_CACHE_ENABLED: bool = os.getenv("YOUTUBE_CACHE_ENABLED", "True").lower() == "true"
+    """YouTube API 응답을 디스크에 캐시하고 ETag로 재검증할지 여부"""
+
+    YOUTUBE_CACHE_PATH: str = os.getenv(
+        "YOUTUBE_CACHE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "cache", "youtube_response_cache.sqlite3")
+    )
+    """YouTube API 응답 캐시 SQLite 파일 경로 (':memory:'이면 메모리에만 저장)"""
+
+    YOUTUBE_CACHE_MAX_ENTRIES: int = int(os.getenv("YOUTUBE_CACHE_MAX_ENTRIES", 20000))
+    """YouTube API 응답 캐시 최대 항목 수"""
+
+    YOUTUBE_CACHE_TTL_VIDEOS: float = float(os.getenv("YOUTUBE_CACHE_TTL_VIDEOS", 3600))
+    """영상 메타데이터(videos) 응답을 재검증 없이 사용하는 시간 (초)"""
+
+    YOUTUBE_CACHE_TTL_COMMENTS: float = float(os.getenv("YOUTUBE_CACHE_TTL_COMMENTS", 300))
+    """댓글(commentThreads, comments) 응답을 재검증 없이 사용하는 시간 (초)"""
+
+    YOUTUBE_DAILY_QUOTA: int = int(os.getenv("YOUTUBE_DAILY_QUOTA", 10000))
+    """YouTube Data API 일일 쿼터 (단위)"""
+
+    YOUTUBE_QUOTA_RESERVE: float = float(os.getenv("YOUTUBE_QUOTA_RESERVE", 0.2))
+    """남은 쿼터가 이 비율 이하이면 만료된 캐시가 있어도 요청하지 않고 캐시를 사용"""
+
+    # ===== 댓글 분석 결과 저장소 =====
+    COMMENT_STORE_ENABLED: bool = os.getenv("COMMENT_STORE_ENABLED", "False").lower() == "true"
+    """
+    영상 댓글 분석 결과를 저장해 두고 재분석 시 새 댓글/바뀐 댓글만 분석할지 여부.
+    켜면 analyze-youtube가 최신순으로 수집하고 저장된 댓글 전체를 함께 반환합니다. (max_pages와 무관)
+    """
+
+    COMMENT_STORE_PATH: str = os.getenv(
+        "COMMENT_STORE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "cache", "comment_store.sqlite3")
+    )
+    """댓글 분석 결과 저장소 SQLite 파일 경로 (':memory:'이면 메모리에만 저장)"""
+
+    # ===== 단계적 판정 (Cascade) =====
+    CASCADE_ENABLED: bool = os.getenv("CASCADE_ENABLED", "False").lower() == "true"
+    """1차 필터 + Basic 모듈 결과의 중간 위험도가 불확실 구간에 있을 때만 LLM을 호출할지 여부"""
+
+    _DEFAULT_CASCADE_BANDS: Dict[int, Tuple[float, float]] = {
+        1: (0.3, 0.8),
+        2: (0.2, 0.85),
+        3: (0.1, 0.9),
+        4: (0.05, 0.95),
+        5: (0.0, 1.01),
+    }
+    CASCADE_BANDS: Dict[int, Tuple[float, float]] = load_cascade_bands(_DEFAULT_CASCADE_BANDS)
+    """보안 레벨별 LLM 호출 구간 [하한, 상한). 하한 미만은 안전, 상한 이상은 이미 확정으로 보고 LLM을 생략"""
+
     # ===== API 키 =====
     YOUTUBE_API_KEY: Optional[str] = os.getenv("YOUTUBE_API_KEY")
     OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
@@ -76,8 +317,23 @@ class Config:
         print(f"  보안 레벨: {cls.SECURITY_LEVEL}")
         print(f"  위험도 임계값: {cls.RISK_THRESHOLD}")
         print(f"  Basic AI 모듈 임계값: {cls.BASIC_THRESHOLD}")
+        print(f"  Basic AI 모듈 배치 크기: {cls.BASIC_BATCH_SIZE}")
+        print(f"  Basic AI 모듈 판정 방식: {cls.BASIC_MODULE_MODE} (최대 길이 {cls.BASIC_MAX_LENGTH})")
+        print(f"  Basic AI 모듈 실행 방식: {cls.BASIC_MODULE_RUNTIME}")
+        print(f"  Basic AI 모듈 캐시 크기: {cls.BASIC_CACHE_SIZE}")
+        print(f"  형태소 분석 캐시: 텍스트 {cls.POS_CACHE_SIZE}, 어절 {cls.POS_PHRASE_CACHE_SIZE} (최대 {cls.POS_CACHE_MAX_BYTES // (1024 * 1024)}MB)")
+        print(f"  파이프라인 묶음 크기: {cls.PIPELINE_WINDOW_SIZE}")
+        print(f"  실행 계층: CPU 스레드 {cls.CPU_WORKERS or '자동'}, I/O 스레드 {cls.IO_WORKERS}, 동시 분석 {cls.ANALYSIS_MAX_INFLIGHT} (대기 {cls.ANALYSIS_MAX_QUEUE})")
+        print(f"  추론 스케줄러: {'사용' if cls.SCHEDULER_ENABLED else '미사용'} (배치 {cls.SCHEDULER_MAX_BATCH_SIZE}, 대기 {cls.SCHEDULER_MAX_WAIT_MS}ms)")
+        print(f"  1차 필터 매칭: {cls.FIRST_PASS_MATCH_MODE}/{cls.FIRST_PASS_TOKENIZER} (회피 변형 {'사용' if cls.FIRST_PASS_VARIANTS else '미사용'}, 워커 프로세스 {cls.FIRST_PASS_WORKERS}개)")
         print(f"  특수 AI 모듈: {'사용' if cls.USE_DETAIL_AI_MODEL else '미사용'}")
+        print(f"  단계적 판정(Cascade): {'사용' if cls.CASCADE_ENABLED else '미사용'} (현재 레벨 구간: {cls.CASCADE_BANDS.get(cls.SECURITY_LEVEL)})")
         print(f"  활성 특수 AI 모듈: {list(cls.SPECIAL_AI_MODULES.keys())}")
+        print(f"  LLM 판정 캐시: {'사용' if cls.LLM_CACHE_ENABLED else '미사용'}")
+        print(f"  LLM 묶음 프롬프트: {'사용' if cls.LLM_PACK_ENABLED else '미사용'} (예산 {cls.LLM_PACK_TOKEN_BUDGET} 토큰, 최대 {cls.LLM_PACK_MAX_ITEMS}건)")
+        print(f"  YouTube 답글 수집: {'사용' if cls.YOUTUBE_FETCH_REPLIES else '미사용'} (동시 {cls.YOUTUBE_REPLY_CONCURRENCY}, 예산 {cls.YOUTUBE_REPLY_BUDGET}단위)")
+        print(f"  YouTube 응답 캐시: {'사용' if cls.YOUTUBE_CACHE_ENABLED else '미사용'} (TTL 영상 {cls.YOUTUBE_CACHE_TTL_VIDEOS}초, 댓글 {cls.YOUTUBE_CACHE_TTL_COMMENTS}초, 일일 쿼터 {cls.YOUTUBE_DAILY_QUOTA})")
+        print(f"  댓글 분석 결과 저장소: {'사용' if cls.COMMENT_STORE_ENABLED else '미사용'}")
         print(f"  YouTube API: {'설정됨' if cls.YOUTUBE_API_KEY else '❌ 미설정'}")
         print(f"  OpenAI API: {'설정됨' if cls.OPENAI_API_KEY else '❌ 미설정'}")
         print("="*50 + "\n")
@@ -0,0 +1,5 @@
+from .lru_cache import LRUCache
+from .token_cache import TokenProbabilityCache, compute_model_fingerprint
+from .verdict_cache import VerdictCache, make_verdict_key
+from .pos_cache import PosCache
+from .response_cache import ApiResponseCache, make_response_key
@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    스레드 안전한 LRU(Least Recently Used) 캐시.
+    최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거하며,
+    적중/미스/제거 횟수를 함께 기록합니다.
+    sizeof(key, value)가 주어지면 항목별 추정 메모리를 합산하고, max_bytes를 넘을 때도 제거합니다.
+    """
+
+    def __init__(self, max_size: int, max_bytes: int = 0, sizeof=None):
+        self.max_size = max(0, max_size)
+        self.max_bytes = max(0, max_bytes)
+        self._sizeof = sizeof
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.memory_bytes = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        if self.max_size == 0:
+            return
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            self._data[key] = value
+
+            if self._sizeof is not None:
+                self.memory_bytes -= self._sizes.get(key, 0)
+                self._sizes[key] = self._sizeof(key, value)
+                self.memory_bytes += self._sizes[key]
+
+            while len(self._data) > self.max_size or (
+                self.max_bytes and self.memory_bytes > self.max_bytes and len(self._data) > 1
+            ):
+                old_key, _ = self._data.popitem(last=False)
+                self.memory_bytes -= self._sizes.pop(old_key, 0)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.memory_bytes = 0
+
+    def items(self) -> list:
+        """오래된 항목부터 최근 항목 순으로 (key, value) 리스트를 반환합니다."""
+        with self._lock:
+            return list(self._data.items())
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+            if self._sizeof is not None:
+                stats["memory_bytes"] = self.memory_bytes
+                stats["max_bytes"] = self.max_bytes
+            return stats
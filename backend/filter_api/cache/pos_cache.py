@@ -0,0 +1,99 @@
+import sys
+import threading
+
+from .lru_cache import LRUCache
+
+
+def estimate_pos_bytes(key: str, tokens: tuple) -> int:
+    """캐시 항목 하나가 차지하는 메모리를 추정합니다. (키 문자열 + 토큰 튜플, 품사 문자열은 공유되므로 제외)"""
+    size = sys.getsizeof(key) + sys.getsizeof(tokens)
+    for token in tokens:
+        size += sys.getsizeof(token) + sys.getsizeof(token[0])
+    return size
+
+
+class PosCache:
+    """
+    형태소 분석 결과 캐시.
+    1) 정규화된 전체 텍스트 → 토큰 튜플 (중복 댓글, 복사-붙여넣기 스팸)
+    2) 어절(공백 단위) → 토큰 튜플 (ㅋㅋㅋㅋ, 1빠 등 자주 나오는 어절)
+    전체 텍스트가 미스이면 캐시에 없는 어절만 모아 한 번에 분석하고, 결과를 어절별로 나눠 저장합니다.
+    """
+
+    def __init__(self, analyze, text_size: int, phrase_size: int, max_bytes: int = 0):
+        self._analyze = analyze
+        self._texts = LRUCache(text_size, max_bytes // 2 if max_bytes else 0, estimate_pos_bytes)
+        self._phrases = LRUCache(phrase_size, max_bytes // 2 if max_bytes else 0, estimate_pos_bytes)
+        self._lock = threading.Lock()
+        self.analyzed_chunks = 0
+
+    def clear(self):
+        """분절 규칙(사전)이 바뀌면 기존 결과를 모두 버립니다."""
+        self._texts.clear()
+        self._phrases.clear()
+
+    def pos(self, text: str) -> list:
+        cached = self._texts.get(text)
+        if cached is not None:
+            return list(cached)
+
+        tokens = self._analyze_by_phrase(text) if self._phrases.max_size else self._analyze(text)
+        self._texts.put(text, tuple(tokens))
+        return list(tokens)
+
+    def _analyze_by_phrase(self, text: str) -> list:
+        chunks = text.split()
+        found = {}
+        missing = []
+        for chunk in dict.fromkeys(chunks):
+            cached = self._phrases.get(chunk)
+            if cached is None:
+                missing.append(chunk)
+            else:
+                found[chunk] = cached
+
+        if missing:
+            analyzed = self._split_by_chunk(missing, self._analyze(" ".join(missing)))
+            if analyzed is None:
+                # 토큰을 어절에 대응시키지 못하면 어절 캐시 없이 전체를 분석
+                return self._analyze(text)
+            for chunk, chunk_tokens in analyzed.items():
+                self._phrases.put(chunk, chunk_tokens)
+            found.update(analyzed)
+            with self._lock:
+                self.analyzed_chunks += len(missing)
+
+        tokens = []
+        for chunk in chunks:
+            tokens.extend(found[chunk])
+        return tokens
+
+    @staticmethod
+    def _split_by_chunk(chunks: list, tokens: list):
+        """공백으로 이어 붙인 어절들의 분석 결과를 어절별 토큰 튜플로 나눕니다."""
+        result = {chunk: [] for chunk in chunks}
+        chunk_idx = 0
+        offset = 0
+        for token in tokens:
+            word = token[0]
+            while chunk_idx < len(chunks):
+                pos = chunks[chunk_idx].find(word, offset)
+                if pos >= 0:
+                    result[chunks[chunk_idx]].append(tuple(token))
+                    offset = pos + len(word)
+                    break
+                chunk_idx += 1
+                offset = 0
+            else:
+                return None
+        return {chunk: tuple(chunk_tokens) for chunk, chunk_tokens in result.items()}
+
+    def get_stats(self) -> dict:
+        text_stats = self._texts.get_stats()
+        phrase_stats = self._phrases.get_stats()
+        return {
+            "text": text_stats,
+            "phrase": phrase_stats,
+            "analyzed_chunks": self.analyzed_chunks,
+            "memory_bytes": text_stats["memory_bytes"] + phrase_stats["memory_bytes"],
+        }
@@ -0,0 +1,143 @@
+import datetime
+import json
+import os
+import sys
+import sqlite3
+import threading
+import time
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except Exception:
+    QUOTA_TIMEZONE = datetime.timezone.utc
+
+
+def make_response_key(resource: str, params: dict) -> str:
+    """API 리소스와 요청 파라미터(API 키 제외)로 캐시 키를 만듭니다."""
+    params = {name: value for name, value in params.items() if name != "key"}
+    return f"{resource}?{json.dumps(params, ensure_ascii=False, sort_keys=True, default=str)}"
+
+
+def quota_day() -> str:
+    """YouTube Data API 일일 쿼터 기준 날짜 (태평양 시간 자정에 초기화)"""
+    return datetime.datetime.now(QUOTA_TIMEZONE).strftime("%Y-%m-%d")
+
+
+class ApiResponseCache:
+    """
+    SQLite 기반 외부 API 응답 캐시와 일일 쿼터 사용량 기록.
+    - responses: 요청별 원본 응답(JSON), ETag, 받은 시각. 유효 시간(TTL) 판단은 호출 측이 리소스별로 합니다.
+    - quota: 날짜별 사용한 쿼터 단위. 서버를 재시작해도 유지됩니다.
+    최대 개수를 넘으면 가장 오래전에 받은 응답부터 제거합니다.
+    """
+
+    def __init__(self, path: str, max_entries: int = 20000):
+        self.path = path
+        self.max_entries = max(1, max_entries)
+
+        self.evictions = 0
+        self._size = 0   # 저장된 응답 수 (삽입마다 COUNT(*)를 하지 않도록 직접 관리)
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                resource TEXT NOT NULL,
+                etag TEXT,
+                body TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_fetched_at ON responses(fetched_at)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS quota (day TEXT PRIMARY KEY, used INTEGER NOT NULL)")
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str):
+        """저장된 응답을 {"etag", "body", "fetched_at"}로 반환합니다. 없으면 None을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT etag, body, fetched_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        etag, body, fetched_at = row
+        try:
+            return {"etag": etag, "body": json.loads(body), "fetched_at": fetched_at}
+        except ValueError:
+            return None
+
+    def put(self, key: str, resource: str, etag: str, body: dict):
+        """응답을 저장하고, 최대 개수를 넘은 만큼 오래된 응답을 제거합니다."""
+        try:
+            data = json.dumps(body, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            print(f"[Error] API 응답 캐시 직렬화 실패: {e}", file=sys.stderr)
+            return
+
+        with self._lock:
+            exists = self._conn.execute("SELECT 1 FROM responses WHERE key = ?", (key,)).fetchone() is not None
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, resource, etag, body, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (key, resource, etag, data, time.time()),
+            )
+            if not exists:
+                self._size += 1
+            overflow = self._size - self.max_entries
+            if overflow > 0:
+                removed = self._conn.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY fetched_at ASC LIMIT ?)",
+                    (overflow,),
+                ).rowcount
+                self._size -= removed
+                self.evictions += removed
+            self._conn.commit()
+
+    def touch(self, key: str):
+        """재검증(304)에 성공한 응답의 받은 시각을 갱신합니다."""
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+
+    def charge(self, units: int):
+        """오늘 사용한 쿼터에 units를 더합니다."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO quota (day, used) VALUES (?, ?) ON CONFLICT(day) DO UPDATE SET used = used + excluded.used",
+                (quota_day(), units),
+            )
+            self._conn.commit()
+
+    def quota_used(self) -> int:
+        """오늘 사용한 쿼터 단위"""
+        with self._lock:
+            row = self._conn.execute("SELECT used FROM quota WHERE day = ?", (quota_day(),)).fetchone()
+        return row[0] if row else 0
+
+    def clear(self) -> int:
+        """모든 응답을 삭제하고 삭제된 개수를 반환합니다. (쿼터 기록은 유지)"""
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM responses").rowcount
+            self._conn.commit()
+            self._size = 0
+        return removed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> dict:
+        return {
+            "size": self._size,
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "quota_day": quota_day(),
+            "quota_used": self.quota_used(),
+        }
@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+
+from .lru_cache import LRUCache
+
+
+def compute_model_fingerprint(model_dir: str, extra_files=()) -> str:
+    """
+    모델 디렉토리의 파일 구성(이름, 크기, 수정 시각)과 config.json 내용으로 모델 식별자를 만듭니다.
+    extra_files에는 디렉토리 밖에 있는 모델 파일(예: BASIC_ONNX_PATH)을 넘기며, 경로/크기/수정 시각이 함께 반영됩니다.
+    가중치 파일 전체를 해싱하지 않으므로 서버 시작 시 부담이 없습니다.
+    """
+    if not model_dir or not os.path.isdir(model_dir):
+        return ""
+
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(model_dir)):
+        path = os.path.join(model_dir, name)
+        if not os.path.isfile(path):
+            continue
+        stat = os.stat(path)
+        digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns};".encode("utf-8"))
+
+    for path in extra_files:
+        path = os.path.abspath(path)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns};".encode("utf-8"))
+
+    config_path = os.path.join(model_dir, "config.json")
+    if os.path.isfile(config_path):
+        with open(config_path, "rb") as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()[:16]
+
+
+class TokenProbabilityCache:
+    """
+    Basic 모듈의 단어별 악성 확률 캐시.
+    모델 식별자(fingerprint)가 바뀌면 기존 항목을 모두 무효화하며,
+    선택적으로 디스크에 저장해 서버 재시작 후에도 재사용할 수 있습니다.
+    """
+
+    def __init__(self, max_size: int, persist_path: str = None):
+        self.persist_path = persist_path
+        self.model_id = ""
+        self._cache = LRUCache(max_size)
+        self._lock = threading.Lock()
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def set_model(self, model_id: str):
+        """모델 식별자를 설정합니다. 이전과 다르면 캐시를 비웁니다."""
+        with self._lock:
+            if model_id == self.model_id:
+                return
+            if len(self._cache) > 0:
+                self.invalidations += 1
+            self._cache.clear()
+            self.model_id = model_id
+
+    def lookup(self, tokens: list):
+        """
+        캐시를 조회하여 (적중한 {단어: 확률}, 미스 단어 리스트)를 반환합니다.
+        미스 단어 리스트는 중복 없이 입력 순서를 유지합니다.
+        """
+        found = {}
+        missing = []
+        for token in dict.fromkeys(tokens):
+            prob = self._cache.get(token)
+            if prob is None:
+                missing.append(token)
+            else:
+                found[token] = prob
+        return found, missing
+
+    def store(self, probs_by_token: dict, model_id: str = None):
+        """계산된 확률을 저장합니다. 계산 도중 모델이 바뀐 경우 저장하지 않습니다."""
+        if model_id is not None and model_id != self.model_id:
+            return
+        for token, prob in probs_by_token.items():
+            self._cache.put(token, prob)
+
+    def save(self) -> bool:
+        """캐시 내용을 파일에 저장합니다. (LRU 순서 유지)"""
+        if not self.persist_path:
+            return False
+        try:
+            data = {
+                "model_id": self.model_id,
+                "entries": self._cache.items(),
+            }
+            tmp_path = self.persist_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.persist_path)
+            return True
+        except Exception as e:
+            print(f"[Error] 토큰 캐시 저장 실패: {e}", file=sys.stderr)
+            return False
+
+    def load(self) -> int:
+        """저장된 캐시를 불러옵니다. 모델 식별자가 다르면 불러오지 않습니다."""
+        if not self.persist_path or not os.path.isfile(self.persist_path):
+            return 0
+        try:
+            with open(self.persist_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get("model_id") != self.model_id:
+                print("  ㄴ 토큰 캐시: 모델이 변경되어 저장된 캐시를 무시합니다.")
+                return 0
+
+            entries = data.get("entries", [])
+            for token, prob in entries:
+                self._cache.put(token, float(prob))
+            return len(entries)
+        except Exception as e:
+            print(f"[Error] 토큰 캐시 로드 실패: {e}", file=sys.stderr)
+            return 0
+
+    def get_stats(self) -> dict:
+        stats = self._cache.get_stats()
+        stats["model_id"] = self.model_id
+        stats["invalidations"] = self.invalidations
+        return stats
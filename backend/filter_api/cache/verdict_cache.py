@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+
+def make_verdict_key(text: str, basic_rules: list, special_modules: dict, model: str) -> str:
+    """
+    LLM 프롬프트 입력(마스킹된 텍스트, 기본 검사 규칙, 활성 특수 모듈, 모델명)으로 캐시 키를 만듭니다.
+    """
+    payload = json.dumps(
+        {
+            "text": text,
+            "basic": list(basic_rules),
+            "special": sorted(special_modules.items()),
+            "model": model,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    """
+    SQLite 기반 LLM 판정 결과 캐시.
+    TTL이 지난 항목은 조회 시 버리고, 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    적중할 때마다 디스크에 쓰지 않도록 마지막 사용 시각은 메모리에 모았다가
+    access_flush_size개가 쌓이거나 제거 대상을 고르기 직전, 닫을 때 한 번에 기록합니다.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 7 * 24 * 3600, max_entries: int = 100000, access_flush_size: int = 256):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.access_flush_size = max(1, access_flush_size)
+
+        self._size = 0              # 저장된 항목 수 (삽입마다 COUNT(*)를 하지 않도록 직접 관리)
+        self._pending_access = {}   # 아직 기록하지 않은 마지막 사용 시각 {키: 시각}
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS verdicts (
+                key TEXT PRIMARY KEY,
+                verdict TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_verdicts_last_access ON verdicts(last_access)")
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def _flush_access(self):
+        """(잠금 안에서 호출) 모아 둔 마지막 사용 시각을 기록합니다. 커밋은 호출 측이 합니다."""
+        if not self._pending_access:
+            return
+        self._conn.executemany(
+            "UPDATE verdicts SET last_access = ? WHERE key = ?",
+            [(accessed, key) for key, accessed in self._pending_access.items()],
+        )
+        self._pending_access.clear()
+
+    def get(self, key: str):
+        """캐시된 판정 결과(dict)를 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT verdict, created_at FROM verdicts WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            verdict, created_at = row
+            if self.ttl_seconds > 0 and now - created_at > self.ttl_seconds:
+                self._size -= self._conn.execute("DELETE FROM verdicts WHERE key = ?", (key,)).rowcount
+                self._pending_access.pop(key, None)
+                self._conn.commit()
+                self.expired += 1
+                self.misses += 1
+                return None
+
+            self._pending_access[key] = now
+            if len(self._pending_access) >= self.access_flush_size:
+                self._flush_access()
+                self._conn.commit()
+            self.hits += 1
+
+        try:
+            return json.loads(verdict)
+        except ValueError:
+            return None
+
+    def put(self, key: str, verdict: dict):
+        """판정 결과를 저장하고, 최대 개수를 넘은 만큼 오래된 항목을 제거합니다."""
+        now = time.time()
+        try:
+            data = json.dumps(verdict, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            print(f"[Error] LLM 캐시 직렬화 실패: {e}", file=sys.stderr)
+            return
+
+        with self._lock:
+            exists = self._conn.execute("SELECT 1 FROM verdicts WHERE key = ?", (key,)).fetchone() is not None
+            self._conn.execute(
+                "INSERT OR REPLACE INTO verdicts (key, verdict, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, data, now, now),
+            )
+            self._pending_access.pop(key, None)
+            if not exists:
+                self._size += 1
+            overflow = self._size - self.max_entries
+            if overflow > 0:
+                # 최근 사용 기록을 반영한 뒤 제거 대상을 고름
+                self._flush_access()
+                removed = self._conn.execute(
+                    "DELETE FROM verdicts WHERE key IN (SELECT key FROM verdicts ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,),
+                ).rowcount
+                self._size -= removed
+                self.evictions += removed
+            self._conn.commit()
+
+    def clear(self) -> int:
+        """모든 항목을 삭제하고 삭제된 개수를 반환합니다."""
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM verdicts").rowcount
+            self._conn.commit()
+            self._pending_access.clear()
+            self._size = 0
+        return removed
+
+    def purge_expired(self) -> int:
+        """TTL이 지난 항목을 일괄 삭제합니다."""
+        if self.ttl_seconds <= 0:
+            return 0
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM verdicts WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            ).rowcount
+            self._conn.commit()
+            self._size -= removed
+            self.expired += removed
+        return removed
+
+    def close(self):
+        with self._lock:
+            self._flush_access()
+            self._conn.commit()
+            self._conn.close()
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": self._size,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -1,7 +1,12 @@
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+import httpx
+import asyncio
+import functools
+import time
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # config.py를 찾기 위한 경로 설정
 current_dir = os.path.dirname(__file__)
@@ -10,16 +15,66 @@ sys.path.append(backend_dir)
 
 try:
     from config import config
+    from filter_api.cache import ApiResponseCache, make_response_key
 except ImportError:
     print("Error: config.py를 찾을 수 없습니다.", file=sys.stderr)
     print(f"Current Path: {sys.path}", file=sys.stderr)
     sys.exit(1)
-    
+
+# list 요청 1회당 쿼터 비용 (단위)
+QUOTA_COSTS = {"videos": 1, "commentThreads": 1, "comments": 1}
+
+
+class QuotaExceededError(Exception):
+    """일일 쿼터를 모두 사용했고 캐시된 응답도 없는 요청"""
+
+    def __init__(self, resource: str):
+        super().__init__(f"YouTube API 일일 쿼터를 모두 사용했습니다. ({resource} 요청 생략)")
+        self.resource = resource
+
+
 class YouTubeClient:
     def __init__(self):
         print("[System] YouTube Client 초기화 중...")
         self.youtube = self._build_service()
 
+        # 비동기 수집 경로: 요청마다 googleapiclient 요청 객체를 만드는 대신 공유 커넥션 풀로 REST API를 직접 호출
+        self.api_base_url = config.YOUTUBE_API_BASE_URL.rstrip("/")
+        self.prefetch_pages = max(1, config.YOUTUBE_PREFETCH_PAGES)
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max(1, config.YOUTUBE_MAX_CONNECTIONS),
+                max_keepalive_connections=max(1, config.YOUTUBE_MAX_CONNECTIONS),
+            ),
+            timeout=httpx.Timeout(config.YOUTUBE_HTTP_TIMEOUT),
+        )
+
+        # 답글 수집: 동시 요청 수와 분석 1회당 쿼터 예산 제한
+        self.fetch_replies = config.YOUTUBE_FETCH_REPLIES
+        self.reply_concurrency = max(1, config.YOUTUBE_REPLY_CONCURRENCY)
+        self.reply_budget = max(0, config.YOUTUBE_REPLY_BUDGET)
+        self._reply_semaphore = None
+
+        self._stats = {
+            "requests": 0, "failed": 0, "pages": 0, "total_fetch_ms": 0.0,
+            "cache_hits": 0, "revalidated": 0, "stale_served": 0,
+            "reply_requests": 0, "replies": 0, "reply_threads_truncated": 0,
+        }
+
+        # 디스크 응답 캐시 (ETag 재검증) 및 일일 쿼터 사용량 기록
+        self.response_cache = None
+        if config.YOUTUBE_CACHE_ENABLED:
+            self.response_cache = ApiResponseCache(config.YOUTUBE_CACHE_PATH, config.YOUTUBE_CACHE_MAX_ENTRIES)
+        # 비동기 경로의 SQLite 조회/기록은 이벤트 루프를 막지 않도록 전용 스레드에서 실행 (연결은 어차피 잠금으로 직렬화됨)
+        self._cache_executor = None
+        if self.response_cache is not None:
+            self._cache_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="youtube-cache")
+        self.cache_ttls = {
+            "videos": config.YOUTUBE_CACHE_TTL_VIDEOS,
+            "commentThreads": config.YOUTUBE_CACHE_TTL_COMMENTS,
+            "comments": config.YOUTUBE_CACHE_TTL_COMMENTS,
+        }
+
     def _build_service(self):
         """(내부 메서드) YouTube API 서비스 연결"""
         api_key = config.YOUTUBE_API_KEY
@@ -42,31 +97,12 @@ class YouTubeClient:
             return None
 
         try:
-            request = self.youtube.videos().list(
-                part="snippet,topicDetails",
-                id=video_id
+            response = self._execute(
+                "videos",
+                {"part": "snippet,topicDetails", "id": video_id},
+                self.youtube.videos().list
             )
-            response = request.execute()
-
-            if not response.get('items'):
-                print(f"Error: 비디오 ID {video_id}를 찾을 수 없습니다.", file=sys.stderr)
-                return None
-
-            item = response['items'][0]
-            snippet = item.get('snippet', {})
-            topic_details = item.get('topicDetails', {})
-
-            return {
-                "snippet": {
-                    "title": snippet.get("title"),
-                    "description": snippet.get("description"),
-                    "tags": snippet.get("tags", []),
-                    "categoryId": snippet.get("categoryId"),
-                },
-                "topicDetails": {
-                    "topicCategories": topic_details.get("topicCategories", [])
-                }
-            }
+            return self._parse_video_details(video_id, response)
 
         except HttpError as e:
             print(f"YouTube API Error: {e}", file=sys.stderr)
@@ -75,47 +111,334 @@ class YouTubeClient:
             print(f"Unknown Error: {e}", file=sys.stderr)
             return None
 
+    @staticmethod
+    def _parse_video_details(video_id, response):
+        if not response.get('items'):
+            print(f"Error: 비디오 ID {video_id}를 찾을 수 없습니다.", file=sys.stderr)
+            return None
+
+        item = response['items'][0]
+        snippet = item.get('snippet', {})
+        topic_details = item.get('topicDetails', {})
+
+        return {
+            "snippet": {
+                "title": snippet.get("title"),
+                "description": snippet.get("description"),
+                "tags": snippet.get("tags", []),
+                "categoryId": snippet.get("categoryId"),
+            },
+            "topicDetails": {
+                "topicCategories": topic_details.get("topicCategories", [])
+            }
+        }
+
     def get_comments(self, video_id, max_pages=1):
         """댓글 데이터 수집"""
+        comments_list = []
+        for page in self.iter_comment_pages(video_id, max_pages=max_pages):
+            comments_list.extend(page)
+        return comments_list
+
+    @staticmethod
+    def _parse_comment(item):
+        snippet = item['snippet']['topLevelComment']['snippet']
+        return {
+            "comment_id": item['id'],
+            "parent_id": None,
+            "text_original": snippet['textOriginal'],
+            "author_display_name": snippet.get('authorDisplayName'),
+            "published_at": snippet['publishedAt'],
+            "reply_count": item['snippet'].get('totalReplyCount', 0),
+        }
+
+    @staticmethod
+    def _parse_reply(item, parent_id):
+        snippet = item['snippet']
+        return {
+            "comment_id": item['id'],
+            "parent_id": snippet.get('parentId', parent_id),
+            "text_original": snippet['textOriginal'],
+            "author_display_name": snippet.get('authorDisplayName'),
+            "published_at": snippet['publishedAt'],
+            "reply_count": 0,
+        }
+
+    def iter_comment_pages(self, video_id, max_pages=1):
+        """
+        댓글을 페이지(최대 100개) 단위로 하나씩 수집하여 반환하는 제너레이터.
+        호출 측은 페이지가 도착하는 대로 처리할 수 있어 전체 댓글을 메모리에 모아 둘 필요가 없습니다.
+        API 오류가 나면 로그를 남기고 수집을 멈춥니다.
+        """
         if not self.youtube:
-            return []
+            return
 
-        comments_list = []
         try:
-            request = self.youtube.commentThreads().list(
-                part="snippet",
-                videoId=video_id,
-                maxResults=100,
-                order="relevance"
-            )
-            
-            page_count = 0
-            while request and page_count < max_pages:
-                response = request.execute()
-                
-                for item in response['items']:
-                    snippet = item['snippet']['topLevelComment']['snippet']
-                    comments_list.append({
-                        "comment_id": item['id'],
-                        "text_original": snippet['textOriginal'],
-                        "author_display_name": snippet.get('authorDisplayName'),
-                        "published_at": snippet['publishedAt'],
-                    })
-                
-                if 'nextPageToken' in response:
-                    request = self.youtube.commentThreads().list_next(
-                        previous_request=request, 
-                        previous_response=response
-                    )
-                    page_count += 1
-                else:
+            params = {"part": "snippet", "videoId": video_id, "maxResults": 100, "order": "relevance"}
+
+            for _ in range(max_pages):
+                response = self._execute("commentThreads", params, self.youtube.commentThreads().list)
+                yield [self._parse_comment(item) for item in response['items']]
+
+                if 'nextPageToken' not in response:
                     break
+                params = dict(params, pageToken=response['nextPageToken'])
+
+        except HttpError as e:
+            print(f"YouTube API Error: {e}", file=sys.stderr)
+        except Exception as e:
+            print(f"Unknown Error: {e}", file=sys.stderr)
+
+    # ---------------------------------------------------------
+    # 응답 캐시 (ETag 재검증 + 쿼터 기반 캐시 우선 사용)
+    # ---------------------------------------------------------
+
+    def _cached_response(self, resource, params):
+        """
+        (내부 메서드) 요청 전에 캐시를 확인합니다. 반환값: (캐시 키, 저장된 응답, 바로 사용할 응답 본문)
+        - 리소스별 유효 시간 안에 받은 응답은 요청 없이 사용
+        - 남은 쿼터가 예비분(YOUTUBE_QUOTA_RESERVE) 이하이면 만료된 응답이라도 요청 없이 사용
+        - 쿼터를 모두 썼는데 저장된 응답도 없으면 QuotaExceededError
+        그 밖에는 저장된 ETag로 조건부 요청을 보냅니다.
+        """
+        if self.response_cache is None:
+            return None, None, None
+
+        key = make_response_key(resource, params)
+        entry = self.response_cache.get(key)
+        remaining = config.YOUTUBE_DAILY_QUOTA - self.response_cache.quota_used()
+
+        if entry is not None:
+            if time.time() - entry["fetched_at"] < self.cache_ttls.get(resource, 0):
+                self._stats["cache_hits"] += 1
+                return key, entry, entry["body"]
+            if remaining <= config.YOUTUBE_DAILY_QUOTA * config.YOUTUBE_QUOTA_RESERVE:
+                self._stats["stale_served"] += 1
+                return key, entry, entry["body"]
+        elif remaining < QUOTA_COSTS.get(resource, 1):
+            raise QuotaExceededError(resource)
+
+        return key, entry, None
+
+    def _store_response(self, resource, key, entry, body, etag=None):
+        """
+        (내부 메서드) 응답을 받은 뒤 쿼터 사용량을 기록하고 캐시를 갱신합니다.
+        body가 None이면 304(변경 없음)로 보고 저장된 응답 본문을 반환합니다.
+        """
+        if self.response_cache is None:
+            return body
 
-            return comments_list
+        # 조건부 요청(304)도 쿼터를 소모하는 것으로 계산
+        self.response_cache.charge(QUOTA_COSTS.get(resource, 1))
+        if body is None:
+            self._stats["revalidated"] += 1
+            self.response_cache.touch(key)
+            return entry["body"]
 
+        self.response_cache.put(key, resource, body.get("etag") or etag, body)
+        return body
+
+    async def _arun_cache(self, func, *args):
+        """(내부 메서드) 응답 캐시 작업(_cached_response, _store_response)을 캐시 전용 스레드에서 실행합니다."""
+        if self._cache_executor is None:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cache_executor, functools.partial(func, *args))
+
+    def _execute(self, resource, params, list_method):
+        """(내부 메서드) googleapiclient 요청을 응답 캐시와 ETag 재검증을 거쳐 실행합니다."""
+        key, entry, cached = self._cached_response(resource, params)
+        if cached is not None:
+            return cached
+
+        request = list_method(**params)
+        if entry is not None and entry["etag"]:
+            request.headers["If-None-Match"] = entry["etag"]
+
+        self._stats["requests"] += 1
+        try:
+            body = request.execute()
         except HttpError as e:
+            if e.resp.status == 304 and entry is not None:
+                return self._store_response(resource, key, entry, None)
+            self._stats["failed"] += 1
+            raise
+        return self._store_response(resource, key, entry, body)
+
+    # ---------------------------------------------------------
+    # 비동기 수집 (공유 커넥션 풀 + 다음 페이지 미리 받기)
+    # ---------------------------------------------------------
+
+    async def _aget(self, resource, params):
+        """YouTube Data API GET 요청 (공유 커넥션 풀, 응답 캐시 및 ETag 재검증 사용)"""
+        key, entry, cached = await self._arun_cache(self._cached_response, resource, params)
+        if cached is not None:
+            return cached
+
+        headers = {"If-None-Match": entry["etag"]} if entry is not None and entry["etag"] else {}
+        started = time.perf_counter()
+        self._stats["requests"] += 1
+        try:
+            response = await self._http.get(
+                f"{self.api_base_url}/{resource}",
+                params=dict(params, key=config.YOUTUBE_API_KEY),
+                headers=headers,
+            )
+            if response.status_code == 304 and entry is not None:
+                return await self._arun_cache(self._store_response, resource, key, entry, None)
+            response.raise_for_status()
+            return await self._arun_cache(self._store_response, resource, key, entry, response.json(), response.headers.get("ETag"))
+        except Exception:
+            self._stats["failed"] += 1
+            raise
+        finally:
+            self._stats["total_fetch_ms"] += (time.perf_counter() - started) * 1000
+
+    async def aget_video_details(self, video_id):
+        """영상 메타데이터 수집 (비동기)"""
+        if not self.youtube:
+            return None
+
+        try:
+            response = await self._aget("videos", {"part": "snippet,topicDetails", "id": video_id})
+            return self._parse_video_details(video_id, response)
+        except httpx.HTTPError as e:
             print(f"YouTube API Error: {e}", file=sys.stderr)
-            return []
+            return None
         except Exception as e:
             print(f"Unknown Error: {e}", file=sys.stderr)
-            return []
\ No newline at end of file
+            return None
+
+    async def _afetch_pages(self, video_id, max_pages, order="relevance", include_replies=False, reply_budget=0):
+        """(내부 메서드) 댓글 페이지를 순서대로 요청하는 비동기 제너레이터"""
+        # 스레드 응답에 포함되는 답글(최대 몇 개)을 같은 비용으로 함께 받음
+        part = "snippet,replies" if include_replies else "snippet"
+        params = {"part": part, "videoId": video_id, "maxResults": 100, "order": order}
+        budget = {"remaining": reply_budget}
+        for _ in range(max_pages):
+            response = await self._aget("commentThreads", params)
+            self._stats["pages"] += 1
+            items = response.get('items', [])
+            if include_replies:
+                yield await self._expand_replies(items, budget)
+            else:
+                yield [self._parse_comment(item) for item in items]
+
+            if 'nextPageToken' not in response:
+                break
+            params["pageToken"] = response['nextPageToken']
+
+    async def _expand_replies(self, items, budget):
+        """
+        (내부 메서드) 스레드 목록을 '최상위 댓글, 그 답글들' 순서의 댓글 목록으로 펼칩니다.
+        스레드 응답에 포함된 답글이 totalReplyCount보다 적은 스레드만 comments.list(parentId)로 답글을 동시에 받습니다.
+        예산(budget["remaining"], 요청 1건당 1단위)이 떨어지면 남은 스레드는 포함된 답글만 사용합니다.
+        """
+        threads = []
+        for item in items:
+            comment = self._parse_comment(item)
+            inline = [self._parse_reply(reply, comment['comment_id']) for reply in item.get('replies', {}).get('comments', [])]
+            threads.append((comment, inline))
+
+        pending = [(index, comment) for index, (comment, inline) in enumerate(threads) if comment['reply_count'] > len(inline)]
+        fetched = await asyncio.gather(*(self._afetch_replies(comment['comment_id'], budget) for _, comment in pending))
+
+        for (index, comment), replies in zip(pending, fetched):
+            if replies is not None:
+                threads[index] = (comment, replies)
+            else:
+                self._stats["reply_threads_truncated"] += 1
+
+        page = []
+        for comment, replies in threads:
+            page.append(comment)
+            page.extend(replies)
+            self._stats["replies"] += len(replies)
+        return page
+
+    async def _afetch_replies(self, parent_id, budget):
+        """(내부 메서드) 스레드 하나의 답글 전체를 받습니다. 예산이 모자라거나 오류가 나면 None을 반환합니다."""
+        if self._reply_semaphore is None:
+            self._reply_semaphore = asyncio.Semaphore(self.reply_concurrency)
+
+        params = {"part": "snippet", "parentId": parent_id, "maxResults": 100, "textFormat": "plainText"}
+        replies = []
+        async with self._reply_semaphore:
+            try:
+                while True:
+                    if budget["remaining"] < QUOTA_COSTS["comments"]:
+                        return None
+                    budget["remaining"] -= QUOTA_COSTS["comments"]
+                    self._stats["reply_requests"] += 1
+
+                    response = await self._aget("comments", params)
+                    replies.extend(self._parse_reply(item, parent_id) for item in response.get('items', []))
+                    if 'nextPageToken' not in response:
+                        return replies
+                    params = dict(params, pageToken=response['nextPageToken'])
+            except httpx.HTTPError as e:
+                print(f"YouTube API Error (답글 {parent_id}): {e}", file=sys.stderr)
+                return None
+            except QuotaExceededError:
+                return None
+
+    async def aiter_comment_pages(self, video_id, max_pages=1, prefetch=None, order="relevance", include_replies=None, reply_budget=None):
+        """
+        댓글을 페이지 단위로 반환하는 비동기 제너레이터.
+        백그라운드 작업이 최대 prefetch 페이지를 미리 받아 두므로, 호출 측이 N번째 페이지를 분석하는 동안
+        N+1번째 페이지 요청이 진행됩니다. API 오류가 나면 로그를 남기고 수집을 멈춥니다.
+        order="time"이면 최신 댓글부터 반환합니다. (증분 분석용)
+        include_replies(기본: YOUTUBE_FETCH_REPLIES)이면 각 최상위 댓글 바로 뒤에 답글(parent_id 설정)이 이어지며,
+        답글 요청은 이 호출 전체에서 reply_budget(기본: YOUTUBE_REPLY_BUDGET) 단위까지만 사용합니다.
+        """
+        if not self.youtube:
+            return
+
+        include_replies = self.fetch_replies if include_replies is None else include_replies
+        reply_budget = self.reply_budget if reply_budget is None else reply_budget
+        queue = asyncio.Queue(maxsize=max(1, prefetch or self.prefetch_pages))
+        end = object()
+
+        async def produce():
+            try:
+                async for page in self._afetch_pages(video_id, max_pages, order, include_replies, reply_budget):
+                    await queue.put(page)
+            except httpx.HTTPError as e:
+                print(f"YouTube API Error: {e}", file=sys.stderr)
+            except Exception as e:
+                print(f"Unknown Error: {e}", file=sys.stderr)
+            await queue.put(end)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                page = await queue.get()
+                if page is end:
+                    break
+                yield page
+        finally:
+            # 호출 측이 중간에 멈추면(연결 종료 등) 미리 받기도 중단
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+    async def aclose(self):
+        await self._http.aclose()
+        if self._cache_executor is not None:
+            # 남은 캐시 기록을 마친 뒤 연결을 닫음
+            self._cache_executor.shutdown(wait=True)
+        if self.response_cache is not None:
+            self.response_cache.close()
+
+    def get_stats(self) -> dict:
+        stats = dict(self._stats)
+        requests = stats["requests"]
+        stats["avg_fetch_ms"] = round(stats.pop("total_fetch_ms") / requests, 3) if requests else 0.0
+        stats["prefetch_pages"] = self.prefetch_pages
+        stats["reply_concurrency"] = self.reply_concurrency
+        stats["reply_budget"] = self.reply_budget if self.fetch_replies else 0
+        stats["daily_quota"] = config.YOUTUBE_DAILY_QUOTA
+        stats["response_cache"] = self.response_cache.get_stats() if self.response_cache is not None else None
+        return stats
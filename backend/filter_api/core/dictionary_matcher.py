@@ -0,0 +1,170 @@
+import threading
+from collections import deque
+
+
+class AhoCorasickMatcher:
+    """
+    여러 사전 단어를 한 번의 선형 탐색으로 찾는 Aho-Corasick 자동자.
+    각 패턴은 우선순위(priority)별로 등록되며, 같은 단어가 여러 사전에 있어도 각각 관리됩니다.
+    패턴 추가 시 실패 링크만 다시 계산하고(트라이는 유지), 삭제 시에는 출력만 제거합니다.
+    탐색 중인 자동자를 고치지 않도록, 사용 중인 자동자를 바꿀 때는 copy()로 사본을 고친 뒤 참조를 교체합니다.
+    """
+
+    def __init__(self):
+        self._goto = [{}]      # 노드별 전이 {문자: 다음 노드}
+        self._fail = [0]       # 노드별 실패 링크
+        self._depth = [0]      # 노드별 깊이 (= 패턴 길이)
+        self._output = [None]  # 노드별 출력 {우선순위: payload}
+        self._out_link = [-1]  # 실패 링크를 따라가며 만나는 가장 가까운 출력 노드
+        self._dirty = False
+        self._build_lock = threading.Lock()
+        self.pattern_count = 0
+
+    def copy(self) -> "AhoCorasickMatcher":
+        """다른 스레드가 탐색 중이어도 안전하게 고칠 수 있는 사본을 반환합니다."""
+        clone = AhoCorasickMatcher()
+        clone._goto = [dict(edges) for edges in self._goto]
+        clone._fail = list(self._fail)
+        clone._depth = list(self._depth)
+        clone._output = [dict(outputs) if outputs is not None else None for outputs in self._output]
+        clone._out_link = list(self._out_link)
+        clone._dirty = self._dirty
+        clone.pattern_count = self.pattern_count
+        return clone
+
+    def add(self, pattern: str, priority: int, payload=None) -> bool:
+        """패턴을 추가합니다. 이미 같은 우선순위로 등록되어 있으면 False를 반환합니다."""
+        if not pattern:
+            return False
+
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                # 노드 배열을 먼저 늘린 뒤 전이를 연결 (탐색 중 없는 노드를 가리키지 않도록)
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._depth.append(self._depth[node] + 1)
+                self._output.append(None)
+                self._out_link.append(-1)
+                self._goto[node][char] = next_node
+                self._dirty = True
+            node = next_node
+
+        if self._output[node] is None:
+            self._output[node] = {}
+            self._dirty = True
+        if priority in self._output[node]:
+            return False
+
+        self._output[node][priority] = payload
+        self.pattern_count += 1
+        return True
+
+    def remove(self, pattern: str, priority: int) -> bool:
+        """패턴의 해당 우선순위 출력을 제거합니다. 트라이 구조는 그대로 둡니다."""
+        node = self._find_node(pattern)
+        if node is None or not self._output[node] or priority not in self._output[node]:
+            return False
+
+        del self._output[node][priority]
+        self.pattern_count -= 1
+        return True
+
+    def _find_node(self, pattern: str):
+        node = 0
+        for char in pattern:
+            node = self._goto[node].get(char)
+            if node is None:
+                return None
+        return node
+
+    def build(self):
+        """
+        BFS로 실패 링크와 출력 링크를 계산합니다.
+        새 배열에 계산한 뒤 한 번에 교체하며, 여러 스레드가 동시에 호출해도 한 번만 계산합니다.
+        """
+        with self._build_lock:
+            if not self._dirty:
+                return
+
+            goto = self._goto
+            output = self._output
+            node_count = len(goto)
+            fail_links = [0] * node_count
+            out_links = [-1] * node_count
+
+            queue = deque(goto[0].values())
+            while queue:
+                node = queue.popleft()
+                for char, child in goto[node].items():
+                    fail = fail_links[node]
+                    while fail and char not in goto[fail]:
+                        fail = fail_links[fail]
+                    fail = goto[fail].get(char, 0)
+                    if fail == child:
+                        fail = 0
+                    fail_links[child] = fail
+                    out_links[child] = fail if output[fail] is not None else out_links[fail]
+                    queue.append(child)
+
+            self._fail = fail_links
+            self._out_link = out_links
+            self._dirty = False
+
+    def iter_matches(self, text: str):
+        """
+        텍스트에 나타나는 모든 패턴 출현을 (start, end, priority, payload) 형태로 반환합니다.
+        """
+        if self._dirty:
+            self.build()
+
+        # build()가 링크 배열을 통째로 교체하므로 탐색 시작 시점의 배열을 고정해서 사용
+        goto = self._goto
+        fail = self._fail
+        out_link = self._out_link
+        output = self._output
+        depth = self._depth
+        node_count = len(fail)
+        node = 0
+
+        for idx, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if node >= node_count:
+                # 링크 계산 이후에 추가된 노드는 다음 build() 전까지 무시
+                node = 0
+
+            out = node if output[node] is not None else out_link[node]
+            while out > 0:
+                outputs = output[out]
+                if outputs:
+                    start = idx + 1 - depth[out]
+                    for priority, payload in tuple(outputs.items()):
+                        yield start, idx + 1, priority, payload
+                out = out_link[out]
+
+
+def select_matches(matches) -> list:
+    """
+    겹치는 매칭을 정리합니다. 우선순위가 높은 것, 그다음 더 긴 것을 먼저 채택합니다.
+    (토큰 경계 확인은 호출 측에서 먼저 거릅니다)
+    반환값은 시작 위치 순으로 정렬된 (start, end, priority, payload) 리스트입니다.
+    """
+    candidates = list(matches)
+
+    candidates.sort(key=lambda m: (-m[2], -(m[1] - m[0]), m[0]))
+
+    occupied = []
+    selected = []
+    for match in candidates:
+        start, end = match[0], match[1]
+        if any(start < o_end and o_start < end for o_start, o_end in occupied):
+            continue
+        occupied.append((start, end))
+        selected.append(match)
+
+    selected.sort(key=lambda m: m[0])
+    return selected
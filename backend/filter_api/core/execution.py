@@ -0,0 +1,173 @@
+import asyncio
+import functools
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from starlette.responses import StreamingResponse
+
+
+class ServerBusyError(Exception):
+    """입장 제한과 대기열이 모두 찬 상태에서 들어온 요청. (HTTP 429로 응답)"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"서버가 처리 중인 요청이 많습니다. {retry_after}초 후 다시 시도하세요.")
+        self.retry_after = retry_after
+
+
+class ExecutionLayer:
+    """
+    API 요청의 실행 계층.
+    - CPU 작업(형태소 분석, Basic 모듈 추론 등)은 크기가 정해진 CPU 스레드 풀에서,
+      블로킹 I/O 클라이언트(googleapiclient 등)는 별도의 I/O 스레드 풀에서 실행하여 이벤트 루프를 막지 않습니다.
+    - 분석 요청은 동시에 max_inflight개까지만 실행하고, 최대 max_queue개까지 대기시킵니다.
+      대기열까지 가득 차면 ServerBusyError를 발생시켜 429(Retry-After)로 응답하게 합니다.
+    """
+
+    def __init__(self, cpu_workers: int, io_workers: int, max_inflight: int, max_queue: int, retry_after: int = 1):
+        self.cpu_workers = max(1, cpu_workers)
+        self.io_workers = max(1, io_workers)
+        self.max_inflight = max(1, max_inflight)
+        self.max_queue = max(0, max_queue)
+        self.retry_after = max(1, retry_after)
+
+        self.cpu_executor = ThreadPoolExecutor(max_workers=self.cpu_workers, thread_name_prefix="pipeline-cpu")
+        self.io_executor = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="pipeline-io")
+
+        # 이벤트 루프 스레드에서만 변경되는 입장 상태
+        self._semaphore = None
+        self._waiting = 0
+        self._inflight = 0
+
+        self._lock = threading.Lock()
+        self._stats = {"admitted": 0, "rejected": 0, "completed": 0, "total_wait_ms": 0.0, "max_wait_ms": 0.0}
+        self._avg_duration = 0.0
+
+    async def run_cpu(self, func, *args, **kwargs):
+        """CPU 작업을 CPU 스레드 풀에서 실행합니다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.cpu_executor, functools.partial(func, *args, **kwargs))
+
+    async def run_io(self, func, *args, **kwargs):
+        """블로킹 I/O 작업을 I/O 스레드 풀에서 실행합니다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.io_executor, functools.partial(func, *args, **kwargs))
+
+    def _estimate_retry_after(self) -> int:
+        """대기 중인 요청이 빠지는 데 걸릴 시간을 최근 평균 처리 시간으로 추정합니다."""
+        backlog = (self._waiting + self._inflight) / self.max_inflight
+        return max(self.retry_after, math.ceil(self._avg_duration * backlog))
+
+    async def _acquire(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_inflight)
+
+        if self._semaphore.locked() and self._waiting >= self.max_queue:
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise ServerBusyError(self._estimate_retry_after())
+
+        started = time.perf_counter()
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._inflight += 1
+
+        wait_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._stats["admitted"] += 1
+            self._stats["total_wait_ms"] += wait_ms
+            self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], wait_ms)
+
+    def _release(self, duration: float):
+        self._inflight -= 1
+        self._semaphore.release()
+        with self._lock:
+            self._stats["completed"] += 1
+            self._avg_duration = duration if self._stats["completed"] == 1 else 0.9 * self._avg_duration + 0.1 * duration
+
+    def admit(self):
+        """분석 요청 하나를 입장시키는 비동기 컨텍스트 매니저 (가득 차면 ServerBusyError)"""
+        return _Admission(self)
+
+    def install_default_executor(self):
+        """asyncio.to_thread 등 이벤트 루프 기본 실행기를 사용하는 CPU 작업도 CPU 스레드 풀을 쓰도록 설정합니다."""
+        asyncio.get_running_loop().set_default_executor(self.cpu_executor)
+
+    def close(self):
+        self.cpu_executor.shutdown(wait=False, cancel_futures=True)
+        self.io_executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            avg_duration = self._avg_duration
+        admitted = stats["admitted"]
+        stats["avg_wait_ms"] = round(stats.pop("total_wait_ms") / admitted, 3) if admitted else 0.0
+        stats["max_wait_ms"] = round(stats["max_wait_ms"], 3)
+        stats["avg_duration_ms"] = round(avg_duration * 1000, 3)
+        stats.update({
+            "inflight": self._inflight,
+            "waiting": self._waiting,
+            "max_inflight": self.max_inflight,
+            "max_queue": self.max_queue,
+            "cpu_workers": self.cpu_workers,
+            "io_workers": self.io_workers,
+        })
+        return stats
+
+
+class _Admission:
+    """
+    입장권. async with로 쓰거나, 응답 스트리밍처럼 핸들러 반환 뒤에도 요청이 이어지는 경우
+    acquire()로 입장한 뒤 스트림이 끝날 때 release()를 호출합니다.
+    """
+
+    def __init__(self, layer: ExecutionLayer):
+        self.layer = layer
+        self.started = None
+
+    async def acquire(self):
+        await self.layer._acquire()
+        self.started = time.perf_counter()
+        return self
+
+    def release(self):
+        """입장권을 반납합니다. 여러 번 호출해도 한 번만 반납됩니다."""
+        if self.started is None:
+            return
+        self.layer._release(time.perf_counter() - self.started)
+        self.started = None
+
+    async def __aenter__(self):
+        return await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+class AdmittedStreamingResponse(StreamingResponse):
+    """
+    acquire()한 입장권을 응답 전송이 끝날 때 반납하는 StreamingResponse.
+    클라이언트가 첫 프레임 전에 연결을 끊어 본문 생성기가 시작되지 않거나 전송 중 오류가 나도
+    입장권이 반납되고, 시작된 본문 생성기는 닫혀 정리 코드(finally)가 실행됩니다.
+    """
+
+    def __init__(self, content, admission: _Admission, **kwargs):
+        super().__init__(content, **kwargs)
+        self.admission = admission
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                aclose = getattr(self.body_iterator, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            finally:
+                self.admission.release()
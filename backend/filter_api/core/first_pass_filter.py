@@ -1,14 +1,53 @@
 import os
+import sys
 import json
-import re
-from konlpy.tag import Okt
+import hashlib
+import threading
+
+# config.py를 찾기 위한 경로 설정
+current_dir = os.path.dirname(__file__)
+backend_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.append(backend_dir)
+
+try:
+    from config import config
+    from filter_api.cache import PosCache
+    from filter_api.core.dictionary_matcher import AhoCorasickMatcher, select_matches
+    from filter_api.core.spans import make_span, normalize_with_offsets, render_filter_text
+    from filter_api.core.results import FilterResult
+    from filter_api.core.tokenizer_backends import Tokenizer, create_tokenizer
+    from filter_api.core.hangul_normalizer import VariantIndex, fold_variants, is_pure_hangul_word, to_jamo_key, variant_key
+except ImportError:
+    print("Error: config.py를 찾을 수 없습니다.", file=sys.stderr)
+    print(f"Current Path: {sys.path}", file=sys.stderr)
+    sys.exit(1)
+
+# 사전 우선순위 (겹치는 매칭은 화이트리스트 > 블랙리스트 > 시스템 사전 > 회피 변형 순으로 채택)
+PRIORITY_WHITELIST = 3
+PRIORITY_BLACKLIST = 2
+PRIORITY_SYSTEM = 1
+PRIORITY_VARIANT = 0
+
+# 우선순위별 적발 유형 (마스킹 토큰은 spans.PLACEHOLDERS 참고)
+MATCH_TYPES = {
+    PRIORITY_WHITELIST: "WHITELIST",
+    PRIORITY_BLACKLIST: "USER_BLACKLIST",
+    PRIORITY_SYSTEM: "SYSTEM_KEYWORD",
+    PRIORITY_VARIANT: "SYSTEM_VARIANT",
+}
 
 class FirstPassFilter:
-    def __init__(self):
+    def __init__(self, tokenizer: Tokenizer = None):
         print("[System] 1차 필터 리소스 로딩 시작...")
         
-        # 1. 형태소 분석기 초기화 (메모리 로드)
-        self.okt = Okt()
+        # 1. 형태소 분석기 초기화 (메모리 로드, Config.FIRST_PASS_TOKENIZER로 선택)
+        self.tokenizer = tokenizer or create_tokenizer(config.FIRST_PASS_TOKENIZER)
+        print(f"  ㄴ 토크나이저: {self.tokenizer.name}")
+
+        # 형태소 분석 결과 캐시 (중복/유사 댓글의 재분석 방지)
+        self.pos_cache = None
+        if config.POS_CACHE_SIZE > 0:
+            self.pos_cache = PosCache(self.tokenizer.pos, config.POS_CACHE_SIZE, config.POS_PHRASE_CACHE_SIZE, config.POS_CACHE_MAX_BYTES)
         
         # 2. 경로 설정
         self.base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,10 +60,25 @@ class FirstPassFilter:
         self.user_whitelist = set()
         self.user_blacklist = set()
         self.system_dictionary = set()
+        self.system_categories = {}      # 단어 -> 카테고리
+        self.system_white_phrases = {}   # 예외 문맥 구문 -> 카테고리
+        self.dictionary_revision = 0     # 사용자 사전이 바뀔 때마다 증가 (워커 프로세스 동기화용)
+        self._fingerprint = None         # (dictionary_revision, 사전 내용 해시)
+        # 사전 변경 직렬화용. 사용자 사전 집합은 제자리에서 고치지 않고 새 집합으로 교체
+        self._dictionary_lock = threading.Lock()
+
+        # 카테고리별 적발/예외 처리 통계
+        self._stats_lock = threading.Lock()
+        self.category_stats = {}
         
         # 4. 로드
         self._load_user_dictionary()
         self._load_system_dictionary()
+
+        # 5. 다중 패턴 매칭 자동자 구성
+        self.match_mode = config.FIRST_PASS_MATCH_MODE
+        self.use_variants = config.FIRST_PASS_VARIANTS
+        self._build_matcher()
         
         print("[System] 1차 필터 준비 완료.")
 
@@ -41,38 +95,106 @@ class FirstPassFilter:
         
         return {}
 
+    def user_dictionary_snapshot(self) -> tuple:
+        """
+        (dictionary_revision, 화이트리스트, 블랙리스트)를 같은 시점 기준으로 반환합니다.
+        워커 프로세스에 사전을 넘길 때 사용합니다.
+        """
+        with self._dictionary_lock:
+            return (
+                self.dictionary_revision,
+                tuple(sorted(self.user_whitelist)),
+                tuple(sorted(self.user_blacklist)),
+            )
+
+    def dictionary_fingerprint(self) -> str:
+        """
+        시스템 사전과 사용자 사전 내용의 해시를 반환합니다. (서버를 재시작해도 사전이 같으면 같은 값)
+        사전이 바뀔 때(dictionary_revision 증가)만 다시 계산합니다.
+        """
+        with self._dictionary_lock:
+            revision = self.dictionary_revision
+            if self._fingerprint is None or self._fingerprint[0] != revision:
+                payload = json.dumps(
+                    {
+                        "system": sorted(self.system_categories.items()),
+                        "white_phrases": sorted(self.system_white_phrases.items()),
+                        "whitelist": sorted(self.user_whitelist),
+                        "blacklist": sorted(self.user_blacklist),
+                    },
+                    ensure_ascii=False,
+                )
+                self._fingerprint = (revision, hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16])
+            return self._fingerprint[1]
+
     def _update_user_dictionary(self, words: list, list_type: str, action: str) -> int:
         """
         사용자 사전을 갱신(추가/삭제)하고 파일에 저장합니다.
+        새 집합과 자동자 사본을 고친 뒤 잠금 안에서 교체하므로, 동시에 필터링 중인 요청은 이전 사전을 끝까지 사용합니다.
         """
         if list_type == 'whitelist':
-            target_set = self.user_whitelist
+            attr_name = 'user_whitelist'
+            priority = PRIORITY_WHITELIST
         elif list_type == 'blacklist':
-            target_set = self.user_blacklist
+            attr_name = 'user_blacklist'
+            priority = PRIORITY_BLACKLIST
         else:
             return 0
 
-        changed_count = 0
-        
-        for word in words:
-            word = word.strip().lower()
-            if not word: continue
-
-            if action == 'add':
-                if word not in target_set:
-                    target_set.add(word)
-                    changed_count += 1
-                    
-            elif action == 'remove':
-                if word in target_set:
-                    target_set.remove(word)
-                    changed_count += 1
-        
-        if changed_count > 0:
-            self._save_user_dictionary()
-            
+        with self._dictionary_lock:
+            target_set = set(getattr(self, attr_name))
+            changed_count = 0
+            # 탐색 중인 자동자는 그대로 두고 사본을 고친 뒤 교체
+            matcher = self.matcher.copy()
+
+            for word in words:
+                word = word.strip().lower()
+                if not word: continue
+
+                if action == 'add':
+                    if word not in target_set:
+                        target_set.add(word)
+                        matcher.add(word, priority)
+                        changed_count += 1
+
+                elif action == 'remove':
+                    if word in target_set:
+                        target_set.remove(word)
+                        matcher.remove(word, priority)
+                        changed_count += 1
+
+            if changed_count > 0:
+                matcher.build()
+                setattr(self, attr_name, target_set)
+                self.matcher = matcher
+                self.dictionary_revision += 1
+                self._refresh_tokenizer_lexicon()
+                self._save_user_dictionary()
+
         return changed_count
 
+    def apply_user_dictionary(self, whitelist, blacklist):
+        """
+        메모리의 사용자 사전을 주어진 목록으로 맞춥니다. (파일에는 저장하지 않음)
+        워커 프로세스가 메인 프로세스의 사전 변경을 반영할 때 사용합니다.
+        """
+        whitelist, blacklist = set(whitelist), set(blacklist)
+        with self._dictionary_lock:
+            matcher = self.matcher.copy()
+            for current, words, priority in (
+                (self.user_whitelist, whitelist, PRIORITY_WHITELIST),
+                (self.user_blacklist, blacklist, PRIORITY_BLACKLIST),
+            ):
+                for word in current - words:
+                    matcher.remove(word, priority)
+                for word in words - current:
+                    matcher.add(word, priority)
+            matcher.build()
+            self.user_whitelist = whitelist
+            self.user_blacklist = blacklist
+            self.matcher = matcher
+            self._refresh_tokenizer_lexicon()
+
     def _save_user_dictionary(self) -> bool:
         """
         현재 메모리의 화이트/블랙리스트를 파일에 덮어씁니다.
@@ -110,59 +232,222 @@ class FirstPassFilter:
                 
                 for category, content in data.items():
                     for word in content.get("words", []):
-                        self.system_dictionary.add(word.strip().lower())
+                        word = word.strip().lower()
+                        self.system_dictionary.add(word)
+                        self.system_categories.setdefault(word, category)
+
+                    # 카테고리별 예외 문맥 구문 (예: "그만 졸라", "졸라맨")
+                    for phrase in content.get("white", []):
+                        phrase = phrase.strip().lower()
+                        if phrase:
+                            self.system_white_phrases.setdefault(phrase, category)
             
-            print(f"  ㄴ 시스템 사전 로드됨: {len(self.system_dictionary)}개 단어")
+            print(f"  ㄴ 시스템 사전 로드됨: {len(self.system_dictionary)}개 단어, 예외 문맥 {len(self.system_white_phrases)}개")
 
         except Exception as e: print(f"  [Error] 시스템 사전 로드 실패: {e}")
 
+    def _refresh_tokenizer_lexicon(self):
+        """사전 기반 분절을 쓰는 토크나이저에 현재 사전 단어와 예외 문맥 구문을 전달합니다."""
+        words = set(self.system_dictionary) | self.user_whitelist | self.user_blacklist
+        words.update(phrase.replace(" ", "") for phrase in self.system_white_phrases)
+        self.tokenizer.set_lexicon(words)
+        if self.pos_cache is not None and self.tokenizer.uses_lexicon:
+            self.pos_cache.clear()
+
+    def _build_matcher(self):
+        """시스템 사전과 사용자 사전으로 Aho-Corasick 자동자를 구성합니다."""
+        self._refresh_tokenizer_lexicon()
+        self.matcher = AhoCorasickMatcher()
+        for word in self.system_dictionary:
+            self.matcher.add(word, PRIORITY_SYSTEM, self.system_categories.get(word))
+        for word in self.user_blacklist:
+            self.matcher.add(word, PRIORITY_BLACKLIST)
+        for word in self.user_whitelist:
+            self.matcher.add(word, PRIORITY_WHITELIST)
+        self.matcher.build()
+
+        # 시스템 사전의 예외 문맥 구문 전용 자동자
+        self.context_matcher = AhoCorasickMatcher()
+        for phrase, category in self.system_white_phrases.items():
+            self.context_matcher.add(phrase, PRIORITY_SYSTEM, category)
+        self.context_matcher.build()
+
+        # 회피 변형용 자동자(자모 키 정확 일치)와 편집 거리 인덱스
+        self.variant_matcher = AhoCorasickMatcher()
+        self.variant_index = VariantIndex(config.VARIANT_MAX_DISTANCE, config.VARIANT_MIN_LENGTH)
+        if self.use_variants:
+            # 자모/숫자가 섞인 사전 항목(ㅈㅣ랄, ㄴ1ㅁ)은 그 자체가 변형 표기이므로 정확 매칭에만 사용
+            for word in sorted(filter(is_pure_hangul_word, self.system_dictionary)):
+                key = variant_key(word)
+                category = self.system_categories.get(word)
+                self.variant_matcher.add(key, PRIORITY_VARIANT, category)
+                self.variant_index.add(key, category)
+        self.variant_matcher.build()
+
+    def _suppress_white_contexts(self, text: str, matches) -> list:
+        """
+        같은 카테고리의 예외 문맥 구문 안에 들어간 시스템 사전 매칭을 제외합니다.
+        (예: "그만 졸라" 안의 "졸라")
+        """
+        matches = list(matches)
+        if not self.context_matcher.pattern_count:
+            return matches
+
+        white_spans = [(start, end, category) for start, end, _, category in self.context_matcher.iter_matches(text)]
+        if not white_spans:
+            return matches
+
+        kept = []
+        for match in matches:
+            start, end, priority, category = match
+            if priority in (PRIORITY_SYSTEM, PRIORITY_VARIANT) and any(
+                w_start <= start and end <= w_end and w_category == category
+                for w_start, w_end, w_category in white_spans
+            ):
+                self._count_category(category, "exceptions")
+                continue
+            kept.append(match)
+        return kept
+
+    def _count_category(self, category, key: str):
+        if category is None:
+            return
+        with self._stats_lock:
+            stats = self.category_stats.setdefault(category, {"hits": 0, "exceptions": 0})
+            stats[key] += 1
+
+    def get_stats(self) -> dict:
+        """카테고리별 적발(hits)/예외 처리(exceptions) 횟수와 형태소 분석 캐시 통계를 반환합니다."""
+        with self._stats_lock:
+            categories = {category: dict(stats) for category, stats in self.category_stats.items()}
+        return {
+            "categories": categories,
+            "pos_cache": self.pos_cache.get_stats() if self.pos_cache is not None else None,
+        }
+
+    def drain_stats(self) -> dict:
+        """누적된 카테고리 통계를 반환하고 초기화합니다. (워커 프로세스 → 메인 프로세스 전달용)"""
+        with self._stats_lock:
+            drained = self.category_stats
+            self.category_stats = {}
+        return drained
+
+    def merge_stats(self, category_stats: dict):
+        """다른 프로세스에서 집계된 카테고리 통계를 합산합니다."""
+        with self._stats_lock:
+            for category, counts in category_stats.items():
+                stats = self.category_stats.setdefault(category, {"hits": 0, "exceptions": 0})
+                for key, value in counts.items():
+                    stats[key] = stats.get(key, 0) + value
+
+    @staticmethod
+    def _token_spans(text: str, tokens) -> list:
+        """형태소 분석 결과의 각 토큰이 텍스트에서 차지하는 (시작, 끝) 위치를 구합니다."""
+        spans = []
+        cursor = 0
+        for word, pos in tokens:
+            idx = text.find(word, cursor)
+            if idx < 0:
+                continue
+            spans.append((idx, idx + len(word)))
+            cursor = idx + len(word)
+        return spans
+
+    def _match_variants(self, text: str, token_spans: list) -> list:
+        """
+        회피 변형을 찾습니다.
+        1) 숫자 삽입/유사 문자를 접고 자모로 분해한 텍스트에서 사전 단어의 자모 키를 찾고 (씨1321발, ㅅl발)
+        2) 토큰별로 편집 거리 인덱스를 조회합니다. (개새기 → 개새끼)
+        원문 그대로 사전 단어인 출현은 정확 매칭에서 처리하므로 제외합니다.
+        """
+        if not self.use_variants:
+            return []
+
+        matches = []
+        folded, fold_map = fold_variants(text)
+        key, key_map = to_jamo_key(folded)
+        for j_start, j_end, priority, category in self.variant_matcher.iter_matches(key):
+            # 음절 중간에서 시작하거나 끝나는 매칭은 제외 (예: '고'의 'ㅗ')
+            if j_start > 0 and key_map[j_start - 1] == key_map[j_start]:
+                continue
+            if j_end < len(key) and key_map[j_end] == key_map[j_end - 1]:
+                continue
+            start = fold_map[key_map[j_start]]
+            end = fold_map[key_map[j_end - 1]] + 1
+            matches.append((start, end, priority, category))
+
+        if len(self.variant_index):
+            for start, end in token_spans:
+                found = self.variant_index.lookup(variant_key(text[start:end]))
+                if found:
+                    matches.append((start, end, PRIORITY_VARIANT, found[0][1]))
+
+        return [m for m in matches if text[m[0]:m[1]] not in self.system_dictionary]
+
+    def _match_dictionary(self, text: str, tokens) -> list:
+        """
+        자동자로 텍스트를 한 번 훑어 사전 단어(및 회피 변형)의 모든 출현 위치를 찾고,
+        예외 문맥에 속한 시스템 사전 매칭을 제외한 뒤 겹침을 정리합니다.
+        token 모드에서는 형태소 경계에 맞는 매칭만 사용합니다. (여러 토큰에 걸친 구문 포함)
+        """
+        token_spans = self._token_spans(text, tokens)
+        matches = list(self.matcher.iter_matches(text))
+        matches.extend(self._match_variants(text, token_spans))
+        if self.match_mode != "substring":
+            token_starts = {start for start, _ in token_spans}
+            token_ends = {end for _, end in token_spans}
+            matches = [m for m in matches if m[0] in token_starts and m[1] in token_ends]
+
+        matches = self._suppress_white_contexts(text, matches)
+        return select_matches(matches)
+
     def normalize_text(self, text: str) -> str:
         text = text.lower()
-        text = re.sub(r'[^가-힣a-zA-Z0-9\s]', '', text)
-        return text
+        # 단독 자모(ㅂㅅ, ㅈㄴ, ㅗ 등)도 사전 매칭 대상이므로 유지
+        return normalize_with_offsets(text)[0]
 
     def execute(self, original_text: str) -> dict:
-        """외부에서 호출하는 메인 메서드"""
+        """외부에서 호출하는 메인 메서드 (dict 반환, 단위 API 호환용)"""
+        return self.run(original_text).to_dict()
+
+    def run(self, original_text: str) -> FilterResult:
+        """파이프라인 내부용 메인 메서드 (FilterResult 반환)"""
         status = "PASSED"
         
-        # 1. 정규화
-        normalized_text = self.normalize_text(original_text)
+        # 1. 정규화 (정규화된 각 문자의 원문 위치도 함께 보관)
+        normalized_text, offsets = normalize_with_offsets(original_text)
         
-        # 2. 형태소 분석 (self.okt 사용)
-        tokened_text = self.okt.pos(normalized_text)
+        # 2. 형태소 분석 (토큰 경계 추출)
+        tokened_text = self.pos_cache.pos(normalized_text) if self.pos_cache is not None else self.tokenizer.pos(normalized_text)
         
-        text_for_filtering = normalized_text
-        detected_words = []
+        # 3. 사전 매칭 (한 번의 선형 탐색)
+        matches = self._match_dictionary(normalized_text, tokened_text)
 
-        for word, pos in tokened_text:
-            word_lower = word.lower() # 혹시 몰라 한 번 더 소문자 처리
-
-            # [A] 화이트리스트
-            if word_lower in self.user_whitelist:
-                text_for_filtering = text_for_filtering.replace(word, "__W__")
-                continue
+        # 4. 적발 목록과 원문 기준 적발 구간 작성
+        detected_words = []
+        spans = []
+        for start, end, priority, category in matches:
+            match_type = MATCH_TYPES[priority]
+            if priority in (PRIORITY_SYSTEM, PRIORITY_VARIANT):
+                self._count_category(category, "hits")
+            if priority != PRIORITY_WHITELIST:
+                detected_words.append({'word': normalized_text[start:end], 'type': match_type})
+            spans.append(make_span(offsets[start], offsets[end - 1] + 1, match_type, "FIRST_PASS"))
 
-            # [B] 블랙리스트
-            if word_lower in self.user_blacklist:
-                detected_words.append({'word': word, 'type': 'USER_BLACKLIST'})
-                text_for_filtering = text_for_filtering.replace(word, "__B__")
-                continue
-            
-            # [C] 시스템 사전
-            if word_lower in self.system_dictionary:
-                detected_words.append({'word': word, 'type': 'SYSTEM_KEYWORD'})
-                text_for_filtering = text_for_filtering.replace(word, "__F__")
-                continue
+        # 5. 마스킹 텍스트 생성 (한 번의 선형 탐색)
+        text_for_filtering, _ = render_filter_text(original_text, spans)
 
         if detected_words:
             status = 'FILTERED_BY_FIRST_PASS'
         
-        return {
-            'original_text': original_text,
-            'status': status,
-            'detected_words': detected_words,
-            'text_for_filtering': text_for_filtering
-        }
+        return FilterResult(
+            original_text=original_text,
+            status=status,
+            detected_words=detected_words,
+            text_for_filtering=text_for_filtering,
+            spans=spans,
+            stages_run=['FIRST_PASS'],
+        )
 
 if __name__ == "__main__":
     import json
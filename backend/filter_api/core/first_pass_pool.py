@@ -0,0 +1,145 @@
+import os
+import sys
+import threading
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# config.py를 찾기 위한 경로 설정
+current_dir = os.path.dirname(__file__)
+backend_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.append(backend_dir)
+
+try:
+    from config import config
+    from filter_api.core.first_pass_filter import FirstPassFilter
+except ImportError:
+    print("Error: config.py를 찾을 수 없습니다.", file=sys.stderr)
+    print(f"Current Path: {sys.path}", file=sys.stderr)
+    sys.exit(1)
+
+
+# ---------------------------------------------------------
+# 워커 프로세스 측 상태 (프로세스마다 하나씩 존재)
+# ---------------------------------------------------------
+_worker_filter = None
+_worker_revision = 0
+
+
+def _init_worker():
+    """워커 프로세스 시작 시 자체 Okt(JVM)와 사전을 로드하고 미리 한 번 실행해 둡니다."""
+    global _worker_filter
+    _worker_filter = FirstPassFilter()
+    _worker_filter.run("워밍업")
+    _worker_filter.drain_stats()
+
+
+def _run_chunk(revision: int, whitelist: tuple, blacklist: tuple, texts: list) -> tuple:
+    """텍스트 묶음을 처리하고 (결과 리스트, 카테고리 통계 증분)을 반환합니다."""
+    global _worker_revision
+    if revision != _worker_revision:
+        _worker_filter.apply_user_dictionary(whitelist, blacklist)
+        _worker_revision = revision
+
+    results = [_worker_filter.run(text) for text in texts]
+    return results, _worker_filter.drain_stats()
+
+
+def _ping(_) -> int:
+    return os.getpid()
+
+
+class FirstPassWorkerPool:
+    """
+    1차 필터 다중 프로세스 실행기.
+    Okt는 JPype/JVM 위에서 동작하여 한 프로세스에서는 코어 하나만 사용하므로,
+    워커 프로세스마다 별도의 Okt와 사전 사본을 두고 텍스트를 묶음(chunk) 단위로 나눠 처리합니다.
+    사용자 사전이 바뀌면 다음 묶음과 함께 최신 사전이 전달되어 워커에 반영됩니다.
+    """
+
+    def __init__(self, first_filter: FirstPassFilter, workers: int, chunk_size: int = 32):
+        self.first_filter = first_filter
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+
+        # 메인 프로세스에서 이미 JVM이 떠 있으므로 fork 대신 spawn 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        self._lock = threading.Lock()
+        self._stats = {"texts": 0, "chunks": 0, "busy_seconds": 0.0}
+
+        # 워커를 미리 띄워 첫 요청에서 JVM 기동 시간이 드러나지 않도록 함
+        list(self._executor.map(_ping, range(self.workers)))
+        print(f"  ㄴ 1차 필터 워커 프로세스 {self.workers}개 준비 완료")
+
+    def execute_many(self, texts: list) -> list:
+        """여러 텍스트를 워커들에 나눠 처리하고, 입력 순서대로 FilterResult 리스트를 반환합니다."""
+        if not texts:
+            return []
+
+        started = time.perf_counter()
+        revision, whitelist, blacklist = self.first_filter.user_dictionary_snapshot()
+
+        # 워커 수보다 묶음이 적으면 코어가 놀기 때문에 묶음 크기를 줄임
+        chunk_size = min(self.chunk_size, max(1, -(-len(texts) // self.workers)))
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        futures = [
+            self._executor.submit(_run_chunk, revision, whitelist, blacklist, chunk)
+            for chunk in chunks
+        ]
+
+        results = []
+        for future in futures:
+            chunk_results, category_stats = future.result()
+            results.extend(chunk_results)
+            self.first_filter.merge_stats(category_stats)
+
+        with self._lock:
+            self._stats["texts"] += len(texts)
+            self._stats["chunks"] += len(chunks)
+            self._stats["busy_seconds"] += time.perf_counter() - started
+        return results
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["workers"] = self.workers
+        stats["chunk_size"] = self.chunk_size
+        stats["busy_seconds"] = round(stats["busy_seconds"], 4)
+        return stats
+
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("▶ [Debug] FirstPassWorkerPool 처리량 테스트")
+    print("==========================================")
+
+    filter_instance = FirstPassFilter()
+    test_file_path = os.path.join(filter_instance.base_dir, 'resources', 'test_data', 'test_comments.txt')
+    with open(test_file_path, "r", encoding="utf-8") as f:
+        test_comments = [line.strip() for line in f if line.strip()]
+
+    # 기준: 단일 프로세스
+    filter_instance.run("더미 데이터")
+    start = time.perf_counter()
+    baseline = [filter_instance.run(comment) for comment in test_comments]
+    single_time = time.perf_counter() - start
+    print(f"▶ 단일 프로세스: {len(test_comments) / single_time:.1f} 건/초")
+
+    max_workers = config.FIRST_PASS_WORKERS or os.cpu_count() or 1
+    for workers in sorted({1, max(1, max_workers // 2), max_workers}):
+        pool = FirstPassWorkerPool(filter_instance, workers, config.FIRST_PASS_CHUNK_SIZE)
+        start = time.perf_counter()
+        results = pool.execute_many(test_comments)
+        elapsed = time.perf_counter() - start
+        pool.close()
+
+        same = sum(1 for a, b in zip(baseline, results) if a == b)
+        print(f"▶ 워커 {workers}개: {len(test_comments) / elapsed:.1f} 건/초 "
+              f"(x{single_time / elapsed:.2f}, 결과 일치 {same}/{len(test_comments)})")
@@ -0,0 +1,206 @@
+import re
+
+# 한글 음절 분해표 (호환용 자모 사용: 단독 자모 'ㅂ'과 음절 속 'ㅂ'을 같은 문자로 취급)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_LAST = 0xD7A3
+
+# 회피용으로 자주 바꿔 쓰는 된소리/모음을 같은 문자로 접음 (예: 씨발/시발, 개새끼/개새기)
+JAMO_FOLD = {
+    "ㄲ": "ㄱ", "ㄸ": "ㄷ", "ㅃ": "ㅂ", "ㅆ": "ㅅ", "ㅉ": "ㅈ",
+    "ㅐ": "ㅔ", "ㅒ": "ㅖ",
+}
+
+# 자음 자모 뒤에서 모음처럼 쓰이는 문자 (예: ㅅl발, ㅅ1발)
+VOWEL_LOOKALIKES = {"l": "ㅣ", "1": "ㅣ", "i": "ㅣ"}
+# 모음 자모 앞에서 자음처럼 쓰이는 문자 (예: oㅏ)
+CONSONANT_LOOKALIKES = {"o": "ㅇ", "0": "ㅇ"}
+
+_FOLDABLE_RUN = re.compile(r"[0-9lio]+")
+
+
+def is_syllable(char: str) -> bool:
+    return bool(char) and SYLLABLE_BASE <= ord(char) <= SYLLABLE_LAST
+
+
+def is_consonant_jamo(char: str) -> bool:
+    return bool(char) and "ㄱ" <= char <= "ㅎ"
+
+
+def is_vowel_jamo(char: str) -> bool:
+    return bool(char) and "ㅏ" <= char <= "ㅣ"
+
+
+def is_hangul(char: str) -> bool:
+    return is_syllable(char) or is_consonant_jamo(char) or is_vowel_jamo(char)
+
+
+def decompose_char(char: str) -> str:
+    """음절 하나를 호환용 자모 문자열로 분해합니다. 음절이 아니면 그대로 반환합니다."""
+    if not is_syllable(char):
+        return char
+    code = ord(char) - SYLLABLE_BASE
+    cho, rest = divmod(code, 21 * 28)
+    jung, jong = divmod(rest, 28)
+    return CHOSEONG[cho] + JUNGSEONG[jung] + JONGSEONG[jong]
+
+
+def fold_variants(text: str) -> tuple:
+    """
+    회피용 변형을 접은 텍스트와, 접힌 텍스트의 각 문자가 원래 텍스트의 몇 번째 문자였는지를 반환합니다.
+    - 한글 사이에 끼워 넣은 숫자는 제거 (씨1321발 → 씨발)
+    - 자음 자모 뒤의 l/1/i는 'ㅣ', 모음 자모 앞의 o/0은 'ㅇ'으로 치환 (ㅅl발 → ㅅㅣ발)
+    """
+    chars = []
+    index_map = []
+    cursor = 0
+
+    for match in _FOLDABLE_RUN.finditer(text):
+        start, end = match.span()
+        for idx in range(cursor, start):
+            chars.append(text[idx])
+            index_map.append(idx)
+        cursor = end
+
+        run = match.group()
+        prev_char = text[start - 1] if start > 0 else ""
+        next_char = text[end] if end < len(text) else ""
+
+        if len(run) == 1 and run in VOWEL_LOOKALIKES and is_consonant_jamo(prev_char):
+            chars.append(VOWEL_LOOKALIKES[run])
+            index_map.append(start)
+        elif len(run) == 1 and run in CONSONANT_LOOKALIKES and is_vowel_jamo(next_char):
+            chars.append(CONSONANT_LOOKALIKES[run])
+            index_map.append(start)
+        elif run.isdigit() and is_hangul(prev_char) and is_hangul(next_char):
+            continue
+        else:
+            for idx in range(start, end):
+                chars.append(text[idx])
+                index_map.append(idx)
+
+    for idx in range(cursor, len(text)):
+        chars.append(text[idx])
+        index_map.append(idx)
+
+    return "".join(chars), index_map
+
+
+def to_jamo_key(text: str) -> tuple:
+    """
+    텍스트를 자모 단위로 분해하고 된소리 등을 접은 비교용 키와,
+    키의 각 자모가 원래 텍스트의 몇 번째 문자에서 왔는지를 반환합니다.
+    """
+    chars = []
+    index_map = []
+    for idx, char in enumerate(text):
+        for jamo in decompose_char(char):
+            chars.append(JAMO_FOLD.get(jamo, jamo))
+            index_map.append(idx)
+    return "".join(chars), index_map
+
+
+def variant_key(word: str) -> str:
+    """사전 단어를 변형 비교용 자모 키로 변환합니다."""
+    folded, _ = fold_variants(word)
+    key, _ = to_jamo_key(folded)
+    return key
+
+
+def is_pure_hangul_word(word: str) -> bool:
+    """공백 외에는 완성형 음절로만 이루어진 단어인지 확인합니다. (자모/숫자/영문이 섞인 사전 항목은 그 자체가 변형 표기)"""
+    return any(is_syllable(char) for char in word) and all(is_syllable(char) or char.isspace() for char in word)
+
+
+def consonant_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    자음 자모의 삽입/삭제/치환만 허용하는 편집 거리를 계산합니다.
+    모음이 바뀌면 다른 단어가 되는 경우가 많아(예: 문재인/문죄인) 모음 편집은 허용하지 않습니다.
+    max_distance를 넘으면 max_distance + 1을 반환합니다.
+    """
+    limit = max_distance + 1
+    if abs(len(a) - len(b)) > max_distance:
+        return limit
+
+    def edit_cost(char):
+        return 1 if is_consonant_jamo(char) else limit
+
+    previous = [0]
+    for char_b in b:
+        previous.append(min(limit, previous[-1] + edit_cost(char_b)))
+    for char_a in a:
+        current = [min(limit, previous[0] + edit_cost(char_a))]
+        row_min = current[0]
+        for j, char_b in enumerate(b, start=1):
+            if char_a == char_b:
+                cost = 0
+            elif is_consonant_jamo(char_a) and is_consonant_jamo(char_b):
+                cost = 1
+            else:
+                cost = limit
+            current.append(min(limit, previous[j] + edit_cost(char_a), current[j - 1] + edit_cost(char_b), previous[j - 1] + cost))
+            row_min = min(row_min, current[j])
+        if row_min > max_distance:
+            return limit
+        previous = current
+    return previous[-1]
+
+
+class VariantIndex:
+    """
+    사전 단어의 자모 키에 대한 삭제 이웃(deletion-neighborhood) 인덱스.
+    조회어와 사전 단어에서 최대 max_distance개의 자음을 지운 형태를 서로 대조하여
+    자음 편집 거리 max_distance 이내의 후보를 빠르게 찾습니다. (개새기 → 개섹기)
+    짧은 단어는 오탐이 많으므로 min_length 이상의 키만 근사 매칭합니다.
+    """
+
+    def __init__(self, max_distance: int = 1, min_length: int = 7):
+        self.max_distance = max(0, max_distance)
+        self.min_length = min_length
+        self._deletes = {}   # 삭제 변형 -> {키}
+        self._payloads = {}  # 키 -> payload
+
+    def __len__(self):
+        return len(self._payloads)
+
+    def _deletions(self, key: str) -> set:
+        variants = {key}
+        frontier = {key}
+        for _ in range(self.max_distance):
+            next_frontier = set()
+            for item in frontier:
+                for idx, char in enumerate(item):
+                    if is_consonant_jamo(char):
+                        next_frontier.add(item[:idx] + item[idx + 1:])
+            variants |= next_frontier
+            frontier = next_frontier
+        return variants
+
+    def add(self, key: str, payload=None):
+        if len(key) < self.min_length or key in self._payloads:
+            return
+        self._payloads[key] = payload
+        for variant in self._deletions(key):
+            self._deletes.setdefault(variant, set()).add(key)
+
+    def lookup(self, query: str) -> list:
+        """편집 거리 이내의 (키, payload, 거리) 리스트를 거리 순으로 반환합니다."""
+        if len(query) < self.min_length - self.max_distance:
+            return []
+
+        candidates = set()
+        for variant in self._deletions(query):
+            candidates |= self._deletes.get(variant, set())
+
+        results = []
+        for key in candidates:
+            distance = consonant_distance(query, key, self.max_distance)
+            if distance <= self.max_distance:
+                results.append((key, self._payloads[key], distance))
+
+        results.sort(key=lambda item: item[2])
+        return results
@@ -0,0 +1,136 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+
+class InferenceScheduler:
+    """
+    동시 요청에서 들어온 Basic 모듈 추론 작업을 큐에 모아 하나의 배치로 실행하는 스케줄러.
+    최대 배치 크기(단어 수)에 도달하거나 최대 대기 시간이 지나면 배치를 실행하고,
+    각 호출자의 Future에 결과를 돌려줍니다.
+    """
+
+    def __init__(self, batch_fn, max_batch_size: int = 64, max_wait_ms: float = 5.0, max_queue_size: int = 1024):
+        # batch_fn: 단어 리스트를 받아 같은 순서의 확률 리스트를 반환하는 함수
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self._queue = queue.Queue(maxsize=max(1, max_queue_size))
+        self._stop_event = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "batches": 0,
+            "requests": 0,
+            "tokens": 0,
+            "max_batch_tokens": 0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
+            "overflow": 0,
+        }
+
+        self._worker = threading.Thread(target=self._run, name="basic-inference-scheduler", daemon=True)
+        self._worker.start()
+
+    def submit(self, tokens: list) -> Future:
+        """추론 작업을 큐에 넣고 Future를 반환합니다."""
+        future = Future()
+        if not tokens:
+            future.set_result([])
+            return future
+
+        try:
+            self._queue.put_nowait((list(tokens), future, time.perf_counter()))
+        except queue.Full:
+            # 큐가 가득 찬 경우 호출 스레드에서 바로 실행 (지연 누적 방지)
+            with self._stats_lock:
+                self._stats["overflow"] += 1
+            try:
+                future.set_result(self.batch_fn(list(tokens)))
+            except Exception as e:
+                future.set_exception(e)
+
+        return future
+
+    def score(self, tokens: list) -> list:
+        """추론 작업을 제출하고 결과가 나올 때까지 기다립니다."""
+        return self.submit(tokens).result()
+
+    def get_stats(self) -> dict:
+        """배치 크기 및 대기 시간 통계를 반환합니다."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        batches = stats["batches"]
+        return {
+            "batches": batches,
+            "requests": stats["requests"],
+            "tokens": stats["tokens"],
+            "avg_batch_tokens": round(stats["tokens"] / batches, 2) if batches else 0.0,
+            "max_batch_tokens": stats["max_batch_tokens"],
+            "avg_wait_ms": round(stats["total_wait_ms"] / stats["requests"], 3) if stats["requests"] else 0.0,
+            "max_wait_ms": round(stats["max_wait_ms"], 3),
+            "overflow": stats["overflow"],
+            "queue_depth": self._queue.qsize(),
+        }
+
+    def close(self):
+        """워커 스레드를 종료합니다."""
+        self._stop_event.set()
+        self._worker.join(timeout=1.0)
+
+    def _collect_batch(self) -> list:
+        """첫 작업이 들어온 뒤 최대 배치 크기 또는 최대 대기 시간까지 작업을 모읍니다."""
+        try:
+            first = self._queue.get(timeout=0.1)
+        except queue.Empty:
+            return []
+
+        batch = [first]
+        batch_tokens = len(first[0])
+        deadline = first[2] + self.max_wait
+
+        while batch_tokens < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            batch_tokens += len(item[0])
+
+        return batch
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            batch = self._collect_batch()
+            if not batch:
+                continue
+
+            flushed_at = time.perf_counter()
+            all_tokens = [word for tokens, _, _ in batch for word in tokens]
+
+            with self._stats_lock:
+                self._stats["batches"] += 1
+                self._stats["requests"] += len(batch)
+                self._stats["tokens"] += len(all_tokens)
+                self._stats["max_batch_tokens"] = max(self._stats["max_batch_tokens"], len(all_tokens))
+                for _, _, enqueued_at in batch:
+                    wait_ms = (flushed_at - enqueued_at) * 1000
+                    self._stats["total_wait_ms"] += wait_ms
+                    self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], wait_ms)
+
+            try:
+                all_scores = self.batch_fn(all_tokens)
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for tokens, future, _ in batch:
+                future.set_result(all_scores[offset:offset + len(tokens)])
+                offset += len(tokens)
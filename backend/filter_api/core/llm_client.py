@@ -0,0 +1,237 @@
+import asyncio
+import json
+import random
+import threading
+import time
+
+import httpx
+import openai
+
+
+def is_provider_failure(error: Exception) -> bool:
+    """
+    공급자 쪽 장애로 볼 수 있는 오류인지 반환합니다. (재시도 및 서킷 브레이커 실패 집계 대상)
+    429, 5xx, 타임아웃, 연결 오류만 해당하며, 400/401/404 같은 요청 오류는 제외합니다.
+    """
+    if isinstance(error, (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError, asyncio.TimeoutError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 임계치를 넘으면 일정 시간 동안 호출을 차단(OPEN)하는 서킷 브레이커.
+    차단 시간이 지나면 한 번의 시험 호출(HALF_OPEN)을 허용하고, 성공하면 다시 닫힙니다.
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_time = recovery_time
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.short_circuited = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """호출을 진행해도 되는지 반환합니다."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.recovery_time:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+
+            self.short_circuited += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def record_ignored(self):
+        """공급자 상태와 무관하게 끝난 호출(요청 오류 등). 실패로 세지 않고 시험 호출만 끝냅니다."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "short_circuited": self.short_circuited,
+            }
+
+
+class AsyncLLMClient:
+    """
+    비동기 OpenAI 호출 클라이언트.
+    공유 HTTP 커넥션 풀, 세마포어 기반 동시 호출 제한, 429/5xx 재시도(지터 백오프),
+    호출별 마감 시간, 서킷 브레이커를 제공합니다.
+    세마포어는 요청을 보내는 동안만 잡고 재시도 대기 중에는 놓으며, 브레이커에는 공급자 장애(429/5xx/연결 오류)만 실패로 기록합니다.
+    실패 시에는 예외 대신 빈 dict를 반환하여 기존 2차 필터 로직과 동일하게 동작합니다.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: str = None,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        deadline: float = 30.0,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        breaker: CircuitBreaker = None,
+    ):
+        self.model = model
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.deadline = deadline
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+            timeout=httpx.Timeout(deadline),
+        )
+        # 재시도는 직접 처리하므로 SDK 내부 재시도는 끔
+        self._client = openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url or None,
+            http_client=self._http,
+            max_retries=0,
+        )
+        self._semaphore = None
+        self._stats = {"calls": 0, "succeeded": 0, "failed": 0, "retries": 0, "timeouts": 0}
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 이벤트 루프 안에서 처음 사용할 때 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        return is_provider_failure(error)
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        # 서버가 Retry-After를 알려주면 우선 사용
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.backoff_max)
+                except ValueError:
+                    pass
+
+        # Full jitter: 0 ~ min(max, base * 2^attempt)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def complete_json(self, system_prompt: str, user_prompt: str) -> dict:
+        """JSON 모드로 질의하고 파싱된 dict를 반환합니다. 실패 시 빈 dict를 반환합니다."""
+        if not self.breaker.allow():
+            return {}
+
+        self._stats["calls"] += 1
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + self.deadline
+
+        last_error = None
+        attempted = False
+        for attempt in range(self.max_retries + 1):
+            try:
+                # 세마포어는 요청을 보내는 동안만 잡음 (재시도 대기 중에는 다른 호출이 사용)
+                async with self._get_semaphore():
+                    remaining = deadline_at - loop.time()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        break
+
+                    attempted = True
+                    response = await asyncio.wait_for(
+                        self._client.chat.completions.create(
+                            model=self.model,
+                            messages=[
+                                {"role": "system", "content": system_prompt},
+                                {"role": "user", "content": user_prompt}
+                            ],
+                            response_format={"type": "json_object"},
+                            temperature=0.0
+                        ),
+                        timeout=remaining,
+                    )
+            except Exception as e:
+                last_error = e
+                if isinstance(e, asyncio.TimeoutError):
+                    self._stats["timeouts"] += 1
+                if not self._is_retryable(e) or attempt == self.max_retries:
+                    print(f"OpenAI API 호출 실패: {e}")
+                    break
+
+                delay = self._backoff_delay(attempt, e)
+                if loop.time() + delay >= deadline_at:
+                    print(f"OpenAI API 호출 실패 (마감 시간 초과): {e}")
+                    break
+                self._stats["retries"] += 1
+                await asyncio.sleep(delay)
+                continue
+
+            # 응답을 받았으면 공급자는 정상으로 간주
+            self.breaker.record_success()
+            self._stats["succeeded"] += 1
+
+            content = response.choices[0].message.content
+            if not content:
+                return {}
+            try:
+                return json.loads(content)
+            except ValueError as e:
+                print(f"OpenAI 응답 JSON 파싱 실패: {e}")
+                return {}
+
+        self._stats["failed"] += 1
+        # 공급자 장애(또는 요청을 보낸 뒤의 마감 초과)만 브레이커 실패로 집계
+        # 요청 오류(400/401/404 등)나 차례를 기다리다 마감된 경우는 다른 호출까지 막지 않도록 제외
+        if (last_error is None and attempted) or (last_error is not None and is_provider_failure(last_error)):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_ignored()
+        return {}
+
+    async def aclose(self):
+        await self._http.aclose()
+
+    def get_stats(self) -> dict:
+        stats = dict(self._stats)
+        stats["in_flight_limit"] = self.max_concurrency
+        stats["circuit"] = self.breaker.get_stats()
+        return stats
@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+
+
+class OnnxClassifier:
+    """
+    ONNX Runtime으로 export된 Basic 모듈(시퀀스 분류 모델) 실행기.
+    PyTorch 모델을 메모리에 올리지 않고 CPU 추론만 수행하며, 입력은 토크나이저의 numpy 출력(return_tensors="np")을 사용합니다.
+    onnxruntime은 이 클래스를 생성할 때만 임포트합니다. (BASIC_MODULE_RUNTIME=onnx 일 때만 필요)
+    """
+
+    def __init__(self, model_path: str, num_threads: int = 0):
+        import onnxruntime as ort
+
+        if not os.path.isfile(model_path):
+            raise FileNotFoundError(f"ONNX 모델 파일이 없습니다: {model_path}")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+
+        self.model_path = model_path
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = [item.name for item in self.session.get_inputs()]
+        self.output_name = self.session.get_outputs()[0].name
+
+    def predict_proba(self, inputs) -> list:
+        """배치 전체의 악성(라벨 1) 확률을 입력 순서대로 반환합니다."""
+        feeds = {name: np.asarray(inputs[name], dtype=np.int64) for name in self.input_names if name in inputs}
+        logits = self.session.run([self.output_name], feeds)[0]
+
+        # 수치 안정성을 위해 최댓값을 뺀 softmax
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        probs = exp / exp.sum(axis=-1, keepdims=True)
+        return probs[:, 1].tolist()
@@ -8,6 +8,8 @@ sys.path.append(backend_dir)
 
 try:
     from config import config
+    from filter_api.core.spans import render_masked
+    from filter_api.core.results import FilterResult, as_result
 except ImportError:
     print("Error: config.py를 찾을 수 없습니다.", file=sys.stderr)
     print(f"Current Path: {sys.path}", file=sys.stderr)
@@ -17,11 +19,11 @@ class PolicyManager:
     def __init__(self):
         print(f"[System] Policy Manager 로드 (Level: {config.SECURITY_LEVEL})")
 
-    def decide_action(self, risk_score: float, filter_result: dict) -> dict:
+    def decide_action(self, risk_score: float, filter_result: FilterResult) -> dict:
         
-        # 1. 원문 추출 (없으면 빈 문자열)
-        # 1차 필터링 결과 dict 안에 'original_text' 키가 있다고 가정
-        original_text = filter_result.get('original_text', '') 
+        # 1. 원문 추출 (dict 결과도 허용, 없으면 빈 문자열)
+        filter_result = as_result(filter_result)
+        original_text = filter_result.original_text
         
         # 2. 점수 미달이면 무조건 통과 (PASS)
         if risk_score < config.RISK_THRESHOLD:
@@ -39,7 +41,7 @@ class PolicyManager:
         # 문자열 오타만 조심하면 이 방식이 제일 빠르고 편함
         if level == 1:   # 관찰
             final_action = "MASKING"
-            processed_text = self._mask_text(original_text, filter_result.get('detected_words', []))
+            processed_text = self._mask_text(original_text, filter_result.detected_words, filter_result.spans)
             
         elif level == 2: # 관대함
             final_action = "REVIEW_HUMAN"
@@ -63,8 +65,11 @@ class PolicyManager:
             "score": risk_score
         }
 
-    def _mask_text(self, text, detected_words):
-        """마스킹 처리"""
+    def _mask_text(self, text, detected_words, spans=None):
+        """마스킹 처리 (적발 구간이 있으면 원문 위치 기준으로 한 번에 처리)"""
+        if spans:
+            return render_masked(text, spans)
+
         masked_text = text
         for item in detected_words:
             word = item.get('word', '')
@@ -0,0 +1,55 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class FilterResult:
+    """
+    파이프라인 단계 사이에서 주고받는 필터링 결과.
+    dict 대신 __slots__ 객체를 사용하여 댓글마다 생기는 키 해시/복사 비용과 메모리를 줄이고,
+    HTTP 응답으로 나갈 때만 to_dict()로 변환합니다.
+    spans가 None이면 구간 정보가 없는 결과(직접 입력 등)로 보고 각 단계가 문자열 치환 방식으로 처리합니다.
+    """
+
+    original_text: str
+    status: str = "PASSED"
+    detected_words: list = field(default_factory=list)
+    text_for_filtering: str = ""
+    spans: list = None
+    stages_run: list = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "original_text": self.original_text,
+            "status": self.status,
+            "detected_words": list(self.detected_words),
+            "text_for_filtering": self.text_for_filtering,
+            "spans": list(self.spans) if self.spans is not None else [],
+            "stages_run": list(self.stages_run),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FilterResult":
+        """dict 결과를 복사하여 객체로 만듭니다. (입력 dict는 변경되지 않음)"""
+        spans = data.get("spans")
+        return cls(
+            original_text=data.get("original_text", ""),
+            status=data.get("status", "PASSED"),
+            detected_words=list(data.get("detected_words", [])),
+            text_for_filtering=data.get("text_for_filtering", ""),
+            spans=list(spans) if spans is not None else None,
+            stages_run=list(data.get("stages_run", [])),
+        )
+
+
+def as_result(data) -> FilterResult:
+    """FilterResult 또는 dict를 FilterResult로 변환합니다. (단위 API 등 기존 dict 입력 호환용)"""
+    if isinstance(data, FilterResult):
+        return data
+    return FilterResult.from_dict(data)
+
+
+def match_input(source, result: FilterResult):
+    """입력과 같은 형태로 돌려줍니다. (dict로 받은 경우 dict로 변환)"""
+    if isinstance(source, FilterResult):
+        return result
+    return result.to_dict()
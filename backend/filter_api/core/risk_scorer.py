@@ -1,4 +1,17 @@
+import os
 import re
+import sys
+
+# filter_api 패키지를 찾기 위한 경로 설정
+current_dir = os.path.dirname(__file__)
+backend_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.append(backend_dir)
+
+from filter_api.core.spans import PLACEHOLDERS, SAFE_TYPES, normalize_with_offsets, sorted_spans
+from filter_api.core.results import FilterResult, as_result
+
+# 연속성 계산에 쓰는 1차 필터 적발 유형 (__B__, __F__)
+CONSECUTIVE_TYPES = {span_type for span_type, placeholder in PLACEHOLDERS.items() if placeholder in ("__B__", "__F__")}
 
 class RiskScorer:
     def __init__(self):
@@ -17,13 +30,15 @@ class RiskScorer:
         }
         print("[System] Risk Scorer(위험도 분석기) 로드 완료")
 
-    def execute(self, filter_result: dict) -> float:
+    def execute(self, filter_result: FilterResult) -> float:
         """
-        1차 필터링 결과를 바탕으로 위험도 점수(0.0 ~ 1.0)를 계산합니다.
+        1차 필터링 결과를 바탕으로 위험도 점수(0.0 ~ 1.0)를 계산합니다. (dict 결과도 허용)
         """
         # 1. 데이터 추출
-        detected_words = filter_result.get('detected_words', [])
-        text_for_filtering = filter_result.get('text_for_filtering', "")
+        filter_result = as_result(filter_result)
+        detected_words = filter_result.detected_words
+        text_for_filtering = filter_result.text_for_filtering
+        spans = filter_result.spans
         
         if not detected_words:
             return 0.0
@@ -42,21 +57,28 @@ class RiskScorer:
         total_score += min((count - 1) * self.weights['COUNT_BONUS'], self.weights['COUNT_MAX'])
         
         # (B) 밀도 (Density)
-        text_len = len(text_for_filtering.replace(" ", ""))
-        if text_len > 0:
-            detected_words_len = sum(len(item['word']) for item in detected_words)
-            density = detected_words_len / text_len
-            if density > 0.4:
-                total_score += self.weights['DENSITY_BONUS']
+        if spans:
+            density = self._span_density(filter_result.original_text, spans)
+        else:
+            density = 0.0
+            text_len = len(text_for_filtering.replace(" ", ""))
+            if text_len > 0:
+                detected_words_len = sum(len(item['word']) for item in detected_words)
+                density = detected_words_len / text_len
+        if density > 0.4:
+            total_score += self.weights['DENSITY_BONUS']
 
         # (C) 연속성 (Consecutive Degree)
-        # "__B__" 또는 "__F__" 토큰이 2개 이상 연속으로 나오는 시퀀스 탐색
-        sequences = re.findall(r'(?:__[BF]__\s*){2,}', text_for_filtering)
+        # 1차 필터 적발("__B__" 또는 "__F__")이 2개 이상 연속으로 나오는 시퀀스 탐색
+        if spans:
+            run_lengths = self._span_runs(filter_result.original_text, spans)
+        else:
+            sequences = re.findall(r'(?:__[BF]__\s*){2,}', text_for_filtering)
+            # 발견된 시퀀스 안에서 토큰(__F__, __B__) 수 계산
+            run_lengths = [len(re.findall(r'__[BF]__', seq)) for seq in sequences]
         
         consecutive_score = 0.0
-        for seq in sequences:
-            # 발견된 시퀀스 안에서 토큰(__F__, __B__) 수 계산
-            seq_len = len(re.findall(r'__[BF]__', seq))
+        for seq_len in run_lengths:
             if seq_len >= 2:
                 consecutive_score += min(self.weights['CONSECUTIVE_BONUS'] * (seq_len - 1), self.weights['CONSECUTIVE_LEN_MAX'])
         
@@ -64,6 +86,48 @@ class RiskScorer:
 
         # 4. 최종 마무리
         return min(round(total_score, 2), 1.0)
+
+    @staticmethod
+    def _span_density(original_text: str, spans: list) -> float:
+        """원문의 공백 제외 길이 대비 적발 구간(허용 단어 제외)의 공백 제외 길이 비율"""
+        text_len = len(original_text) - sum(1 for char in original_text if char.isspace())
+        if text_len <= 0:
+            return 0.0
+        flagged_len = 0
+        for span in spans:
+            if span['type'] in SAFE_TYPES:
+                continue
+            segment = original_text[span['start']:span['end']]
+            flagged_len += len(segment) - sum(1 for char in segment if char.isspace())
+        return flagged_len / text_len
+
+    @staticmethod
+    def _span_runs(original_text: str, spans: list) -> list:
+        """
+        1차 필터 적발 구간이 공백(및 정규화에서 지워지는 기호)만 사이에 두고 이어지는 묶음의 길이 리스트.
+        다른 유형의 구간이 끼어 있으면 묶음이 끊깁니다.
+        """
+        runs = []
+        current = 0
+        prev_end = None
+        for span in sorted_spans(spans):
+            if span['type'] not in CONSECUTIVE_TYPES:
+                if current:
+                    runs.append(current)
+                current, prev_end = 0, None
+                continue
+
+            if prev_end is not None and not normalize_with_offsets(original_text, prev_end, span['start'])[0].strip():
+                current += 1
+            else:
+                if current:
+                    runs.append(current)
+                current = 1
+            prev_end = span['end']
+
+        if current:
+            runs.append(current)
+        return runs
     
 if __name__ == "__main__":
     print("==========================================")
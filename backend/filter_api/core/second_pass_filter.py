@@ -1,9 +1,13 @@
+import asyncio
 import json
 import openai
 import sys
 import os
 import torch
 import re
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 
 # config.py를 찾기 위한 경로 설정
@@ -14,96 +18,423 @@ sys.path.append(backend_dir)
 
 try:
     from config import config
+    from filter_api.core.inference_scheduler import InferenceScheduler
+    from filter_api.cache.token_cache import TokenProbabilityCache, compute_model_fingerprint
+    from filter_api.cache.verdict_cache import VerdictCache, make_verdict_key
+    from filter_api.core.llm_client import AsyncLLMClient, CircuitBreaker, is_provider_failure
+    from filter_api.core.risk_scorer import RiskScorer
+    from filter_api.core.onnx_classifier import OnnxClassifier
+    from filter_api.core.spans import add_spans, render_filter_text, span_from_filter_range
+    from filter_api.core.results import as_result, match_input
 except ImportError:
     print("Error: config.py를 찾을 수 없습니다.", file=sys.stderr)
     print(f"Current Path: {sys.path}", file=sys.stderr)
     sys.exit(1)
 
+SYSTEM_PROMPT = "You are a strict content moderator. Output in JSON."
+API_KEY_MISSING_RESPONSE = {"detected_items": [], "reason": "API Key Missing", "severity": 0}
+
 class SecondPassFilter:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, risk_scorer=None):
         # 프롬프트 모듈 설정 로드
         self.basic_ai_module = config.BASIC_AI_MODULE
         self.special_ai_modules = config.SPECIAL_AI_MODULES
         
         # AI 모듈 초기화
-        self.basic_module_dir = os.path.join(backend_dir, "resources\\modules\\basic_ai_module")
         self.basic_threshold = config.BASIC_THRESHOLD
+        self.basic_batch_size = max(1, config.BASIC_BATCH_SIZE)
+        self.basic_mode = config.BASIC_MODULE_MODE
+        self.basic_max_length = config.BASIC_MAX_LENGTH
+        self.occlusion_min_drop = config.BASIC_OCCLUSION_MIN_DROP
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
 
-        try:
-            self.tokenizer = AutoTokenizer.from_pretrained(self.basic_module_dir)
-            self.basic_module = AutoModelForSequenceClassification.from_pretrained(self.basic_module_dir)
-            self.basic_module.to(self.device)
-            self.basic_module.eval()
-        except Exception as e:
-            print(f"[ERROR] BASIC 모듈 로드 실패: {e}")
-            self.tokenizer = None
-            self.basic_module_dir = None
+        # 단어별 확률 캐시 (모델 식별자 기준으로 무효화)
+        self.token_cache = None
+        if config.BASIC_CACHE_SIZE > 0:
+            self.token_cache = TokenProbabilityCache(config.BASIC_CACHE_SIZE, config.BASIC_CACHE_PATH or None)
+
+        self._load_basic_module()
+
+        if self.token_cache is not None:
+            loaded = self.token_cache.load()
+            if loaded:
+                print(f"  ㄴ 토큰 캐시 로드됨: {loaded}개")
+
+        # 동시 요청의 Basic 모듈 추론을 묶어서 처리하는 스케줄러
+        self.scheduler = None
+        if config.SCHEDULER_ENABLED and self.basic_module is not None:
+            self.scheduler = InferenceScheduler(
+                self._score_tokens,
+                max_batch_size=config.SCHEDULER_MAX_BATCH_SIZE,
+                max_wait_ms=config.SCHEDULER_MAX_WAIT_MS,
+                max_queue_size=config.SCHEDULER_MAX_QUEUE_SIZE,
+            )
+
+        # 단계적 판정(Cascade)용 중간 위험도 계산기 및 통계
+        self.risk_scorer = risk_scorer or RiskScorer()
+        self.cascade_stats = {"llm_called": 0, "skipped_low": 0, "skipped_high": 0}
+        self._cascade_lock = threading.Lock()
+
+        # LLM 판정 결과 캐시 (마스킹된 텍스트 + 활성 모듈 기준)
+        self.verdict_cache = None
+        if config.LLM_CACHE_ENABLED:
+            try:
+                self.verdict_cache = VerdictCache(
+                    config.LLM_CACHE_PATH,
+                    ttl_seconds=config.LLM_CACHE_TTL,
+                    max_entries=config.LLM_CACHE_MAX_ENTRIES,
+                )
+            except Exception as e:
+                print(f"[ERROR] LLM 캐시 초기화 실패: {e}")
+        # 비동기 경로의 캐시(SQLite) 조회/기록은 이벤트 루프를 막지 않도록 전용 스레드에서 실행
+        self._cache_executor = None
+        if self.verdict_cache is not None:
+            self._cache_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="verdict-cache")
 
         # OPEN AI 클라이언트 초기화
+        self.llm_model = "gpt-3.5-turbo" # 또는 "gpt-4o-mini" (상위 모델)
         api_key = config.OPENAI_API_KEY
+
+        # 동기/비동기 경로가 공유하는 서킷 브레이커 (장애 시 LLM 단계를 빠르게 건너뜀)
+        self.llm_breaker = CircuitBreaker(config.LLM_BREAKER_FAILURES, config.LLM_BREAKER_RECOVERY)
         
         if api_key:
             # 키가 있으면 정상적으로 클라이언트 생성
-            self.client = openai.OpenAI(api_key=api_key)
+            self.client = openai.OpenAI(
+                api_key=api_key,
+                base_url=config.OPENAI_BASE_URL or None,
+                timeout=config.LLM_CALL_DEADLINE,
+            )
+            # 비동기 경로용 클라이언트 (커넥션 풀, 동시 호출 제한, 재시도)
+            self.async_client = AsyncLLMClient(
+                api_key,
+                self.llm_model,
+                base_url=config.OPENAI_BASE_URL or None,
+                max_concurrency=config.LLM_MAX_CONCURRENCY,
+                max_retries=config.LLM_MAX_RETRIES,
+                deadline=config.LLM_CALL_DEADLINE,
+                breaker=self.llm_breaker,
+            )
         else:
             # 키가 없으면 클라이언트를 None으로 설정하고 경고 출력
             self.client = None
+            self.async_client = None
             print("[WARNING] OPENAI_API_KEY가 설정되지 않았습니다. 2차 필터링(AI)이 비활성화됩니다.")        
 
+    def _load_basic_module(self) -> bool:
+        """
+        [Basic 모듈 로드 담당] 모델과 토크나이저를 로드하고 토큰 캐시의 모델 식별자를 갱신합니다.
+        다시 로드하다 실패하면 기존 모델을 그대로 사용합니다.
+        """
+        model_dir = os.path.join(backend_dir, "resources", "modules", "basic_ai_module")
+        runtime = config.BASIC_MODULE_RUNTIME
+
+        try:
+            tokenizer = AutoTokenizer.from_pretrained(model_dir)
+            module = None
+            if runtime == "onnx":
+                module = self._load_onnx_module(model_dir)
+            if module is None:
+                runtime = "torch"
+                module = AutoModelForSequenceClassification.from_pretrained(model_dir)
+                module.to(self.device)
+                module.eval()
+        except Exception as e:
+            print(f"[ERROR] BASIC 모듈 로드 실패: {e}")
+            if getattr(self, "basic_module", None) is not None:
+                return False
+            self._set_basic_module(None, None, runtime, None)
+            return False
+
+        self._set_basic_module(tokenizer, module, runtime, model_dir)
+        return True
+
+    def _set_basic_module(self, tokenizer, module, runtime: str, model_dir):
+        """
+        모델/토크나이저/실행 방식을 한 번에 교체합니다.
+        추론 중인 스레드는 교체 전 묶음(_basic_bundle)을 끝까지 사용하므로 새 토크나이저와 옛 모델이 섞이지 않습니다.
+        """
+        self._basic_bundle = (tokenizer, module, runtime)
+        self.tokenizer = tokenizer
+        self.basic_module = module
+        self.basic_runtime = runtime
+        self.basic_module_dir = model_dir
+
+        # 실행 방식마다 확률이 조금씩 다르므로(int8 양자화 등) 캐시 식별자에 실행 방식을 포함
+        # ONNX 파일은 모델 디렉토리 밖(BASIC_ONNX_PATH)에 있을 수 있으므로 파일 정보를 따로 반영
+        extra_files = (self._onnx_path(model_dir),) if runtime == "onnx" and model_dir else ()
+        # 판정 방식(word/sentence)과 최대 입력 길이(잘림)에 따라서도 같은 입력의 확률이 달라지므로 함께 포함
+        self.model_id = (
+            f"{compute_model_fingerprint(model_dir, extra_files)}:{runtime}"
+            f":{self.basic_mode}:{self.basic_max_length}"
+        )
+
+        if self.token_cache is not None:
+            self.token_cache.set_model(self.model_id)
+
+    @staticmethod
+    def _onnx_path(model_dir: str) -> str:
+        """사용할 ONNX 파일 경로 (BASIC_ONNX_PATH가 없으면 모델 디렉토리의 model.onnx)"""
+        return config.BASIC_ONNX_PATH or os.path.join(model_dir, "model.onnx")
+
+    @staticmethod
+    def _load_onnx_module(model_dir: str):
+        """ONNX 모델을 로드합니다. 실패하면 None을 반환하여 PyTorch 모델로 대체합니다."""
+        onnx_path = SecondPassFilter._onnx_path(model_dir)
+        try:
+            module = OnnxClassifier(onnx_path, num_threads=config.BASIC_ONNX_THREADS)
+            print(f"  ㄴ Basic 모듈 ONNX Runtime 사용: {onnx_path}")
+            return module
+        except Exception as e:
+            print(f"[ERROR] ONNX 모델 로드 실패, PyTorch로 실행합니다: {e}")
+            return None
+
+    def reload_basic_module(self) -> bool:
+        """
+        디스크의 Basic 모듈을 다시 로드합니다. (/api/system/basic-module/reload)
+        모델이 바뀌었으면 토큰 캐시가 비워지고, 새 모델 기준의 캐시를 바로 디스크에 저장합니다.
+        """
+        previous = self.model_id
+        loaded = self._load_basic_module()
+        if loaded and self.model_id != previous and self.token_cache is not None:
+            self.token_cache.save()
+        return loaded
+
+    def close(self):
+        """스케줄러를 종료하고 토큰 캐시를 디스크에 저장합니다."""
+        if self.scheduler is not None:
+            self.scheduler.close()
+        if self.token_cache is not None and self.token_cache.save():
+            print(f"[System] 토큰 캐시 저장 완료 ({len(self.token_cache)}개)")
+        if self._cache_executor is not None:
+            # 남은 캐시 기록을 마친 뒤 연결을 닫음
+            self._cache_executor.shutdown(wait=True)
+        if self.verdict_cache is not None:
+            self.verdict_cache.close()
+
+    async def aclose(self):
+        """비동기 LLM 클라이언트의 커넥션 풀을 닫습니다."""
+        if self.async_client is not None:
+            await self.async_client.aclose()
+
+    def update_modules(self, special_ai_modules: dict):
+        """
+        활성 특수 AI 모듈을 교체합니다. 판정 기준이 바뀌므로 LLM 캐시를 비웁니다.
+        """
+        self.special_ai_modules = special_ai_modules
+        if self.verdict_cache is not None:
+            removed = self.verdict_cache.clear()
+            print(f"[System] 활성 모듈 변경으로 LLM 캐시 {removed}개 무효화")
+
     def _tokenize_for_module(self, text: str):
         """ 
         [토큰화 담당] Basic 모듈에서의 처리를 위한 토큰화를 진행합니다.
         """
+        return [w for w, _ in self._tokenize_with_positions(text)]
+
+    @staticmethod
+    def _strip_placeholders(text: str) -> str:
+        """마스킹 토큰을 같은 길이의 공백으로 치환합니다. (위치 유지)"""
+        for ph in ("__F__", "__B__", "__W__", "__S__"):
+            text = text.replace(ph, " " * len(ph))
+        return text
+
+    @staticmethod
+    def _tokenize_with_positions(text: str, max_length: int = 10):
+        """
+        Basic 모듈 후보 단어와 텍스트 내 시작 위치를 (단어, 위치) 리스트로 반환합니다.
+        max_length 이상인 단어는 제외하며, None이면 길이 제한을 두지 않습니다. (sentence 모드)
+        """
         if not text:
             return []
 
-        # 마스킹 토큰을 공백으로 치환
-        tmp = text
-        for ph in ("__F__", "__B__", "__W__"):
-            tmp = tmp.replace(ph, " ")
-
-        raw_tokens = re.findall(r"[가-힣ㄱ-ㅎㅏ-ㅣA-Za-z0-9]+", tmp)
+        tmp = SecondPassFilter._strip_placeholders(text)
 
         tokens = []
-        for w in raw_tokens:
-            w = w.strip()
-            if not w:
-                continue
+        for match in re.finditer(r"[가-힣ㄱ-ㅎㅏ-ㅣA-Za-z0-9]+", tmp):
+            w = match.group()
 
             if len(w) == 1 and not w.isdigit():
                 continue
             
-            if len(w) >= 10:
+            if max_length is not None and len(w) >= max_length:
                 continue
-            tokens.append(w)
+            tokens.append((w, match.start()))
 
         return tokens
+
+    def _candidate_positions(self, text: str):
+        """현재 판정 방식에 맞는 후보 단어 (단어, 위치) 리스트"""
+        if self.basic_mode == "sentence":
+            return self._tokenize_with_positions(text, max_length=None)
+        return self._tokenize_with_positions(text)
+
+    def _score_candidates(self, texts: list, positions_per_text: list) -> list:
+        """
+        [Basic 모듈 판정 담당] 댓글별 후보 단어의 점수 리스트를 반환합니다.
+        word 모드는 모든 댓글의 후보 단어를 모아 한 번에 점수화하고, sentence 모드는 _score_sentences를 사용합니다.
+        """
+        if self.basic_mode == "sentence":
+            return self._score_sentences(texts, positions_per_text)
+
+        all_tokens = [word for positions in positions_per_text for word, _ in positions]
+        all_scores = self._call_basic_module_batch(all_tokens)
+
+        scores_per_text = []
+        offset = 0
+        for positions in positions_per_text:
+            scores_per_text.append(all_scores[offset:offset + len(positions)])
+            offset += len(positions)
+        return scores_per_text
+
+    def _score_sentences(self, texts: list, positions_per_text: list) -> list:
+        """
+        [문장 단위 판정 담당] 댓글 전체(마스킹 토큰 제외)를 한 번 분류하고, 임계값을 넘은 댓글만
+        후보 단어를 하나씩 가린(occlusion) 변형들을 한 배치로 분류하여 단어별 기여도(확률 하락폭)를 계산합니다.
+        하락폭이 occlusion_min_drop 이상이거나 가렸을 때 임계값 아래로 내려가는 단어를 적발하며,
+        그런 단어가 없으면 기여도가 가장 큰 단어 하나를 적발합니다. 적발 단어의 점수는 댓글 전체의 악성 확률입니다.
+        문장은 단어와 같은 확률 캐시/스케줄러를 거치지만, 다시 나올 일이 거의 없는 가림 변형은
+        자주 쓰이는 캐시 항목을 밀어내지 않도록 캐시에 넣지 않습니다.
+        """
+        scores_per_text = [[0.0] * len(positions) for positions in positions_per_text]
+        targets = [idx for idx, positions in enumerate(positions_per_text) if positions]
+        if not targets or self.basic_module is None or not self.tokenizer:
+            return scores_per_text
+
+        # 1. 댓글 전체 분류 (댓글 수만큼의 입력을 한 번에)
+        sentences = {idx: self._strip_placeholders(texts[idx]) for idx in targets}
+        base_probs = dict(zip(targets, self._call_basic_module_batch([sentences[idx] for idx in targets])))
+        flagged = [idx for idx in targets if base_probs[idx] >= self.basic_threshold]
+        if not flagged:
+            return scores_per_text
+
+        # 2. 적발된 댓글의 가림 변형을 모아 한 번에 분류
+        mask = self.tokenizer.mask_token or ""
+        occluded = []
+        for idx in flagged:
+            sentence = sentences[idx]
+            for word, start in positions_per_text[idx]:
+                occluded.append(sentence[:start] + mask + sentence[start + len(word):])
+        occluded_probs = self._call_basic_module_batch(occluded, use_cache=False)
+
+        # 3. 단어별 기여도로 적발 단어 선택
+        offset = 0
+        for idx in flagged:
+            count = len(positions_per_text[idx])
+            probs = occluded_probs[offset:offset + count]
+            offset += count
+
+            base = base_probs[idx]
+            drops = [base - prob for prob in probs]
+            hits = [
+                pos for pos, (drop, prob) in enumerate(zip(drops, probs))
+                if drop >= self.occlusion_min_drop or prob < self.basic_threshold
+            ]
+            if not hits:
+                hits = [max(range(count), key=drops.__getitem__)]
+            for pos in hits:
+                scores_per_text[idx][pos] = base
+
+        return scores_per_text
     
     def _call_basic_module(self, token: str) -> float:
         """
-        [Basic 모듈 실행 담당] Basic 모듈을 이용하여 문장을 분석합니다.
+        [Basic 모듈 실행 담당] Basic 모듈을 이용하여 단어 하나를 분석합니다.
+        """
+        return self._call_basic_module_batch([token])[0]
+
+    def _call_basic_module_batch(self, tokens: list, use_cache: bool = True) -> list:
+        """
+        [Basic 모듈 배치 실행 담당] 여러 단어의 악성 확률을 입력 순서대로 반환합니다.
+        토큰 캐시에 있는 단어는 추론하지 않습니다. use_cache=False이면 캐시를 조회/저장하지 않습니다.
+        """
+        if not tokens:
+            return []
+
+        if self.basic_module is None or not self.tokenizer:
+            return [0.0] * len(tokens)
+
+        if self.token_cache is None or not use_cache:
+            return self._infer_tokens(tokens)
+
+        # 캐시에 없는 단어만 추론
+        probs_by_token, missing = self.token_cache.lookup(tokens)
+        if missing:
+            model_id = self.model_id
+            computed = dict(zip(missing, self._infer_tokens(missing)))
+            self.token_cache.store(computed, model_id)
+            probs_by_token.update(computed)
+
+        return [probs_by_token[token] for token in tokens]
+
+    def _infer_tokens(self, tokens: list) -> list:
+        """
+        [Basic 모듈 추론 요청 담당] 스케줄러가 켜져 있으면 다른 요청의 작업과 묶어서 실행합니다.
+        """
+        if self.scheduler is not None:
+            return self.scheduler.score(tokens)
+
+        return self._score_tokens(tokens)
+
+    def _score_tokens(self, tokens: list) -> list:
+        """
+        [Basic 모듈 점수화 담당] 여러 단어를 패딩된 텐서로 묶어 한 번에 분석합니다.
+        중복 단어는 한 번만 계산하며, 반환값은 입력 순서와 동일한 악성 확률 리스트입니다.
+        """
+        unique_tokens = list(dict.fromkeys(tokens))
+        probs_by_token = {}
+
+        # 긴 댓글이 메모리를 과도하게 쓰지 않도록 basic_batch_size 단위로 나누어 처리
+        for i in range(0, len(unique_tokens), self.basic_batch_size):
+            chunk = unique_tokens[i:i + self.basic_batch_size]
+            for token, prob in zip(chunk, self._infer_basic_batch(chunk)):
+                probs_by_token[token] = prob
+
+        return [probs_by_token[token] for token in tokens]
+
+    def get_stats(self) -> dict:
+        """2차 필터 내부 구성요소의 통계를 반환합니다."""
+        return {
+            "basic_runtime": self.basic_runtime if self.basic_module is not None else None,
+            "basic_scheduler": self.scheduler.get_stats() if self.scheduler is not None else None,
+            "token_cache": self.token_cache.get_stats() if self.token_cache is not None else None,
+            "llm_cache": self.verdict_cache.get_stats() if self.verdict_cache is not None else None,
+            "llm_client": self.async_client.get_stats() if self.async_client is not None else None,
+            "cascade": dict(self._cascade_snapshot(), enabled=config.CASCADE_ENABLED),
+        }
+
+    def _infer_basic_batch(self, tokens: list) -> list:
+        """
+        [Basic 모듈 추론 담당] 한 번의 forward pass로 배치 전체의 악성 확률을 계산합니다.
         """
-        if not self.basic_module or not self.tokenizer:
-            return 0.0
+        tokenizer, module, runtime = self._basic_bundle
+        if runtime == "onnx":
+            inputs = tokenizer(
+                tokens,
+                truncation=True,
+                padding=True,
+                max_length=self.basic_max_length,
+                return_tensors="np",
+            )
+            return module.predict_proba(inputs)
 
-        inputs = self.tokenizer(
-            token,
+        inputs = tokenizer(
+            tokens,
             truncation=True,
-            padding=False,
-            max_length=64,
+            padding=True,
+            max_length=self.basic_max_length,
             return_tensors="pt",
         )
         inputs = {k: v.to(self.device) for k, v in inputs.items()}
 
         with torch.no_grad():
-            outputs = self.basic_module(**inputs)
-            probs = torch.softmax(outputs.logits, dim=-1)[0]
-            return float(probs[1]) # 악성일 확률
+            outputs = module(**inputs)
+            probs = torch.softmax(outputs.logits, dim=-1)[:, 1] # 악성일 확률
+            return probs.tolist()
 
-    def _construct_prompt(self, text):
+    def _construct_criteria(self):
         """
-        [프롬프트 생성 담당] 질문 텍스트를 만듭니다.
+        [판단 기준 생성 담당] 기본 검사 규칙과 활성 특수 모듈로 판단 기준 목록을 만듭니다.
         """
         check_list = []
         for rule in self.basic_ai_module:
@@ -111,7 +442,13 @@ class SecondPassFilter:
         for category, rule in self.special_ai_modules.items():
             check_list.append(f"- [{category}] {rule}")
 
-        criteria = "\n".join(check_list)
+        return "\n".join(check_list)
+
+    def _construct_prompt(self, text):
+        """
+        [프롬프트 생성 담당] 질문 텍스트를 만듭니다.
+        """
+        criteria = self._construct_criteria()
 
         return f"""
         분석할 댓글: "{text}"
@@ -135,86 +472,605 @@ class SecondPassFilter:
         }}
         """
 
+    def _construct_batch_prompt(self, items: dict):
+        """
+        [묶음 프롬프트 생성 담당] 여러 댓글을 id와 함께 하나의 질문으로 묶습니다.
+        판단 기준은 한 번만 포함됩니다.
+        """
+        criteria = self._construct_criteria()
+        comments = json.dumps(
+            [{"id": item_id, "text": text} for item_id, text in items.items()],
+            ensure_ascii=False
+        )
+
+        return f"""
+        분석할 댓글 목록 (JSON): {comments}
+        
+        [판단 기준]
+        다음의 모든 기준을 적용하여 각 댓글을 독립적으로 엄격하게 검사하세요:
+        {criteria}
+        
+        각 댓글에서 위반되는 '구체적인 부분(단어, 구문)'을 모두 찾아내어 아래 JSON 형식으로 응답하세요.
+        모든 댓글의 id에 대해 결과를 하나씩 포함해야 하며, 위반이 없으면 detected_items를 빈 배열로 두세요.
+        각 적발 항목에 대해 가장 적합한 모듈(Category)을 지정해야 합니다.
+        
+        {{
+            "results": [
+                {{
+                    "id": "댓글 id",
+                    "detected_items": [
+                        {{
+                            "keyword": "문제된 단어/구문",
+                            "category": "위반 모듈명 (예: PRIVACY, SEXUAL)"
+                        }}
+                    ],
+                    "reason": "판단 사유",
+                    "severity": integer (1~5)
+                }}
+            ]
+        }}
+        """
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """
+        [토큰 수 추정 담당] 한글은 글자당 1~2 토큰 정도이므로 UTF-8 바이트 수의 절반으로 근사합니다.
+        """
+        return (len(text.encode("utf-8")) + 1) // 2
+
+    def _pack_items(self, items: dict) -> list:
+        """
+        [묶음 구성 담당] 토큰 예산과 최대 개수 안에서 댓글들을 순서대로 묶습니다.
+        """
+        budget = config.LLM_PACK_TOKEN_BUDGET - self._estimate_tokens(self._construct_batch_prompt({}))
+        max_items = max(1, config.LLM_PACK_MAX_ITEMS)
+
+        packs = []
+        current = {}
+        used = 0
+        for item_id, text in items.items():
+            # id, 따옴표 등 JSON 구조에 드는 토큰을 여유분으로 더함
+            cost = self._estimate_tokens(text) + 10
+            if current and (used + cost > budget or len(current) >= max_items):
+                packs.append(current)
+                current = {}
+                used = 0
+            current[item_id] = text
+            used += cost
+
+        if current:
+            packs.append(current)
+        return packs
+
+    @staticmethod
+    def _parse_batch_response(response: dict, item_ids) -> dict:
+        """
+        [묶음 응답 해석 담당] id별 판정 결과를 추출합니다. 형식이 올바른 항목만 반환합니다.
+        """
+        parsed = {}
+        results = response.get('results') if isinstance(response, dict) else None
+        if not isinstance(results, list):
+            return parsed
+
+        for entry in results:
+            if not isinstance(entry, dict):
+                continue
+            item_id = str(entry.get('id', ''))
+            detected_items = entry.get('detected_items')
+            if item_id not in item_ids or not isinstance(detected_items, list):
+                continue
+            if not all(isinstance(item, dict) for item in detected_items):
+                continue
+            parsed[item_id] = {
+                "detected_items": detected_items,
+                "reason": entry.get('reason', ''),
+                "severity": entry.get('severity', 0),
+            }
+        return parsed
+
     def _call_openai_api(self, prompt):
         """
         [API 통신 담당] 실제 GPT에게 질문을 던지고 JSON 결과를 받아옵니다.
         """
         if self.client is None:
             # 빈 응답을 반환하여 2차 필터링 로직이 정상적으로 통과되게 함
-            return {"detected_items": [], "reason": "API Key Missing", "severity": 0}
+            return dict(API_KEY_MISSING_RESPONSE)
+
+        # 공급자 장애 중에는 타임아웃을 기다리지 않고 바로 건너뜀
+        if not self.llm_breaker.allow():
+            return {}
 
         try:
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo", # 또는 "gpt-4o-mini" (상위 모델)
+                model=self.llm_model,
                 messages=[
-                    {"role": "system", "content": "You are a strict content moderator. Output in JSON."},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 response_format={"type": "json_object"}, # JSON 모드 강제 (중요)
                 temperature=0.0 # 일관된 분석을 위해 0으로 설정
             )
+        except Exception as e:
+            print(f"OpenAI API 호출 실패: {e}")
+            # 공급자 장애만 브레이커 실패로 집계 (잘못된 요청/키 오류로 모든 호출이 막히지 않도록)
+            if is_provider_failure(e):
+                self.llm_breaker.record_failure()
+            else:
+                self.llm_breaker.record_ignored()
+            return {} # 실패 시 빈 객체 반환하여 로직이 안 터지게 함
+
+        self.llm_breaker.record_success()
+        try:
             content = response.choices[0].message.content
             if not content:
                 return {}
             return json.loads(content)
-            
         except Exception as e:
-            print(f"OpenAI API 호출 실패: {e}")
-            return {} # 실패 시 빈 객체 반환하여 로직이 안 터지게 함
+            print(f"OpenAI 응답 JSON 파싱 실패: {e}")
+            return {}
+
+    async def _call_openai_api_async(self, prompt):
+        """
+        [비동기 API 통신 담당] 이벤트 루프를 막지 않고 GPT에게 질문합니다.
+        """
+        if self.async_client is None:
+            return dict(API_KEY_MISSING_RESPONSE)
+
+        return await self.async_client.complete_json(SYSTEM_PROMPT, prompt)
+
+    @staticmethod
+    def _span_offsets(second_pass_result):
+        """
+        원문과 적발 구간으로 다시 만든 텍스트가 text_for_filtering과 같으면, 그 텍스트의 문자별 원문 위치를 반환합니다.
+        구간 정보가 없거나 텍스트를 직접 입력한 경우(단위 API 등)에는 None을 반환하며, 이때는 문자열 치환으로 처리합니다.
+        """
+        spans = second_pass_result.spans
+        if spans is None:
+            return None
+        text, offsets = render_filter_text(second_pass_result.original_text, spans)
+        if text != second_pass_result.text_for_filtering:
+            return None
+        return offsets
+
+    @staticmethod
+    def _add_result_spans(second_pass_result, new_spans: list):
+        """새 적발 구간을 더하고 마스킹 텍스트를 한 번에 다시 만듭니다."""
+        if not new_spans:
+            return
+        second_pass_result.spans = add_spans(second_pass_result.spans, new_spans)
+        second_pass_result.text_for_filtering, _ = render_filter_text(
+            second_pass_result.original_text, second_pass_result.spans
+        )
+
+    def _apply_basic_scores(self, second_pass_result, positions, scores):
+        """
+        [Basic 모듈 결과 반영 담당] 임계값을 넘은 단어를 적발 목록과 적발 구간(마스킹 텍스트)에 반영합니다.
+        positions는 현재 text_for_filtering 기준 (단어, 위치) 리스트입니다.
+        """
+        offsets = self._span_offsets(second_pass_result)
+
+        new_spans = []
+        for (word, start), score in zip(positions, scores):
+            if score >= self.basic_threshold:
+                second_pass_result.status = "FILTERED_BY_SECOND_PASS"
+                second_pass_result.detected_words.append({
+                    "word": word,
+                    "type": "AI_BASIC"
+                })
+                if offsets is not None:
+                    span = span_from_filter_range(offsets, start, start + len(word), "AI_BASIC", "BASIC_MODULE")
+                    if span is not None:
+                        new_spans.append(span)
+                else:
+                    second_pass_result.text_for_filtering = second_pass_result.text_for_filtering.replace(word, "__S__")
+
+        self._add_result_spans(second_pass_result, new_spans)
+
+    def _verdict_cache_key(self, text: str):
+        if self.verdict_cache is None:
+            return None
+        return make_verdict_key(text, self.basic_ai_module, self.special_ai_modules, self.llm_model)
+
+    def _store_verdict(self, cache_key, gpt_response: dict):
+        # 정상 응답만 캐시에 저장 (API 실패/키 누락 응답은 저장하지 않음)
+        if cache_key is not None and self.client is not None and 'detected_items' in gpt_response:
+            self.verdict_cache.put(cache_key, gpt_response)
+
+    def _store_verdicts(self, pairs: list):
+        """(캐시 키, 판정) 리스트를 한 번에 저장합니다."""
+        for cache_key, gpt_response in pairs:
+            self._store_verdict(cache_key, gpt_response)
+
+    def _lookup_verdict(self, text: str):
+        """캐시 키와 캐시된 판정 결과(없으면 None)를 반환합니다."""
+        cache_key = self._verdict_cache_key(text)
+        if cache_key is None:
+            return None, None
+        return cache_key, self.verdict_cache.get(cache_key)
+
+    async def _arun_cache(self, func, *args):
+        """(비동기 경로) 캐시 조회/저장 작업을 캐시 전용 스레드에서 실행합니다. 캐시가 없으면 바로 실행합니다."""
+        if self._cache_executor is None:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cache_executor, functools.partial(func, *args))
+
+    def _get_llm_verdict(self, text: str) -> dict:
+        """
+        [LLM 판정 담당] 캐시 조회 → 프롬프트 생성 → API 호출 순으로 판정 결과를 얻습니다.
+        """
+        # 1. 캐시 조회 (적중 시 LLM 호출 생략)
+        cache_key, cached = self._lookup_verdict(text)
+        if cached is not None:
+            return cached
+
+        # 2. 프롬프트 생성
+        prompt_text = self._construct_prompt(text)
+        
+        # 3. API 호출
+        gpt_response = self._call_openai_api(prompt_text)
+        self._store_verdict(cache_key, gpt_response)
+        return gpt_response
+
+    async def _get_llm_verdict_async(self, text: str) -> dict:
+        """
+        [LLM 판정 담당] _get_llm_verdict의 비동기 버전입니다.
+        """
+        cache_key, cached = await self._arun_cache(self._lookup_verdict, text)
+        if cached is not None:
+            return cached
+
+        gpt_response = await self._call_openai_api_async(self._construct_prompt(text))
+        await self._arun_cache(self._store_verdict, cache_key, gpt_response)
+        return gpt_response
+
+    def _prepare_packed(self, texts: list):
+        """
+        [묶음 판정 준비 담당] 캐시 조회와 중복 제거 후 묶음 구성을 반환합니다.
+        반환값: (이미 확정된 {텍스트: 판정}, {텍스트: 캐시 키}, {id: 텍스트}, 묶음 리스트)
+        """
+        verdicts = {}
+        cache_keys = {}
+        pending = []
+
+        for text in dict.fromkeys(texts):
+            cache_key, cached = self._lookup_verdict(text)
+            cache_keys[text] = cache_key
+            if cached is not None:
+                verdicts[text] = cached
+            else:
+                pending.append(text)
+
+        if pending and self.client is None:
+            for text in pending:
+                verdicts[text] = dict(API_KEY_MISSING_RESPONSE)
+            pending = []
+
+        id_to_text = {f"c{idx}": text for idx, text in enumerate(pending)}
+        packs = self._pack_items(id_to_text) if id_to_text else []
+        return verdicts, cache_keys, id_to_text, packs
+
+    def _collect_pack_response(self, pack: dict, response: dict, id_to_text: dict, cache_keys: dict, verdicts: dict) -> list:
+        """
+        [묶음 응답 반영 담당] 해석에 성공한 항목은 verdicts와 캐시에 저장하고, 단건 재판정할 id 리스트를 반환합니다.
+        묶음 호출 자체가 실패한 경우(공급자 장애, results 목록이 없는 응답)에는 묶음 전체에 실패 응답을 그대로 쓰고
+        재판정하지 않습니다. (실패한 호출 1번이 단건 호출 N번으로 불어나지 않도록)
+        """
+        if not isinstance(response, dict) or not isinstance(response.get('results'), list):
+            for item_id in pack:
+                verdicts[id_to_text[item_id]] = dict(response) if isinstance(response, dict) else {}
+            return []
+
+        parsed = self._parse_batch_response(response, pack)
+        failed_ids = []
+
+        for item_id in pack:
+            if item_id in parsed:
+                text = id_to_text[item_id]
+                verdicts[text] = parsed[item_id]
+                self._store_verdict(cache_keys[text], parsed[item_id])
+            else:
+                failed_ids.append(item_id)
+        return failed_ids
+
+    def _collect_pack_responses(self, packs: list, responses: list, id_to_text: dict, cache_keys: dict, verdicts: dict) -> list:
+        """여러 묶음의 응답을 _collect_pack_response로 반영하고, 단건 재판정할 id 리스트를 모아 반환합니다."""
+        failed_ids = []
+        for pack, response in zip(packs, responses):
+            failed_ids.extend(self._collect_pack_response(pack, response, id_to_text, cache_keys, verdicts))
+        return failed_ids
+
+    def _get_llm_verdicts_packed(self, texts: list) -> dict:
+        """
+        [LLM 묶음 판정 담당] 여러 텍스트의 판정 결과를 {텍스트: 판정} 형태로 반환합니다.
+        캐시에 없는 텍스트만 토큰 예산에 맞춰 묶어서 요청하고,
+        묶음 응답은 받았지만 결과가 빠졌거나 형식이 잘못된 항목만 단건 호출로 다시 판정합니다.
+        """
+        # 1. 캐시 조회 및 중복 제거
+        verdicts, cache_keys, id_to_text, packs = self._prepare_packed(texts)
+
+        # 2. 토큰 예산 단위로 묶어서 요청
+        failed_ids = []
+        for pack in packs:
+            if len(pack) == 1:
+                failed_ids.extend(pack.keys())
+                continue
+
+            response = self._call_openai_api(self._construct_batch_prompt(pack))
+            failed_ids.extend(self._collect_pack_response(pack, response, id_to_text, cache_keys, verdicts))
+
+        # 3. 응답에서 빠진 항목은 단건 호출로 대체
+        for item_id in failed_ids:
+            text = id_to_text[item_id]
+            gpt_response = self._call_openai_api(self._construct_prompt(text))
+            self._store_verdict(cache_keys[text], gpt_response)
+            verdicts[text] = gpt_response
+
+        return verdicts
+
+    async def _get_llm_verdicts_packed_async(self, texts: list) -> dict:
+        """
+        [LLM 묶음 판정 담당] _get_llm_verdicts_packed의 비동기 버전입니다.
+        묶음 요청과 단건 대체 요청을 동시 호출 제한 안에서 병렬로 보냅니다.
+        캐시 조회/저장은 단계별로 모아 캐시 전용 스레드에서 실행합니다.
+        """
+        verdicts, cache_keys, id_to_text, packs = await self._arun_cache(self._prepare_packed, texts)
+
+        failed_ids = [item_id for pack in packs if len(pack) == 1 for item_id in pack]
+        multi_packs = [pack for pack in packs if len(pack) > 1]
+
+        responses = await asyncio.gather(
+            *(self._call_openai_api_async(self._construct_batch_prompt(pack)) for pack in multi_packs)
+        )
+        failed_ids.extend(await self._arun_cache(
+            self._collect_pack_responses, multi_packs, responses, id_to_text, cache_keys, verdicts
+        ))
+
+        single_responses = await asyncio.gather(
+            *(self._call_openai_api_async(self._construct_prompt(id_to_text[item_id])) for item_id in failed_ids)
+        )
+        stored = []
+        for item_id, gpt_response in zip(failed_ids, single_responses):
+            text = id_to_text[item_id]
+            stored.append((cache_keys[text], gpt_response))
+            verdicts[text] = gpt_response
+        await self._arun_cache(self._store_verdicts, stored)
+
+        return verdicts
+
+    def _apply_llm_response(self, second_pass_result, gpt_response: dict):
+        """
+        [LLM 결과 반영 담당] 판정 결과의 적발 항목을 적발 목록과 마스킹 텍스트에 반영합니다.
+        """
+        ai_detected_items = gpt_response.get('detected_items', [])
+        
+        if ai_detected_items:
+            second_pass_result.status = "FILTERED_BY_SECOND_PASS"
+            offsets = self._span_offsets(second_pass_result)
+            current_text = second_pass_result.text_for_filtering
+            new_spans = []
+
+            for item in ai_detected_items:
+                word = item.get('keyword', '')
+                category = item.get('category', 'DETECTED')
+                
+                if word:
+                    span_type = f"AI_{category.upper()}"
+                    # 리스트에 추가
+                    second_pass_result.detected_words.append({
+                        "word": word,
+                        "type": span_type
+                    })
+                    
+                    if offsets is not None:
+                        # 판정 대상 텍스트에서 단어가 나타난 구간을 원문 구간으로 변환
+                        start = current_text.find(word)
+                        while start >= 0:
+                            span = span_from_filter_range(offsets, start, start + len(word), span_type, "LLM")
+                            if span is not None:
+                                new_spans.append(span)
+                            start = current_text.find(word, start + len(word))
+                    else:
+                        # 텍스트 수정
+                        second_pass_result.text_for_filtering = second_pass_result.text_for_filtering.replace(word, "__S__")
+
+            self._add_result_spans(second_pass_result, new_spans)
+
+    def _run_llm_stage(self, second_pass_result):
+        """
+        [LLM 단계 담당] 판정 결과를 얻어 반영합니다.
+        """
+        gpt_response = self._get_llm_verdict(second_pass_result.text_for_filtering)
+        self._apply_llm_response(second_pass_result, gpt_response)
+        self._mark_stage(second_pass_result, "LLM")
+
+    @staticmethod
+    def _mark_stage(second_pass_result, stage: str):
+        """실행된 단계를 결과에 기록합니다."""
+        second_pass_result.stages_run.append(stage)
+
+    def _count_cascade(self, key: str):
+        """단계적 판정 통계 갱신 (CPU 스레드 풀과 이벤트 루프에서 동시에 호출됨)"""
+        with self._cascade_lock:
+            self.cascade_stats[key] += 1
+
+    def _cascade_snapshot(self) -> dict:
+        with self._cascade_lock:
+            return dict(self.cascade_stats)
+
+    def _should_call_llm(self, second_pass_result) -> bool:
+        """
+        [단계적 판정 담당] 1차 필터 + Basic 모듈 결과로 중간 위험도를 계산하여
+        현재 보안 레벨의 불확실 구간 [하한, 상한)에 있을 때만 LLM을 호출합니다.
+        """
+        if not config.CASCADE_ENABLED:
+            self._count_cascade("llm_called")
+            return True
+
+        low, high = config.CASCADE_BANDS.get(config.SECURITY_LEVEL, (0.0, 1.01))
+        interim_risk = self.risk_scorer.execute(second_pass_result)
+
+        if interim_risk < low:
+            self._count_cascade("skipped_low")
+        elif interim_risk >= high:
+            self._count_cascade("skipped_high")
+        else:
+            self._count_cascade("llm_called")
+            return True
+
+        self._mark_stage(second_pass_result, "LLM_SKIPPED")
+        return False
+
+    def _run_basic_stage(self, second_pass_result):
+        """
+        [Basic 단계 담당] 댓글 하나의 후보 단어를 배치로 점수화하여 반영합니다.
+        """
+        if self.basic_module is None:
+            return
+
+        current_text = second_pass_result.text_for_filtering
+        positions = self._candidate_positions(current_text)
+        scores = self._score_candidates([current_text], [positions])[0]
+        self._apply_basic_scores(second_pass_result, positions, scores)
+        self._mark_stage(second_pass_result, "BASIC_MODULE")
+
+    def _run_basic_stage_batch(self, first_pass_results: list):
+        """
+        [Basic 단계 묶음 담당] 모든 댓글의 후보 단어를 모아 대형 배치로 한 번에 점수화한 뒤 댓글별로 반영합니다.
+        """
+        if self.basic_module is None:
+            return
+
+        # 1. 댓글별 후보 단어 수집
+        texts = [res.text_for_filtering for res in first_pass_results]
+        positions_per_result = [[] for _ in first_pass_results]
+        for idx, text in enumerate(texts):
+            try:
+                positions_per_result[idx] = self._candidate_positions(text)
+            except Exception as e:
+                print(f"2차 필터 토큰화 에러: {e}")
+
+        # 2. 전체 댓글을 배치 단위로 한 번에 점수화
+        try:
+            scores_per_result = self._score_candidates(texts, positions_per_result)
+        except Exception as e:
+            print(f"2차 필터 배치 추론 에러: {e}")
+            scores_per_result = [[0.0] * len(positions) for positions in positions_per_result]
+
+        # 3. 댓글별로 점수 반영
+        for res, positions, scores in zip(first_pass_results, positions_per_result, scores_per_result):
+            try:
+                self._apply_basic_scores(res, positions, scores)
+                self._mark_stage(res, "BASIC_MODULE")
+            except Exception as e:
+                print(f"2차 필터 에러: {e}")
 
     def execute(self, first_pass_result):
         """
-        메인 실행 함수
+        메인 실행 함수 (FilterResult를 받으면 FilterResult, dict를 받으면 dict를 반환)
         """
-        second_pass_result = first_pass_result
+        second_pass_result = as_result(first_pass_result)
 
         try:
             # 1. Basic 모듈 처리
-            if self.basic_module is not None:
-                current_text = second_pass_result.get("text_for_filtering", "")
-                tokens = self._tokenize_for_module(current_text)
-
-                for word in tokens:
-                    score = self._call_basic_module(word)
-                    if score >= self.basic_threshold:
-                        second_pass_result['status'] = "FILTERED_BY_SECOND_PASS"
-                        second_pass_result["detected_words"].append({
-                            "word": word,
-                            "type": "AI_BASIC"
-                        })
-                        second_pass_result["text_for_filtering"] = second_pass_result["text_for_filtering"].replace(word, "__S__")
-
-            # 2. 프롬프트 생성
-            prompt_text = self._construct_prompt(second_pass_result.get('text_for_filtering', ''))
-            
-            # 3. API 호출
-            gpt_response = self._call_openai_api(prompt_text)
+            self._run_basic_stage(second_pass_result)
 
-            # 4. 결과 처리
-            ai_detected_items = gpt_response.get('detected_items', [])
-            
-            if ai_detected_items:
-                second_pass_result['status'] = "FILTERED_BY_SECOND_PASS"
+            # 2. LLM 처리 (Cascade 사용 시 불확실한 댓글만)
+            if self._should_call_llm(second_pass_result):
+                self._run_llm_stage(second_pass_result)
 
-                for item in ai_detected_items:
-                    word = item.get('keyword', '')
-                    category = item.get('category', 'DETECTED')
-                    
-                    if word:
-                        # 리스트에 추가
-                        second_pass_result['detected_words'].append({
-                            "word": word,
-                            "type": f"AI_{category.upper()}"
-                        })
-                        
-                        # 텍스트 수정
-                        second_pass_result['text_for_filtering'] = second_pass_result['text_for_filtering'].replace(word, "__S__")
+            return match_input(first_pass_result, second_pass_result)
+
+        except Exception as e:
+            print(f"2차 필터 에러: {e}")
+            return first_pass_result
+
+    async def execute_async(self, first_pass_result):
+        """
+        메인 실행 함수의 비동기 버전.
+        Basic 모듈(CPU 작업)은 스레드에서, LLM 호출은 이벤트 루프에서 비동기로 실행합니다.
+        """
+        second_pass_result = as_result(first_pass_result)
+
+        try:
+            # 1. Basic 모듈 처리
+            await asyncio.to_thread(self._run_basic_stage, second_pass_result)
 
-            return second_pass_result
+            # 2. LLM 처리 (Cascade 사용 시 불확실한 댓글만)
+            if self._should_call_llm(second_pass_result):
+                gpt_response = await self._get_llm_verdict_async(second_pass_result.text_for_filtering)
+                self._apply_llm_response(second_pass_result, gpt_response)
+                self._mark_stage(second_pass_result, "LLM")
+
+            return match_input(first_pass_result, second_pass_result)
 
         except Exception as e:
             print(f"2차 필터 에러: {e}")
             return first_pass_result
+
+    def execute_batch(self, first_pass_results: list) -> list:
+        """
+        여러 댓글을 한 번에 처리하는 실행 함수.
+        모든 댓글의 Basic 모듈 후보 단어를 모아 대형 배치로 한 번에 점수화한 뒤,
+        댓글별로 결과를 반영합니다. LLM 단계는 여러 댓글을 묶은 프롬프트로 처리합니다. (입력 순서 유지)
+        """
+        if not first_pass_results:
+            return []
+        results = [as_result(res) for res in first_pass_results]
+
+        # 1. Basic 모듈 처리
+        self._run_basic_stage_batch(results)
+
+        # 2. LLM 처리 (Cascade 사용 시 불확실한 댓글만, 묶음 프롬프트 또는 댓글별 호출)
+        llm_targets = [res for res in results if self._should_call_llm(res)]
+
+        if config.LLM_PACK_ENABLED:
+            try:
+                texts = [res.text_for_filtering for res in llm_targets]
+                verdicts = self._get_llm_verdicts_packed(texts)
+                for res, text in zip(llm_targets, texts):
+                    self._apply_llm_response(res, verdicts.get(text, {}))
+                    self._mark_stage(res, "LLM")
+            except Exception as e:
+                print(f"2차 필터 LLM 묶음 처리 에러: {e}")
+        else:
+            for res in llm_targets:
+                try:
+                    self._run_llm_stage(res)
+                except Exception as e:
+                    print(f"2차 필터 에러: {e}")
+
+        return [match_input(src, res) for src, res in zip(first_pass_results, results)]
+
+    async def execute_batch_async(self, first_pass_results: list) -> list:
+        """
+        execute_batch의 비동기 버전. LLM 요청들은 동시 호출 제한 안에서 병렬로 보냅니다.
+        """
+        if not first_pass_results:
+            return []
+        results = [as_result(res) for res in first_pass_results]
+
+        # 1. Basic 모듈 처리 (CPU 작업이므로 스레드에서 실행)
+        await asyncio.to_thread(self._run_basic_stage_batch, results)
+
+        # 2. LLM 처리 (Cascade 사용 시 불확실한 댓글만)
+        llm_targets = [res for res in results if self._should_call_llm(res)]
+        texts = [res.text_for_filtering for res in llm_targets]
+        try:
+            if config.LLM_PACK_ENABLED:
+                verdicts = await self._get_llm_verdicts_packed_async(texts)
+            else:
+                unique_texts = list(dict.fromkeys(texts))
+                responses = await asyncio.gather(*(self._get_llm_verdict_async(text) for text in unique_texts))
+                verdicts = dict(zip(unique_texts, responses))
+
+            for res, text in zip(llm_targets, texts):
+                self._apply_llm_response(res, verdicts.get(text, {}))
+                self._mark_stage(res, "LLM")
+        except Exception as e:
+            print(f"2차 필터 LLM 묶음 처리 에러: {e}")
+
+        return [match_input(src, res) for src, res in zip(first_pass_results, results)]
         
         
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+import re
+
+# 1차 필터 정규화에서 남기는 문자 (완성형/자모 한글, 영문, 숫자, 공백)
+_KEEP_RUN = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣa-zA-Z0-9\s]+')
+
+# 적발 유형별 마스킹 토큰 (여기에 없는 유형은 2차 필터 적발로 보고 __S__ 사용)
+PLACEHOLDERS = {
+    "WHITELIST": "__W__",
+    "USER_BLACKLIST": "__B__",
+    "SYSTEM_KEYWORD": "__F__",
+    "SYSTEM_VARIANT": "__F__",
+}
+SECOND_PASS_PLACEHOLDER = "__S__"
+
+# 위험도/최종 마스킹에서 제외하는 유형
+SAFE_TYPES = {"WHITELIST"}
+
+
+def placeholder_for(span_type: str) -> str:
+    return PLACEHOLDERS.get(span_type, SECOND_PASS_PLACEHOLDER)
+
+
+def make_span(start: int, end: int, span_type: str, source_stage: str) -> dict:
+    """원문 기준 [start, end) 구간의 적발 정보를 만듭니다."""
+    return {"start": start, "end": end, "type": span_type, "source_stage": source_stage}
+
+
+def normalize_with_offsets(text: str, start: int = 0, end: int = None) -> tuple:
+    """
+    text[start:end]를 1차 필터 방식으로 정규화(소문자화 + 허용 문자만 유지)하고,
+    정규화된 각 문자가 원문의 몇 번째 문자였는지를 함께 반환합니다.
+    """
+    end = len(text) if end is None else end
+    segment = text[start:end]
+    lowered = segment.lower()
+
+    chars = []
+    offsets = []
+    if len(lowered) == len(segment):
+        for match in _KEEP_RUN.finditer(lowered):
+            chars.append(match.group())
+            offsets.extend(range(start + match.start(), start + match.end()))
+        return "".join(chars), offsets
+
+    # 소문자화로 길이가 바뀌는 문자가 있으면 문자 단위로 처리
+    for idx in range(start, end):
+        for char in text[idx].lower():
+            if _KEEP_RUN.match(char):
+                chars.append(char)
+                offsets.append(idx)
+    return "".join(chars), offsets
+
+
+def sorted_spans(spans) -> list:
+    return sorted(spans, key=lambda span: (span["start"], -span["end"]))
+
+
+def add_spans(spans: list, new_spans) -> list:
+    """기존 구간과 겹치지 않는 새 구간만 추가하여 시작 위치 순으로 정렬된 리스트를 반환합니다."""
+    merged = list(spans)
+    for span in new_spans:
+        if span["start"] >= span["end"]:
+            continue
+        if any(span["start"] < other["end"] and other["start"] < span["end"] for other in merged):
+            continue
+        merged.append(span)
+    return sorted_spans(merged)
+
+
+def render_filter_text(original_text: str, spans) -> tuple:
+    """
+    원문과 적발 구간으로 필터링용 텍스트(정규화 + 마스킹 토큰)를 한 번의 선형 탐색으로 만듭니다.
+    반환값은 (텍스트, 텍스트의 각 문자가 가리키는 원문 위치 리스트)이며, 마스킹 토큰 문자의 위치는 None입니다.
+    """
+    pieces = []
+    offsets = []
+    cursor = 0
+    for span in sorted_spans(spans):
+        if span["start"] < cursor:
+            continue
+        gap, gap_offsets = normalize_with_offsets(original_text, cursor, span["start"])
+        pieces.append(gap)
+        offsets.extend(gap_offsets)
+
+        placeholder = placeholder_for(span["type"])
+        pieces.append(placeholder)
+        offsets.extend([None] * len(placeholder))
+        cursor = span["end"]
+
+    tail, tail_offsets = normalize_with_offsets(original_text, cursor)
+    pieces.append(tail)
+    offsets.extend(tail_offsets)
+    return "".join(pieces), offsets
+
+
+def span_from_filter_range(offsets: list, start: int, end: int, span_type: str, source_stage: str):
+    """필터링용 텍스트의 [start, end) 구간을 원문 구간으로 바꿉니다. 마스킹 토큰에 걸치면 None을 반환합니다."""
+    if start >= end or any(offsets[idx] is None for idx in range(start, end)):
+        return None
+    return make_span(offsets[start], offsets[end - 1] + 1, span_type, source_stage)
+
+
+def render_masked(original_text: str, spans, mask_char: str = "*") -> str:
+    """적발 구간(허용 단어 제외)을 원문 길이 그대로 mask_char로 가린 텍스트를 한 번의 선형 탐색으로 만듭니다."""
+    pieces = []
+    cursor = 0
+    for span in sorted_spans(spans):
+        if span["type"] in SAFE_TYPES or span["start"] < cursor:
+            continue
+        pieces.append(original_text[cursor:span["start"]])
+        pieces.append(mask_char * (span["end"] - span["start"]))
+        cursor = span["end"]
+    pieces.append(original_text[cursor:])
+    return "".join(pieces)
@@ -0,0 +1,129 @@
+import re
+from abc import ABC, abstractmethod
+
+
+class Tokenizer(ABC):
+    """
+    1차 필터용 토크나이저 인터페이스.
+    1차 필터는 사전 매칭 시 토큰 경계만 사용하므로, pos()는 원문에 나타나는 순서대로
+    (토큰, 품사) 튜플 리스트를 반환하기만 하면 됩니다. 토큰은 입력 텍스트의 부분 문자열이어야 합니다.
+    """
+
+    name = "base"
+    uses_lexicon = False  # set_lexicon()으로 받은 사전에 따라 분절 결과가 달라지는지 여부
+
+    @abstractmethod
+    def pos(self, text: str) -> list:
+        """원문 순서대로 (토큰, 품사) 튜플 리스트를 반환합니다."""
+
+    def set_lexicon(self, words):
+        """분절에 참고할 사전 단어를 설정합니다. 자체 사전을 쓰는 백엔드는 무시합니다."""
+        pass
+
+
+class OktTokenizer(Tokenizer):
+    """KoNLPy Okt 형태소 분석기 (JVM 필요)"""
+
+    name = "okt"
+
+    def __init__(self):
+        # JVM 기동 비용이 크므로 이 백엔드를 선택했을 때만 임포트
+        from konlpy.tag import Okt
+        self.okt = Okt()
+
+    def pos(self, text: str) -> list:
+        return self.okt.pos(text)
+
+
+class RegexTokenizer(Tokenizer):
+    """
+    JVM 없이 동작하는 정규식/음절 기반 분절기.
+    문자 종류(완성형 한글, 자모, 영문, 숫자)가 바뀌는 곳에서 자르고,
+    한글 어절은 사전 단어를 왼쪽부터 최장 일치로 떼어낸 뒤(시발새끼야 → 시발 + 새끼 + 야),
+    남은 부분 끝의 흔한 조사/어미를 별도 토큰으로 분리합니다. (병신아 → 병신 + 아)
+    예외 문맥 구문(시발점, 고양이새끼 등)도 사전에 넣어 두면 한 덩어리로 유지됩니다.
+    """
+
+    name = "regex"
+    uses_lexicon = True
+
+    _CHUNK = re.compile(r"[가-힣]+|[ㄱ-ㅎㅏ-ㅣ]+|[a-zA-Z]+|[0-9]+")
+
+    # 길이가 긴 것부터 대조 (에게서 → 에게 보다 먼저)
+    SUFFIXES = sorted([
+        "이", "가", "은", "는", "을", "를", "의", "에", "도", "만", "아", "야", "와", "과", "로", "랑",
+        "으로", "에서", "에게", "한테", "까지", "부터", "처럼", "보다", "이랑", "하고", "이나", "이고", "이야",
+        "이다", "이냐", "이네", "이지", "이라", "들", "들아", "들이", "들은", "들도", "에게서", "한테서",
+    ], key=len, reverse=True)
+
+    def __init__(self, min_stem: int = 1):
+        self.min_stem = max(1, min_stem)
+        self._lexicon = set()
+        self._max_word_len = 0
+
+    def set_lexicon(self, words):
+        # 완성형 한글로만 이루어진 단어만 분절에 사용
+        self._lexicon = {w for w in words if w and all("가" <= c <= "힣" for c in w)}
+        self._max_word_len = max((len(w) for w in self._lexicon), default=0)
+
+    def _segment(self, chunk: str) -> list:
+        tokens = []
+        unknown_start = 0
+        idx = 0
+        while idx < len(chunk):
+            word_len = 0
+            # 1음절 단어는 어절 첫머리에서만 떼어냄 (작년 → 작 + 년 방지)
+            min_len = 1 if idx == 0 else 2
+            for length in range(min(self._max_word_len, len(chunk) - idx), min_len - 1, -1):
+                if chunk[idx:idx + length] in self._lexicon:
+                    word_len = length
+                    break
+            if not word_len:
+                idx += 1
+                continue
+            if unknown_start < idx:
+                tokens.extend(self._split_suffix(chunk[unknown_start:idx]))
+            tokens.append((chunk[idx:idx + word_len], "Noun"))
+            idx += word_len
+            unknown_start = idx
+        if unknown_start < len(chunk):
+            tokens.extend(self._split_suffix(chunk[unknown_start:]))
+        return tokens
+
+    def _split_suffix(self, chunk: str) -> list:
+        if chunk in self.SUFFIXES:
+            return [(chunk, "Josa")]
+        for suffix in self.SUFFIXES:
+            if len(chunk) - len(suffix) >= self.min_stem and chunk.endswith(suffix):
+                return [(chunk[:-len(suffix)], "Noun"), (suffix, "Josa")]
+        return [(chunk, "Noun")]
+
+    def pos(self, text: str) -> list:
+        tokens = []
+        for match in self._CHUNK.finditer(text):
+            chunk = match.group()
+            first = chunk[0]
+            if "가" <= first <= "힣":
+                tokens.extend(self._segment(chunk) if self._lexicon else self._split_suffix(chunk))
+            elif "ㄱ" <= first <= "ㅣ":
+                tokens.append((chunk, "KoreanParticle"))
+            elif first.isdigit():
+                tokens.append((chunk, "Number"))
+            else:
+                tokens.append((chunk, "Alpha"))
+        return tokens
+
+
+TOKENIZERS = {
+    OktTokenizer.name: OktTokenizer,
+    RegexTokenizer.name: RegexTokenizer,
+}
+
+
+def create_tokenizer(name: str) -> Tokenizer:
+    """이름으로 토크나이저를 생성합니다. 알 수 없는 이름이면 Okt를 사용합니다."""
+    tokenizer_cls = TOKENIZERS.get((name or "").lower())
+    if tokenizer_cls is None:
+        print(f"[WARNING] 알 수 없는 토크나이저 '{name}', okt를 사용합니다.")
+        tokenizer_cls = OktTokenizer
+    return tokenizer_cls()
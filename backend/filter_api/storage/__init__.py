@@ -0,0 +1 @@
+from .comment_store import CommentStore, make_config_version, text_hash
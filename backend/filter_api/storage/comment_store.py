@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+def make_config_version(settings: dict) -> str:
+    """
+    판정 결과에 영향을 주는 설정(보안 레벨, 임계값, 활성 모듈, 사전 해시, 모델 식별자 등)으로 설정 버전을 만듭니다.
+    저장된 결과의 버전이 현재 버전과 다르면 해당 결과는 다시 분석합니다.
+    """
+    payload = json.dumps(settings, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def text_hash(text: str) -> str:
+    """댓글 원문 해시 (수정된 댓글 판별용)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class CommentStore:
+    """
+    SQLite 기반 영상별 댓글 분석 결과 저장소.
+    - comments: 댓글 ID별 원본 댓글, 분석 요약, 원문 해시, 결과를 만든 설정 버전
+    - videos: 영상별 워터마크(연속으로 수집을 마친 가장 최근 댓글의 작성 시각)
+    재분석 시에는 워터마크보다 새 댓글과 원문/설정 버전이 바뀐 댓글만 분석하고 나머지는 저장된 결과를 그대로 사용합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self.reused = 0
+        self.analyzed = 0
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS comments (
+                video_id TEXT NOT NULL,
+                comment_id TEXT NOT NULL,
+                published_at TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                config_version TEXT NOT NULL,
+                comment TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (video_id, comment_id)
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS videos (
+                video_id TEXT PRIMARY KEY,
+                watermark TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def load_video(self, video_id: str):
+        """
+        영상의 워터마크와 저장된 댓글을 반환합니다.
+        반환값: (watermark 또는 None, {comment_id: {"text_hash", "config_version", "comment", "summary"}})
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT watermark FROM videos WHERE video_id = ?", (video_id,)).fetchone()
+            rows = self._conn.execute(
+                "SELECT comment_id, text_hash, config_version, comment, summary FROM comments WHERE video_id = ?",
+                (video_id,),
+            ).fetchall()
+
+        stored = {}
+        for comment_id, hashed, version, comment, summary in rows:
+            try:
+                stored[comment_id] = {
+                    "text_hash": hashed,
+                    "config_version": version,
+                    "comment": json.loads(comment),
+                    "summary": json.loads(summary),
+                }
+            except ValueError:
+                continue
+        return (row[0] if row else None), stored
+
+    def save_video(self, video_id: str, entries: list, config_version: str, watermark: str = None):
+        """
+        새로 분석한 댓글들과 워터마크를 한 트랜잭션으로 저장합니다.
+        entries: [(comment dict, summary dict), ...]
+        """
+        now = time.time()
+        rows = [
+            (
+                video_id,
+                comment["comment_id"],
+                comment["published_at"],
+                text_hash(comment["text_original"]),
+                config_version,
+                json.dumps(comment, ensure_ascii=False),
+                json.dumps(summary, ensure_ascii=False),
+                now,
+            )
+            for comment, summary in entries
+        ]
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO comments "
+                    "(video_id, comment_id, published_at, text_hash, config_version, comment, summary, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                if watermark is not None:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO videos (video_id, watermark, updated_at) VALUES (?, ?, ?)",
+                        (video_id, watermark, now),
+                    )
+
+    def delete_video(self, video_id: str) -> int:
+        """영상의 저장 결과를 모두 삭제하고 삭제된 댓글 수를 반환합니다."""
+        with self._lock:
+            with self._conn:
+                removed = self._conn.execute("DELETE FROM comments WHERE video_id = ?", (video_id,)).rowcount
+                self._conn.execute("DELETE FROM videos WHERE video_id = ?", (video_id,))
+        return removed
+
+    def record(self, reused: int, analyzed: int):
+        """재사용/재분석한 댓글 수를 통계에 반영합니다."""
+        with self._lock:
+            self.reused += reused
+            self.analyzed += analyzed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            comments = self._conn.execute("SELECT COUNT(*) FROM comments").fetchone()[0]
+            videos = self._conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+            reused, analyzed = self.reused, self.analyzed
+        total = reused + analyzed
+        return {
+            "videos": videos,
+            "comments": comments,
+            "reused": reused,
+            "analyzed": analyzed,
+            "reuse_rate": round(reused / total, 4) if total else 0.0,
+        }
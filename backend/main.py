@@ -1,19 +1,26 @@
 import sys
 import os
+import json
+import time
+import asyncio
 from typing import List, Optional, Dict, Any
 from dotenv import set_key, find_dotenv
 
-from fastapi import FastAPI, HTTPException, Body, Query
+from fastapi import FastAPI, HTTPException, Body, Query, Request
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from starlette.middleware.cors import CORSMiddleware
 
 try:
     from config import config
     from filter_api.core.first_pass_filter import FirstPassFilter
+    from filter_api.core.first_pass_pool import FirstPassWorkerPool
     from filter_api.core.second_pass_filter import SecondPassFilter
     from filter_api.core.risk_scorer import RiskScorer
     from filter_api.core.policy_manager import PolicyManager
+    from filter_api.core.execution import ExecutionLayer, ServerBusyError, AdmittedStreamingResponse
     from filter_api.clients.youtube_client import YouTubeClient
+    from filter_api.storage import CommentStore, make_config_version, text_hash
 except ImportError as e:
     print(f"[System] 필수 모듈 임포트 실패: {e}")
     sys.exit(1)
@@ -36,15 +43,58 @@ app.add_middleware(
 print("[System] 모듈 초기화 중...")
 try:
     first_filter = FirstPassFilter()
-    second_filter = SecondPassFilter()
     risk_scorer = RiskScorer()
+    second_filter = SecondPassFilter(risk_scorer=risk_scorer)
     policy_manager = PolicyManager()
     yt_client = YouTubeClient()
+    executor = ExecutionLayer(
+        cpu_workers=config.CPU_WORKERS or os.cpu_count() or 1,
+        io_workers=config.IO_WORKERS,
+        max_inflight=config.ANALYSIS_MAX_INFLIGHT,
+        max_queue=config.ANALYSIS_MAX_QUEUE,
+        retry_after=config.ANALYSIS_RETRY_AFTER,
+    )
+    comment_store = CommentStore(config.COMMENT_STORE_PATH) if config.COMMENT_STORE_ENABLED else None
     print("[System] 서버 준비 완료.")
 except Exception as e:
     print(f"[System] 초기화 중 오류 발생: {e}")
     sys.exit(1)
 
+# 1차 필터 워커 프로세스는 모듈 임포트가 아닌 서버 시작 시점에 띄움 (spawn된 워커가 이 모듈을 다시 읽어도 재귀 생성되지 않도록)
+first_pool = None
+
+@app.on_event("startup")
+def start_first_pass_pool():
+    global first_pool
+    if config.FIRST_PASS_WORKERS > 0:
+        first_pool = FirstPassWorkerPool(first_filter, config.FIRST_PASS_WORKERS, config.FIRST_PASS_CHUNK_SIZE)
+
+@app.on_event("startup")
+async def start_execution_layer():
+    # 2차 필터의 asyncio.to_thread(Basic 모듈 추론)도 크기가 정해진 CPU 스레드 풀을 사용하도록 설정
+    executor.install_default_executor()
+
+@app.on_event("shutdown")
+async def shutdown_modules():
+    """서버 종료 시 1차 필터 워커, 스케줄러 정리, 캐시 저장, LLM 커넥션 풀, 실행 계층 및 댓글 저장소 정리"""
+    if first_pool is not None:
+        first_pool.close()
+    second_filter.close()
+    await second_filter.aclose()
+    await yt_client.aclose()
+    executor.close()
+    if comment_store is not None:
+        comment_store.close()
+
+@app.exception_handler(ServerBusyError)
+async def server_busy_handler(request: Request, exc: ServerBusyError):
+    """분석 요청이 입장 제한과 대기열을 모두 채운 경우 429와 Retry-After로 응답합니다."""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
 
 # =========================================================
 # [Pydantic 모델 정의] - 단계별 엄격한 분리 (Strict Mode)
@@ -94,6 +144,12 @@ class FirstPassDetectedWord(BaseModel):
     word: str = Field(..., description="1차 필터가 잡아낸 단어", json_schema_extra={"example": "개새끼"})
     type: str = Field(..., description="감지 유형 (시스템/사용자 사전)", json_schema_extra={"example": "SYSTEM_KEYWORD"})
 
+class DetectedSpan(BaseModel):
+    start: int = Field(..., description="원문 기준 시작 위치", json_schema_extra={"example": 3})
+    end: int = Field(..., description="원문 기준 끝 위치 (미포함)", json_schema_extra={"example": 6})
+    type: str = Field(..., description="감지 유형", json_schema_extra={"example": "SYSTEM_KEYWORD"})
+    source_stage: str = Field(..., description="적발한 단계 (FIRST_PASS, BASIC_MODULE, LLM)", json_schema_extra={"example": "FIRST_PASS"})
+
 class FirstPassResponse(BaseModel):
     original_text: str = Field(..., json_schema_extra={"example": "야이 개새끼야 ㅋㅋ 니네 집 주소 다 털었다 010-1234-5678 밤길 조심해라"})
     status: str = Field(..., description="1차 필터링 상태", json_schema_extra={"example": "FILTERED_BY_FIRST_PASS"})
@@ -101,7 +157,13 @@ class FirstPassResponse(BaseModel):
         "example": [{"word": "개새끼", "type": "SYSTEM_KEYWORD"}]
     })
     text_for_filtering: str = Field(..., description="1차 마스킹 완료된 텍스트", json_schema_extra={
-        "example": "야이 __F__야 ㅋㅋ 니네 집 주소 다 털었다 010-1234-5678 밤길 조심해라"
+        "example": "야이 __F__야 ㅋㅋ 니네 집 주소 다 털었다 01012345678 밤길 조심해라"
+    })
+    spans: List[DetectedSpan] = Field(default_factory=list, description="원문 기준 적발 구간", json_schema_extra={
+        "example": [{"start": 3, "end": 6, "type": "SYSTEM_KEYWORD", "source_stage": "FIRST_PASS"}]
+    })
+    stages_run: List[str] = Field(default_factory=list, description="실행된 처리 단계", json_schema_extra={
+        "example": ["FIRST_PASS"]
     })
 
 # --- [2차 필터링 결과 모델] ---
@@ -123,6 +185,15 @@ class SecondPassResponse(BaseModel):
     text_for_filtering: str = Field(..., description="2차 마스킹 완료된 텍스트", json_schema_extra={
         "example": "야이 __F__야 ㅋㅋ __S__ __S__ __S__"
     })
+    spans: List[DetectedSpan] = Field(default_factory=list, description="원문 기준 적발 구간 (1차+2차 누적)", json_schema_extra={
+        "example": [
+            {"start": 3, "end": 6, "type": "SYSTEM_KEYWORD", "source_stage": "FIRST_PASS"},
+            {"start": 29, "end": 42, "type": "AI_PRIVACY", "source_stage": "LLM"}
+        ]
+    })
+    stages_run: List[str] = Field(default_factory=list, description="실행된 처리 단계 (LLM_SKIPPED: 단계적 판정으로 LLM 생략)", json_schema_extra={
+        "example": ["FIRST_PASS", "BASIC_MODULE", "LLM"]
+    })
 
 # --- [위험도 계산 및 정책 모델] ---
 
@@ -151,6 +222,8 @@ class AnalysisResult(BaseModel):
 # --- [유튜브 리포트 모델] ---
 
 class YoutubeCommentSummary(BaseModel):
+    comment_id: str
+    parent_id: Optional[str] = Field(None, description="답글이면 최상위 댓글 ID, 최상위 댓글이면 null")
     author: str
     published_at: str
     original: str
@@ -164,6 +237,29 @@ class YoutubeAnalysisResponse(BaseModel):
     stats: Dict[str, int]
     results: List[YoutubeCommentSummary]
 
+# --- [일괄 분석 모델] ---
+
+class BatchTextItem(BaseModel):
+    id: str = Field(..., description="클라이언트가 지정한 항목 ID (응답에 그대로 반환)", json_schema_extra={"example": "msg-1"})
+    text: str = Field(..., json_schema_extra={"example": "야이 개새끼야 ㅋㅋ"})
+
+class BatchAnalysisRequest(BaseModel):
+    items: List[BatchTextItem] = Field(..., max_length=config.BATCH_MAX_ITEMS, description="분석할 텍스트 목록")
+
+class BatchAnalysisItem(AnalysisResult):
+    id: str
+
+class BatchTiming(BaseModel):
+    first_pass_ms: float = Field(..., description="1차 필터 소요 시간")
+    second_pass_ms: float = Field(..., description="2차 필터(Basic 모듈 + LLM) 소요 시간")
+    decision_ms: float = Field(..., description="위험도 계산 + 처분 결정 소요 시간")
+    total_ms: float = Field(..., description="요청 전체 소요 시간 (중복 제거, 응답 구성 포함)")
+
+class BatchAnalysisResponse(BaseModel):
+    stats: Dict[str, int] = Field(..., description="total: 입력 수, unique: 중복 제거 후 분석한 수, blocked: PASS가 아닌 수")
+    timing: BatchTiming
+    results: List[BatchAnalysisItem] = Field(..., description="입력 순서와 동일한 분석 결과")
+
 
 # =========================================================
 # [API 1] 시스템 설정 관리 API (System Config APIs)
@@ -200,7 +296,7 @@ async def add_dictionary_words(req: DictionaryRequest):
         raise HTTPException(status_code=400, detail="list_type 오류")
     
     # 추가 함수 호출 (action='add')
-    added_count = first_filter._update_user_dictionary(req.words, req.list_type, action='add')
+    added_count = await executor.run_cpu(first_filter._update_user_dictionary, req.words, req.list_type, action='add')
     
     return {
         "status": "success",
@@ -221,7 +317,7 @@ async def remove_dictionary_words(req: DictionaryRequest):
         raise HTTPException(status_code=400, detail="list_type 오류")
     
     # 삭제 함수 호출 (action='remove')
-    removed_count = first_filter._update_user_dictionary(req.words, req.list_type, action='remove')
+    removed_count = await executor.run_cpu(first_filter._update_user_dictionary, req.words, req.list_type, action='remove')
     
     return {
         "status": "success",
@@ -282,6 +378,7 @@ async def update_system_config(settings: SystemConfigUpdate):
                 valid_keys.append(key_upper)
         
         config.SPECIAL_AI_MODULES = new_modules
+        second_filter.update_modules(new_modules)
         modules_str = ",".join(valid_keys)
         set_key(dotenv_file, "ENABLED_MODULES", modules_str) 
         updated_fields["enabled_modules"] = valid_keys
@@ -297,6 +394,34 @@ async def update_system_config(settings: SystemConfigUpdate):
     }           
 
 
+@app.get("/api/system/metrics", summary="내부 처리 통계 조회")
+async def get_system_metrics():
+    """1차 필터 카테고리별 적발 통계, 추론 스케줄러 등 내부 구성요소의 처리 통계를 조회합니다."""
+    return {
+        "first_pass": first_filter.get_stats(),
+        "first_pass_pool": first_pool.get_stats() if first_pool is not None else None,
+        "execution": executor.get_stats(),
+        "youtube": yt_client.get_stats(),
+        "comment_store": comment_store.get_stats() if comment_store is not None else None,
+        "second_pass": second_filter.get_stats()
+    }
+
+@app.post("/api/system/basic-module/reload", summary="Basic AI 모듈 다시 로드")
+async def reload_basic_module():
+    """
+    디스크의 Basic AI 모듈(모델 파일 또는 ONNX 파일)을 다시 로드합니다. 모델을 교체한 뒤 서버 재시작 없이 반영할 때 사용합니다.
+    모델 식별자가 바뀌면 토큰 확률 캐시가 무효화됩니다. 로드에 실패하면 기존 모델을 계속 사용합니다.
+    """
+    loaded = await executor.run_io(second_filter.reload_basic_module)
+    if not loaded:
+        raise HTTPException(status_code=500, detail="Basic AI 모듈 로드 실패 (기존 모델 유지)")
+    return {
+        "status": "reloaded",
+        "model_id": second_filter.model_id,
+        "basic_runtime": second_filter.basic_runtime,
+    }
+
+
 # =========================================================
 # [API 2] 개별 모듈 테스트 (Unit APIs)
 # =========================================================
@@ -307,11 +432,12 @@ async def run_first_pass(input_data: TextInput):
     KoNLPy 및 사전을 이용한 1차 필터링을 수행합니다.
     반환값은 FirstPassResponse 모델을 따릅니다.
     """
-    try:
-        result = first_filter.execute(input_data.text)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    async with executor.admit():
+        try:
+            result = await executor.run_cpu(first_filter.execute, input_data.text)
+            return result
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/modules/second-pass", response_model=SecondPassResponse, summary="Step 2. 2차 필터링 (AI)")
 async def run_second_pass(
@@ -332,13 +458,15 @@ async def run_second_pass(
     1차 필터링 결과(FirstPassResponse)를 입력받아 AI 정밀 분석을 수행합니다.
     반환값은 SecondPassResponse 모델을 따르며, AI 적발 내역이 누적됩니다.
     """
-    try:
-        # Pydantic 모델 -> dict 변환
-        input_dict = first_pass_result.dict()
-        result = second_filter.execute(input_dict)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    async with executor.admit():
+        try:
+            # Pydantic 모델 -> dict 변환
+            input_dict = first_pass_result.dict()
+            # Basic 모듈은 CPU 스레드 풀에서, LLM 호출은 비동기로 실행 (이벤트 루프 블로킹 방지)
+            result = await second_filter.execute_async(input_dict)
+            return result
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/modules/score", response_model=RiskResponse, summary="Step 3. 위험도 점수 계산")
 async def calculate_risk_score(
@@ -402,33 +530,72 @@ async def decide_policy(
 async def get_youtube_video_info(video_id: str):
     if not yt_client.youtube:
         raise HTTPException(status_code=500, detail="YouTube API 클라이언트가 초기화되지 않았습니다.")
-    return yt_client.get_video_details(video_id)
+    return await yt_client.aget_video_details(video_id)
 
 @app.get("/api/modules/youtube/comments", summary="유튜브 댓글 수집 (원문)")
 async def get_youtube_comments_raw(video_id: str, max_pages: int = 1):
     if not yt_client.youtube:
         raise HTTPException(status_code=500, detail="YouTube API 클라이언트가 초기화되지 않았습니다.")
-    comments = yt_client.get_comments(video_id, max_pages=max_pages)
+    comments = [comm async for page in yt_client.aiter_comment_pages(video_id, max_pages=max_pages) for comm in page]
     return {"video_id": video_id, "total_count": len(comments), "comments": comments}
 
 # =========================================================
 # [API 3] 전체 통합 워크플로우 (Workflow APIs)
 # =========================================================
 
-def _run_pipeline(text: str) -> dict:
-    res = first_filter.execute(text)
-    res = second_filter.execute(res)
+async def _run_pipeline(text: str) -> dict:
+    """단일 텍스트 분석. details는 FilterResult이며 응답으로 보낼 때 to_dict()로 변환합니다."""
+    res = await executor.run_cpu(first_filter.run, text)
+    res = await second_filter.execute_async(res)
     score = risk_scorer.execute(res)
     final_decision = policy_manager.decide_action(score, res)
     
     return {
-        "original_text": res['original_text'],
+        "original_text": res.original_text,
         "processed_text": final_decision['processed_text'],
         "action": final_decision['action'],
         "score": score,
         "details": res
     }
 
+async def _run_pipeline_batch(texts: List[str], timing: dict = None) -> List[dict]:
+    """
+    여러 텍스트를 한 번에 분석합니다.
+    2차 필터의 Basic 모듈 추론과 LLM 호출을 댓글 단위가 아닌 묶음 단위로 수행하여 처리량을 높입니다.
+    timing dict를 넘기면 단계별 소요 시간(ms)을 누적합니다.
+    """
+    started = time.perf_counter()
+    if first_pool is not None:
+        # 워커 프로세스의 결과를 기다리기만 하므로 I/O 스레드 풀에서 대기
+        first_results = await executor.run_io(first_pool.execute_many, texts)
+    else:
+        first_results = await executor.run_cpu(lambda: [first_filter.run(text) for text in texts])
+    first_done = time.perf_counter()
+    second_results = await second_filter.execute_batch_async(first_results)
+    second_done = time.perf_counter()
+    analyses = await executor.run_cpu(_decide_batch, second_results)
+
+    if timing is not None:
+        timing["first_pass_ms"] = timing.get("first_pass_ms", 0.0) + (first_done - started) * 1000
+        timing["second_pass_ms"] = timing.get("second_pass_ms", 0.0) + (second_done - first_done) * 1000
+        timing["decision_ms"] = timing.get("decision_ms", 0.0) + (time.perf_counter() - second_done) * 1000
+    return analyses
+
+def _decide_batch(second_results: list) -> List[dict]:
+    """2차 필터 결과 묶음의 위험도와 처분을 계산합니다. (CPU 스레드 풀에서 실행)"""
+    analyses = []
+    for res in second_results:
+        score = risk_scorer.execute(res)
+        final_decision = policy_manager.decide_action(score, res)
+        analyses.append({
+            "original_text": res.original_text,
+            "processed_text": final_decision['processed_text'],
+            "action": final_decision['action'],
+            "score": score,
+            "details": res
+        })
+    return analyses
+
 @app.post("/api/workflow/analyze-text", response_model=AnalysisResult, summary="단일 텍스트 전체 분석")
 async def analyze_single_text(
     input_data: TextInput = Body(
@@ -438,50 +605,298 @@ async def analyze_single_text(
         }
     )
 ):
+    async with executor.admit():
+        try:
+            result = await _run_pipeline(input_data.text)
+            result["details"] = result["details"].to_dict()
+            return result
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/workflow/analyze-batch", response_model=BatchAnalysisResponse, summary="여러 텍스트 일괄 분석")
+async def analyze_batch(
+    req: BatchAnalysisRequest = Body(
+        ...,
+        json_schema_extra={
+            "example": {"items": [
+                {"id": "msg-1", "text": "야이 개새끼야 ㅋㅋ"},
+                {"id": "msg-2", "text": "안녕하세요 반갑습니다"},
+                {"id": "msg-3", "text": "야이 개새끼야 ㅋㅋ"}
+            ]}
+        }
+    )
+):
+    """
+    여러 텍스트를 한 번의 요청으로 분석합니다.
+    같은 텍스트는 한 번만 분석하며, 모든 단계(1차 필터, Basic 모듈, LLM 묶음 프롬프트)를 묶음 단위로 실행합니다.
+    결과는 입력 순서대로 반환되고, 단계별 소요 시간이 함께 반환됩니다.
+    """
+    async with executor.admit():
+        try:
+            started = time.perf_counter()
+            unique_texts = list(dict.fromkeys(item.text for item in req.items))
+
+            timing = {"first_pass_ms": 0.0, "second_pass_ms": 0.0, "decision_ms": 0.0}
+            analyses = {}
+            window_size = max(1, config.PIPELINE_WINDOW_SIZE)
+            for start in range(0, len(unique_texts), window_size):
+                window = unique_texts[start:start + window_size]
+                analyses.update(zip(window, await _run_pipeline_batch(window, timing)))
+
+            results = []
+            blocked_count = 0
+            for item in req.items:
+                analysis = analyses[item.text]
+                results.append(dict(analysis, id=item.id, details=analysis["details"].to_dict()))
+                if analysis["action"] != "PASS":
+                    blocked_count += 1
+
+            timing["total_ms"] = (time.perf_counter() - started) * 1000
+            return {
+                "stats": {"total": len(req.items), "unique": len(unique_texts), "blocked": blocked_count},
+                "timing": {key: round(value, 3) for key, value in timing.items()},
+                "results": results
+            }
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+def _summarize_comment(comm: dict, analysis: dict) -> dict:
+    """댓글 하나의 분석 결과를 YoutubeCommentSummary 형태로 만듭니다."""
+    return {
+        "comment_id": comm['comment_id'],
+        "parent_id": comm.get('parent_id'),
+        "author": comm['author_display_name'],
+        "published_at": comm['published_at'],
+        "original": comm['text_original'],
+        "processed": analysis['processed_text'],
+        "action": analysis['action'],
+        "risk_score": analysis['score'],
+        "violation_tags": [item['type'] for item in analysis['details'].detected_words]
+    }
+
+def _video_info_summary(video_id: str, video_info) -> dict:
+    video_title = "Unknown Video"
+    if video_info and isinstance(video_info, dict):
+        video_title = video_info.get('snippet', {}).get('title', 'Unknown Video')
+    return {"title": video_title, "id": video_id}
+
+def _analysis_config_version() -> str:
+    """판정 결과에 영향을 주는 현재 설정의 버전. 저장된 댓글 분석 결과를 그대로 쓸 수 있는지 판단하는 데 사용합니다."""
+    return make_config_version({
+        "security_level": config.SECURITY_LEVEL,
+        "risk_threshold": config.RISK_THRESHOLD,
+        "basic_threshold": second_filter.basic_threshold,
+        "basic_mode": second_filter.basic_mode,
+        "basic_model": second_filter.model_id,
+        "use_detail_ai_model": config.USE_DETAIL_AI_MODEL,
+        "special_modules": sorted(second_filter.special_ai_modules),
+        "cascade_band": config.CASCADE_BANDS.get(config.SECURITY_LEVEL) if config.CASCADE_ENABLED else None,
+        "dictionary": first_filter.dictionary_fingerprint(),
+    })
+
+async def _analyze_comments(comments: list, window_size: int) -> List[tuple]:
+    """댓글 목록을 window_size 단위로 묶어 분석하고 (댓글, 요약) 목록을 반환합니다."""
+    analyzed = []
+    for start in range(0, len(comments), window_size):
+        window = comments[start:start + window_size]
+        analyses = await _run_pipeline_batch([comm['text_original'] for comm in window])
+        analyzed.extend((comm, _summarize_comment(comm, analysis)) for comm, analysis in zip(window, analyses))
+    return analyzed
+
+async def _analyze_youtube_full(video_id: str, max_pages: int) -> tuple:
+    """모든 댓글을 수집하여 분석합니다. 반환값: (댓글 요약 목록, 분석한 댓글 수)"""
+    window_size = max(1, config.PIPELINE_WINDOW_SIZE)
+    summaries = []
+
+    # 페이지가 도착하는 대로 window_size 단위로 묶어 분석 (다음 페이지는 분석 중에 미리 받음)
+    async for page in yt_client.aiter_comment_pages(video_id, max_pages=max_pages):
+        summaries.extend(summary for _, summary in await _analyze_comments(page, window_size))
+    return summaries, len(summaries)
+
+async def _analyze_youtube_incremental(video_id: str, max_pages: int) -> tuple:
+    """
+    댓글 저장소를 사용하는 증분 분석. 반환값: (최신순 댓글 요약 목록(답글 포함), 새로 분석한 댓글 수)
+    1. 최신 댓글부터 페이지를 받다가 지난 워터마크보다 오래된 최상위 댓글에 닿으면 수집을 멈춥니다.
+       (답글은 최상위 댓글 바로 뒤에 이어지며 워터마크 판단에 쓰지 않음)
+    2. 새 댓글, 원문이 바뀐 댓글, 다른 설정 버전으로 분석된 댓글만 분석합니다.
+       (설정만 바뀐 댓글은 다시 수집하지 않고 저장된 원문으로 분석)
+    3. 새 결과를 저장하고 저장된 결과와 합쳐 반환합니다.
+    워터마크보다 오래된 스레드에 새로 달린 답글은 수집하지 않습니다. (analyze-youtube의 full=true로 다시 수집)
+    """
+    version = _analysis_config_version()
+    watermark, stored = await executor.run_io(comment_store.load_video, video_id)
+
+    window_size = max(1, config.PIPELINE_WINDOW_SIZE)
+    # 답글 연결 정보가 없던 이전 형식의 요약도 응답 형식에 맞춤
+    summaries = {
+        comment_id: dict(row["summary"], comment_id=comment_id, parent_id=row["comment"].get('parent_id'))
+        for comment_id, row in stored.items()
+    }
+    entries = []
+    seen = set()
+    newest = None
+    reached = False
+
+    pages = yt_client.aiter_comment_pages(video_id, max_pages=max_pages, order="time")
     try:
-        result = _run_pipeline(input_data.text)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        async for page in pages:
+            changed = []
+            for comm in page:
+                if comm.get('parent_id') is None:
+                    if watermark is not None and comm['published_at'] < watermark:
+                        reached = True
+                        break
+                    newest = max(newest or comm['published_at'], comm['published_at'])
+                seen.add(comm['comment_id'])
+
+                row = stored.get(comm['comment_id'])
+                if row is None or row["config_version"] != version or row["text_hash"] != text_hash(comm['text_original']):
+                    changed.append(comm)
+
+            entries.extend(await _analyze_comments(changed, window_size))
+            if reached:
+                break
+    finally:
+        # 워터마크에 닿으면 미리 받던 다음 페이지 요청도 중단
+        await pages.aclose()
+
+    stale = [row["comment"] for comment_id, row in stored.items() if comment_id not in seen and row["config_version"] != version]
+    entries.extend(await _analyze_comments(stale, window_size))
+
+    for comm, summary in entries:
+        summaries[comm['comment_id']] = summary
+
+    # 지난 워터마크까지 빈틈없이 이어서 수집한 경우(또는 첫 수집)에만 워터마크를 앞당김
+    # (max_pages에 걸려 중간에 멈췄다면 다음 분석에서 남은 구간을 다시 수집)
+    new_watermark = None
+    if newest is not None and (watermark is None or reached):
+        new_watermark = max(newest, watermark or newest)
+    await executor.run_io(comment_store.save_video, video_id, entries, version, new_watermark)
+    comment_store.record(reused=len(summaries) - len(entries), analyzed=len(entries))
+
+    # 최상위 댓글은 최신순, 답글은 각 최상위 댓글 바로 뒤에 작성순으로 배치
+    replies = {}
+    for summary in summaries.values():
+        if summary['parent_id'] is not None:
+            replies.setdefault(summary['parent_id'], []).append(summary)
+
+    ordered = []
+    for summary in sorted(summaries.values(), key=lambda summary: summary['published_at'], reverse=True):
+        if summary['parent_id'] is None:
+            ordered.append(summary)
+            ordered.extend(sorted(replies.get(summary['comment_id'], []), key=lambda reply: reply['published_at']))
+    return ordered, len(entries)
 
 @app.post("/api/workflow/analyze-youtube", response_model=YoutubeAnalysisResponse, summary="유튜브 영상 댓글 분석")
-async def analyze_youtube_video(video_id: str, max_pages: int = 1):
+async def analyze_youtube_video(
+    video_id: str,
+    max_pages: int = 1,
+    full: bool = Query(False, description="저장된 분석 결과를 지우고 처음부터 다시 수집/분석")
+):
+    """
+    영상 댓글을 수집하여 분석합니다.
+    댓글 저장소(COMMENT_STORE_ENABLED)를 사용하면 이전 분석 이후의 새 댓글과 바뀐 댓글만 분석하고
+    저장된 결과와 합쳐 최신순으로 반환합니다. (stats.analyzed_comments: 이번에 분석한 수, reused_comments: 재사용한 수)
+    증분 분석은 마지막 수집 시점(워터마크) 이후의 최상위 댓글만 다시 받기 때문에, 오래된 댓글에 새로 달린 답글이나
+    삭제된 댓글은 반영되지 않습니다. full=true이면 영상의 저장 결과를 삭제하고 max_pages까지 처음부터 다시 수집합니다.
+    """
     if not yt_client.youtube:
         raise HTTPException(status_code=500, detail="YouTube API 연결 실패 (API Key 확인 필요)")
     
-    video_info = yt_client.get_video_details(video_id)
-    comments = yt_client.get_comments(video_id, max_pages=max_pages)
-    
-    analyzed_results = []
-    blocked_count = 0
-    
-    for comm in comments:
-        text = comm['text_original']
-        analysis = _run_pipeline(text)
-        
-        summary = {
-            "author": comm['author_display_name'],
-            "published_at": comm['published_at'],
-            "original": text,
-            "processed": analysis['processed_text'],
-            "action": analysis['action'],
-            "risk_score": analysis['score'],
-            "violation_tags": [item['type'] for item in analysis['details']['detected_words']]
+    async with executor.admit():
+        # 영상 정보는 댓글 수집/분석과 동시에 요청
+        video_task = asyncio.create_task(yt_client.aget_video_details(video_id))
+        try:
+            if comment_store is not None:
+                if full:
+                    await executor.run_io(comment_store.delete_video, video_id)
+                analyzed_results, analyzed_count = await _analyze_youtube_incremental(video_id, max_pages)
+            else:
+                analyzed_results, analyzed_count = await _analyze_youtube_full(video_id, max_pages)
+
+            video_info = await video_task
+        finally:
+            # 댓글 분석이 실패하면 영상 정보 요청도 취소 (쿼터 낭비와 회수되지 않은 예외 방지)
+            if not video_task.done():
+                video_task.cancel()
+            try:
+                await video_task
+            except (asyncio.CancelledError, Exception):
+                # 원래 예외(댓글 분석 실패 또는 위의 await에서 받은 예외)를 그대로 전달
+                pass
+        total_count = len(analyzed_results)
+        blocked_count = sum(1 for summary in analyzed_results if summary['action'] != "PASS")
+        return {
+            "video_info": _video_info_summary(video_id, video_info),
+            "stats": {
+                "total_comments": total_count,
+                "blocked_comments": blocked_count,
+                "clean_comments": total_count - blocked_count,
+                "analyzed_comments": analyzed_count,
+                "reused_comments": total_count - analyzed_count,
+            },
+            "results": analyzed_results
         }
-        analyzed_results.append(summary)
-        
-        if analysis['action'] != "PASS":
-            blocked_count += 1
 
-    video_title = "Unknown Video"
-    if video_info and isinstance(video_info, dict):
-        video_title = video_info.get('snippet', {}).get('title', 'Unknown Video')
+def _format_frame(event: str, data: dict, stream_format: str) -> str:
+    """스트리밍 프레임 하나를 NDJSON 줄 또는 SSE 이벤트로 직렬화합니다."""
+    payload = json.dumps(data, ensure_ascii=False)
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {payload}\n\n"
+    return json.dumps({"event": event, "data": data}, ensure_ascii=False) + "\n"
+
+@app.post("/api/workflow/analyze-youtube/stream", summary="유튜브 영상 댓글 분석 (스트리밍)")
+async def analyze_youtube_video_stream(
+    video_id: str,
+    max_pages: int = 1,
+    stream_format: str = Query("ndjson", alias="format", pattern="^(ndjson|sse)$", description="ndjson 또는 sse")
+):
+    """
+    analyze-youtube의 스트리밍 버전. 댓글 페이지를 받는 대로 STREAM_WINDOW_SIZE개씩 판정하여 바로 내보냅니다.
+    프레임 순서: video_info → (comment × N, stats) 반복 → summary. 오류 시 error 프레임 후 종료합니다.
+    - comment: YoutubeCommentSummary
+    - stats: 지금까지의 누적 통계 (total_comments, blocked_comments, clean_comments)
+    - summary: video_info와 최종 통계
+    서버는 한 페이지(최대 100개)와 현재 묶음만 메모리에 유지하므로 max_pages와 무관하게 메모리 사용량이 일정합니다.
+    """
+    if not yt_client.youtube:
+        raise HTTPException(status_code=500, detail="YouTube API 연결 실패 (API Key 확인 필요)")
 
-    return {
-        "video_info": {"title": video_title, "id": video_id},
-        "stats": {"total_comments": len(comments), "blocked_comments": blocked_count, "clean_comments": len(comments) - blocked_count},
-        "results": analyzed_results
-    }
+    # 스트림이 끝날 때까지 입장권을 유지 (가득 찬 경우 스트림 시작 전에 429 응답)
+    # 반납은 AdmittedStreamingResponse가 응답 전송을 마칠 때 (첫 프레임 전에 연결이 끊겨도) 처리
+    admission = executor.admit()
+    await admission.acquire()
+
+    async def frames():
+        pages = yt_client.aiter_comment_pages(video_id, max_pages=max_pages)
+        stats = {"total_comments": 0, "blocked_comments": 0, "clean_comments": 0}
+        try:
+            video_info = _video_info_summary(video_id, await yt_client.aget_video_details(video_id))
+            yield _format_frame("video_info", video_info, stream_format)
+
+            window_size = max(1, config.STREAM_WINDOW_SIZE)
+            async for page in pages:
+                for start in range(0, len(page), window_size):
+                    window = page[start:start + window_size]
+                    analyses = await _run_pipeline_batch([comm['text_original'] for comm in window])
+
+                    for comm, analysis in zip(window, analyses):
+                        stats["total_comments"] += 1
+                        if analysis['action'] != "PASS":
+                            stats["blocked_comments"] += 1
+                        yield _format_frame("comment", _summarize_comment(comm, analysis), stream_format)
+
+                    stats["clean_comments"] = stats["total_comments"] - stats["blocked_comments"]
+                    yield _format_frame("stats", stats, stream_format)
+
+            yield _format_frame("summary", {"video_info": video_info, "stats": stats}, stream_format)
+        except Exception as e:
+            yield _format_frame("error", {"detail": str(e)}, stream_format)
+        finally:
+            await pages.aclose()
+
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return AdmittedStreamingResponse(frames(), admission, media_type=media_type, headers={"Cache-Control": "no-cache"})
 
 if __name__ == "__main__":
     import uvicorn
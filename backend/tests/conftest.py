@@ -0,0 +1,9 @@
+import os
+
+# 어떤 테스트 모듈이 먼저 config를 불러오더라도 같은 설정이 적용되도록 수집 전에 지정
+# 무거운 외부 의존성(JVM 형태소 분석기, 디스크 캐시, LLM) 없이 main 모듈을 불러옴
+os.environ.setdefault("FIRST_PASS_TOKENIZER", "regex")
+os.environ["OPENAI_API_KEY"] = ""
+os.environ["LLM_CACHE_ENABLED"] = "False"
+os.environ["YOUTUBE_CACHE_ENABLED"] = "False"
+os.environ["COMMENT_STORE_ENABLED"] = "False"
@@ -0,0 +1,112 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filter_api.core.dictionary_matcher import AhoCorasickMatcher, select_matches
+
+
+def _matcher(*patterns) -> AhoCorasickMatcher:
+    matcher = AhoCorasickMatcher()
+    for pattern, priority, payload in patterns:
+        matcher.add(pattern, priority, payload)
+    matcher.build()
+    return matcher
+
+
+def _found(matcher, text) -> list:
+    return sorted(matcher.iter_matches(text))
+
+
+def test_finds_overlapping_patterns_with_priorities():
+    matcher = _matcher(("새끼", 1, "bitch"), ("개새끼", 1, "dog"), ("개새끼", 3, None))
+
+    assert _found(matcher, "야 개새끼야") == [
+        (2, 5, 1, "dog"),
+        (2, 5, 3, None),
+        (3, 5, 1, "bitch"),
+    ]
+    assert matcher.pattern_count == 3
+
+
+def test_add_duplicate_and_remove():
+    matcher = _matcher(("졸라", 1, "freaking"))
+
+    assert matcher.add("졸라", 1, "other") is False
+    assert matcher.remove("졸라", 2) is False
+    assert matcher.remove("없는말", 1) is False
+    assert matcher.remove("졸라", 1) is True
+    assert _found(matcher, "졸라 짜증") == []
+    assert matcher.pattern_count == 0
+
+
+def test_copy_is_isolated_from_the_original():
+    original = _matcher(("시발", 1, "fuck"), ("병신", 1, "asshole"))
+
+    clone = original.copy()
+    clone.add("바보", 2)
+    clone.remove("시발", 1)
+    clone.build()
+
+    text = "시발 바보 병신"
+    # 사본을 고쳐도 원본(다른 스레드가 탐색 중인 자동자)은 그대로
+    assert _found(original, text) == [(0, 2, 1, "fuck"), (6, 8, 1, "asshole")]
+    assert _found(clone, text) == [(3, 5, 2, None), (6, 8, 1, "asshole")]
+    assert original.pattern_count == 2 and clone.pattern_count == 2
+
+
+def test_lazy_build_after_add():
+    matcher = _matcher(("개", 1, None))
+    matcher.add("개나리", 2)
+
+    # build()를 부르지 않아도 탐색 전에 한 번 계산됨
+    assert _found(matcher, "개나리") == [(0, 1, 1, None), (0, 3, 2, None)]
+
+
+def test_readers_see_complete_automaton_while_swapping_copies():
+    current = {"matcher": _matcher(("시발", 1, None))}
+    errors = []
+    stop = threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            try:
+                matches = list(current["matcher"].iter_matches("시발 개새끼 병신 " * 3))
+                assert all(start < end for start, end, _, _ in matches)
+            except Exception as e:
+                errors.append(e)
+                return
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    try:
+        for idx in range(300):
+            clone = current["matcher"].copy()
+            clone.add(f"단어{idx}", 2)
+            if idx % 2:
+                clone.remove("시발", 1)
+            else:
+                clone.add("시발", 1)
+            clone.build()
+            current["matcher"] = clone
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    assert errors == []
+
+
+def test_select_matches_prefers_priority_then_length():
+    matches = [
+        (0, 2, 1, "short"),
+        (0, 3, 1, "long"),
+        (1, 3, 3, "user"),
+        (4, 6, 1, "separate"),
+    ]
+
+    selected = select_matches(matches)
+
+    assert selected == [(1, 3, 3, "user"), (4, 6, 1, "separate")]
@@ -0,0 +1,59 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filter_api.core.first_pass_filter import FirstPassFilter
+from filter_api.core.spans import render_masked
+
+
+@pytest.fixture(scope="module")
+def first_pass():
+    return FirstPassFilter()
+
+
+def _run(first_pass, text):
+    result = first_pass.run(text)
+    return result, render_masked(text, result.spans)
+
+
+@pytest.mark.parametrize("text", ["그만 졸라", "그만 졸la"])
+def test_white_context_suppresses_match(first_pass, text):
+    result, masked = _run(first_pass, text)
+
+    assert result.status == "PASSED"
+    assert result.detected_words == [] and result.spans == []
+    assert masked == text
+
+
+def test_same_word_outside_white_context_is_filtered(first_pass):
+    result, masked = _run(first_pass, "졸라 짜증나")
+
+    assert result.status == "FILTERED_BY_FIRST_PASS"
+    assert result.detected_words == [{"word": "졸라", "type": "SYSTEM_KEYWORD"}]
+    assert masked == "** 짜증나"
+
+
+@pytest.mark.parametrize("text, word, masked", [
+    ("야 씨1321발 뭐냐", "씨1321발", "야 ****** 뭐냐"),
+    ("ㅅl발 진짜", "ㅅl발", "*** 진짜"),
+])
+def test_variants_are_masked_at_original_offsets(first_pass, text, word, masked):
+    result, rendered = _run(first_pass, text)
+
+    assert result.status == "FILTERED_BY_FIRST_PASS"
+    assert result.detected_words == [{"word": word, "type": "SYSTEM_VARIANT"}]
+    span = result.spans[0]
+    assert text[span["start"]:span["end"]] == word
+    assert rendered == masked
+
+
+@pytest.mark.parametrize("text", ["개나리 피었다", "시발점이다", "가지 볶음", "수박 먹자", "사과 주세요", "병원 가자"])
+def test_short_common_words_are_not_variant_false_positives(first_pass, text):
+    result, masked = _run(first_pass, text)
+
+    assert result.status == "PASSED"
+    assert result.detected_words == []
+    assert masked == text
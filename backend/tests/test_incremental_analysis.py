@@ -0,0 +1,171 @@
+import os
+import sys
+import asyncio
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from filter_api.storage import CommentStore
+
+
+def _comment(index: int, text: str = None, parent_id: str = None) -> dict:
+    comment_id = f"c{index}" if parent_id is None else f"{parent_id}.r{index}"
+    return {
+        "comment_id": comment_id,
+        "parent_id": parent_id,
+        "author_display_name": "tester",
+        "published_at": f"2024-01-01T00:{index:02d}:00Z",
+        "text_original": text or f"댓글 {comment_id}",
+    }
+
+
+class FakeYouTube:
+    """최신순 댓글 목록을 페이지 단위로 돌려주고, 몇 페이지를 내보냈는지 기록합니다."""
+
+    def __init__(self, page_size: int = 2):
+        self.comments = []
+        self.page_size = page_size
+        self.pages_served = 0
+
+    def aiter_comment_pages(self, video_id, max_pages=1, order="relevance", **kwargs):
+        assert order == "time"
+
+        async def pages():
+            for start in range(0, len(self.comments), self.page_size):
+                if self.pages_served >= max_pages:
+                    return
+                self.pages_served += 1
+                yield list(self.comments[start:start + self.page_size])
+
+        return pages()
+
+
+@pytest.fixture
+def harness(monkeypatch):
+    fake = FakeYouTube()
+    state = {"version": "v1", "analyzed": []}
+
+    async def analyze(comments, window_size):
+        state["analyzed"].append([comm["comment_id"] for comm in comments])
+        return [
+            (comm, {
+                "comment_id": comm["comment_id"],
+                "parent_id": comm.get("parent_id"),
+                "published_at": comm["published_at"],
+                "original": comm["text_original"],
+                "action": "PASS",
+            })
+            for comm in comments
+        ]
+
+    store = CommentStore(":memory:")
+    monkeypatch.setattr(main, "comment_store", store)
+    monkeypatch.setattr(main, "yt_client", fake)
+    monkeypatch.setattr(main, "_analyze_comments", analyze)
+    monkeypatch.setattr(main, "_analysis_config_version", lambda: state["version"])
+    yield fake, state, store
+    store.close()
+
+
+def _scan(fake, state, max_pages=10):
+    fake.pages_served = 0
+    state["analyzed"] = []
+    ordered, analyzed_count = asyncio.run(main._analyze_youtube_incremental("vid", max_pages))
+    analyzed = sorted(comment_id for batch in state["analyzed"] for comment_id in batch)
+    return ordered, analyzed_count, analyzed
+
+
+def test_first_scan_analyzes_everything_and_sets_watermark(harness):
+    fake, state, store = harness
+    fake.comments = [_comment(3), _comment(2), _comment(1)]
+
+    ordered, count, analyzed = _scan(fake, state)
+
+    assert count == 3
+    assert analyzed == ["c1", "c2", "c3"]
+    assert [summary["comment_id"] for summary in ordered] == ["c3", "c2", "c1"]
+    watermark, stored = store.load_video("vid")
+    assert watermark == _comment(3)["published_at"]
+    assert set(stored) == {"c1", "c2", "c3"}
+
+
+def test_rescan_stops_at_watermark_and_only_analyzes_new_comments(harness):
+    fake, state, store = harness
+    fake.comments = [_comment(4), _comment(3), _comment(2), _comment(1)]
+    _scan(fake, state)
+
+    fake.comments = [_comment(6), _comment(5)] + fake.comments
+    ordered, count, analyzed = _scan(fake, state)
+
+    assert analyzed == ["c5", "c6"]
+    assert count == 2
+    # c4(워터마크)가 있는 두 번째 페이지에서 멈추고, c2/c1이 있는 세 번째 페이지는 받지 않음
+    assert fake.pages_served == 2
+    assert [summary["comment_id"] for summary in ordered] == ["c6", "c5", "c4", "c3", "c2", "c1"]
+    assert store.load_video("vid")[0] == _comment(6)["published_at"]
+
+
+def test_edited_comment_is_reanalyzed(harness):
+    fake, state, store = harness
+    fake.comments = [_comment(2), _comment(1)]
+    _scan(fake, state)
+
+    fake.comments = [_comment(2, text="수정된 댓글"), _comment(1)]
+    ordered, count, analyzed = _scan(fake, state)
+
+    assert analyzed == ["c2"]
+    assert ordered[0]["original"] == "수정된 댓글"
+
+
+def test_config_version_change_reanalyzes_stored_comments_without_refetching(harness):
+    fake, state, store = harness
+    fake.comments = [_comment(4), _comment(3), _comment(2), _comment(1)]
+    _scan(fake, state)
+
+    state["version"] = "v2"
+    ordered, count, analyzed = _scan(fake, state)
+
+    # 첫 페이지에서 워터마크(c4)에 닿아 멈추고, 받지 않은 c2/c1은 저장된 원문으로 재분석
+    assert fake.pages_served == 1
+    assert analyzed == ["c1", "c2", "c3", "c4"]
+    assert count == 4
+    _, stored = store.load_video("vid")
+    assert {row["config_version"] for row in stored.values()} == {"v2"}
+
+    # 같은 설정으로 다시 수집하면 재분석 없음
+    _, count, analyzed = _scan(fake, state)
+    assert analyzed == [] and count == 0
+
+
+def test_max_pages_cut_keeps_old_watermark(harness):
+    fake, state, store = harness
+    fake.comments = [_comment(2), _comment(1)]
+    _scan(fake, state)
+
+    fake.comments = [_comment(8), _comment(7), _comment(6), _comment(5)] + fake.comments
+    _, count, analyzed = _scan(fake, state, max_pages=1)
+
+    # 워터마크까지 닿지 못했으므로 워터마크를 앞당기지 않음 (다음 수집에서 c6/c5를 다시 받음)
+    assert analyzed == ["c7", "c8"]
+    assert store.load_video("vid")[0] == _comment(2)["published_at"]
+
+    _, count, analyzed = _scan(fake, state)
+    assert analyzed == ["c5", "c6"]
+    assert store.load_video("vid")[0] == _comment(8)["published_at"]
+
+
+def test_old_replies_do_not_stop_collection(harness):
+    fake, state, store = harness
+    fake.comments = [_comment(5), _comment(1)]
+    _scan(fake, state)
+
+    # 새 최상위 댓글(c9)에 달린 답글의 작성 시각이 워터마크보다 이르더라도 수집을 멈추지 않음
+    thread = _comment(9)
+    fake.comments = [thread, _comment(2, parent_id="c9"), _comment(7)] + fake.comments
+    ordered, _, analyzed = _scan(fake, state)
+
+    assert analyzed == ["c7", "c9", "c9.r2"]
+    ids = [summary["comment_id"] for summary in ordered]
+    assert ids[:3] == ["c9", "c9.r2", "c7"]
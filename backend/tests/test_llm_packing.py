@@ -0,0 +1,177 @@
+import os
+import sys
+import json
+import asyncio
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import config
+from filter_api.cache.verdict_cache import VerdictCache
+from filter_api.core.llm_client import CircuitBreaker
+from filter_api.core.second_pass_filter import SecondPassFilter
+
+
+VERDICT = {"detected_items": [{"keyword": "바보", "category": "INSULT"}], "reason": "모욕", "severity": 2}
+CLEAN = {"detected_items": [], "reason": "", "severity": 0}
+
+
+class FakeLLM:
+    """프롬프트 종류(묶음/단건)별로 정해 둔 응답을 돌려주고 호출 기록을 남깁니다."""
+
+    def __init__(self, batch_reply):
+        self.batch_reply = batch_reply
+        self.batch_calls = []
+        self.single_calls = []
+
+    def __call__(self, prompt):
+        if "분석할 댓글 목록 (JSON): " in prompt:
+            payload = prompt.split("분석할 댓글 목록 (JSON): ", 1)[1].split("\n", 1)[0]
+            items = {item["id"]: item["text"] for item in json.loads(payload)}
+            self.batch_calls.append(items)
+            return self.batch_reply(items) if callable(self.batch_reply) else self.batch_reply
+        self.single_calls.append(prompt)
+        return dict(CLEAN)
+
+
+@pytest.fixture
+def second_pass(tmp_path):
+    # 모델 로딩 없이 묶음 판정에 필요한 속성만 구성
+    f = SecondPassFilter.__new__(SecondPassFilter)
+    f.basic_ai_module = ["욕설 검사"]
+    f.special_ai_modules = {}
+    f.llm_model = "test-model"
+    f.client = object()
+    f.verdict_cache = VerdictCache(str(tmp_path / "verdicts.sqlite3"))
+    f._cache_executor = None
+    yield f
+    f.verdict_cache.close()
+
+
+def _use_llm(monkeypatch, second_pass, batch_reply) -> FakeLLM:
+    fake = FakeLLM(batch_reply)
+    monkeypatch.setattr(second_pass, "_call_openai_api", fake)
+
+    async def call_async(prompt):
+        return fake(prompt)
+
+    monkeypatch.setattr(second_pass, "_call_openai_api_async", call_async)
+    return fake
+
+
+def _cached(second_pass, text):
+    return second_pass._lookup_verdict(text)[1]
+
+
+def test_pack_items_respects_max_items_and_budget(second_pass, monkeypatch):
+    monkeypatch.setattr(config, "LLM_PACK_MAX_ITEMS", 2)
+    monkeypatch.setattr(config, "LLM_PACK_TOKEN_BUDGET", 100000)
+    items = {f"c{idx}": f"댓글 {idx}" for idx in range(5)}
+
+    assert [list(pack) for pack in second_pass._pack_items(items)] == [["c0", "c1"], ["c2", "c3"], ["c4"]]
+
+    # 예산을 넘는 긴 댓글은 혼자 한 묶음
+    base = second_pass._estimate_tokens(second_pass._construct_batch_prompt({}))
+    monkeypatch.setattr(config, "LLM_PACK_MAX_ITEMS", 25)
+    monkeypatch.setattr(config, "LLM_PACK_TOKEN_BUDGET", base + 40)
+    items = {"c0": "짧음", "c1": "가" * 100, "c2": "짧음2"}
+
+    assert [list(pack) for pack in second_pass._pack_items(items)] == [["c0"], ["c1"], ["c2"]]
+
+
+def test_parse_batch_response_maps_by_id_and_skips_bad_entries():
+    response = {"results": [
+        {"id": "c1", **VERDICT},
+        {"id": "c0", "detected_items": []},
+        {"id": "c9", **VERDICT},  # 묶음에 없는 id
+        {"id": "c2", "detected_items": "없음"},  # 목록이 아님
+        {"id": "c3", "detected_items": ["바보"]},  # 항목이 객체가 아님
+        "c4",
+    ]}
+
+    parsed = SecondPassFilter._parse_batch_response(response, {"c0": "", "c1": "", "c2": "", "c3": ""})
+
+    assert parsed == {
+        "c1": VERDICT,
+        "c0": {"detected_items": [], "reason": "", "severity": 0},
+    }
+    assert SecondPassFilter._parse_batch_response({"results": "oops"}, {"c0": ""}) == {}
+    assert SecondPassFilter._parse_batch_response(["c0"], {"c0": ""}) == {}
+
+
+def test_packed_results_are_mapped_back_and_cached(second_pass, monkeypatch):
+    fake = _use_llm(monkeypatch, second_pass, lambda items: {"results": [
+        {"id": item_id, **(VERDICT if "바보" in text else CLEAN)} for item_id, text in reversed(items.items())
+    ]})
+
+    verdicts = second_pass._get_llm_verdicts_packed(["너 바보", "좋은 영상", "너 바보"])
+
+    assert len(fake.batch_calls) == 1 and fake.single_calls == []
+    assert verdicts == {"너 바보": VERDICT, "좋은 영상": CLEAN}
+    assert _cached(second_pass, "너 바보") == VERDICT
+    assert _cached(second_pass, "좋은 영상") == CLEAN
+
+
+def test_missing_item_is_retried_alone(second_pass, monkeypatch):
+    fake = _use_llm(monkeypatch, second_pass, lambda items: {"results": [
+        {"id": item_id, **VERDICT} for item_id, text in items.items() if text != "빠진 댓글"
+    ]})
+
+    verdicts = second_pass._get_llm_verdicts_packed(["너 바보", "빠진 댓글", "또 바보"])
+
+    assert len(fake.batch_calls) == 1
+    assert len(fake.single_calls) == 1 and '"빠진 댓글"' in fake.single_calls[0]
+    assert verdicts == {"너 바보": VERDICT, "빠진 댓글": CLEAN, "또 바보": VERDICT}
+    assert _cached(second_pass, "빠진 댓글") == CLEAN
+
+
+@pytest.mark.parametrize("reply", [
+    {},  # 공급자 장애 / JSON 파싱 실패
+    {"error": "bad json"},  # results 목록이 없는 응답
+    {"results": {"c0": VERDICT}},  # results가 목록이 아님
+])
+def test_whole_pack_failure_is_not_cached_or_fanned_out(second_pass, monkeypatch, reply):
+    fake = _use_llm(monkeypatch, second_pass, reply)
+    texts = ["너 바보", "좋은 영상", "또 바보"]
+
+    verdicts = second_pass._get_llm_verdicts_packed(texts)
+
+    # 실패한 묶음 호출 1번이 단건 호출 N번으로 불어나지 않고, 실패 응답이 멤버마다 캐시되지 않음
+    assert len(fake.batch_calls) == 1 and fake.single_calls == []
+    assert verdicts == {text: reply for text in texts}
+    assert second_pass.verdict_cache.get_stats()["size"] == 0
+    assert all(_cached(second_pass, text) is None for text in texts)
+
+
+def test_malformed_json_reply_from_provider_is_not_cached(second_pass):
+    class Completions:
+        calls = 0
+
+        def create(self, **kwargs):
+            Completions.calls += 1
+            message = type("Message", (), {"content": '{"results": [{"id": "c0",'})
+            choice = type("Choice", (), {"message": message})
+            return type("Response", (), {"choices": [choice]})
+
+    second_pass.client = type("Client", (), {"chat": type("Chat", (), {"completions": Completions()})})
+    second_pass.llm_breaker = CircuitBreaker(5, 30)
+    texts = ["너 바보", "좋은 영상"]
+
+    verdicts = second_pass._get_llm_verdicts_packed(texts)
+
+    assert Completions.calls == 1
+    assert verdicts == {text: {} for text in texts}
+    assert second_pass.verdict_cache.get_stats()["size"] == 0
+
+
+def test_async_path_matches_sync_path(second_pass, monkeypatch):
+    fake = _use_llm(monkeypatch, second_pass, lambda items: {"results": [
+        {"id": item_id, **VERDICT} for item_id, text in items.items() if text != "빠진 댓글"
+    ]})
+
+    verdicts = asyncio.run(second_pass._get_llm_verdicts_packed_async(["너 바보", "빠진 댓글"]))
+
+    assert len(fake.batch_calls) == 1 and len(fake.single_calls) == 1
+    assert verdicts == {"너 바보": VERDICT, "빠진 댓글": CLEAN}
+    assert _cached(second_pass, "너 바보") == VERDICT
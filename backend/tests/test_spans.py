@@ -0,0 +1,79 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filter_api.core.spans import (
+    add_spans,
+    make_span,
+    normalize_with_offsets,
+    render_filter_text,
+    render_masked,
+    span_from_filter_range,
+)
+
+
+def test_normalize_keeps_original_offsets():
+    text, offsets = normalize_with_offsets("Hi!! 졸라, 짜증")
+
+    assert text == "hi 졸라 짜증"
+    assert [("Hi!! 졸라, 짜증")[idx] for idx in offsets] == list("Hi 졸라 짜증")
+
+
+def test_render_filter_text_replaces_spans_with_placeholders():
+    original = "야!! 개새끼야, 진짜"
+    spans = [make_span(4, 7, "SYSTEM_KEYWORD", "FIRST_PASS")]
+
+    text, offsets = render_filter_text(original, spans)
+
+    assert text == "야 __F__야 진짜"
+    assert offsets[2:7] == [None] * 5
+    assert original[offsets[7]] == "야"
+
+
+def test_span_from_filter_range_maps_back_to_original():
+    original = "ㅋㅋ 너... 진짜 Babo 같다"
+    text, offsets = render_filter_text(original, [])
+    start = text.index("babo")
+
+    span = span_from_filter_range(offsets, start, start + 4, "AI_INSULT", "LLM")
+
+    assert original[span["start"]:span["end"]] == "Babo"
+    assert span["type"] == "AI_INSULT" and span["source_stage"] == "LLM"
+
+
+def test_span_from_filter_range_rejects_placeholder_overlap():
+    original = "시발 뭐야"
+    text, offsets = render_filter_text(original, [make_span(0, 2, "SYSTEM_KEYWORD", "FIRST_PASS")])
+
+    assert text == "__F__ 뭐야"
+    assert span_from_filter_range(offsets, 0, 3, "AI_BASIC", "BASIC_MODULE") is None
+    assert span_from_filter_range(offsets, 2, 2, "AI_BASIC", "BASIC_MODULE") is None
+    span = span_from_filter_range(offsets, 6, 8, "AI_BASIC", "BASIC_MODULE")
+    assert original[span["start"]:span["end"]] == "뭐야"
+
+
+def test_render_masked_keeps_length_and_skips_whitelist():
+    original = "Oh!! 씨1321발, 그리고 사랑해"
+    spans = [
+        make_span(5, 11, "SYSTEM_VARIANT", "FIRST_PASS"),
+        make_span(20, 23, "WHITELIST", "FIRST_PASS"),
+    ]
+
+    masked = render_masked(original, spans)
+
+    assert masked == "Oh!! ******, 그리고 사랑해"
+    assert len(masked) == len(original)
+    assert render_masked(original, spans, mask_char="#") == "Oh!! ######, 그리고 사랑해"
+
+
+def test_add_spans_ignores_overlaps_and_empty_ranges():
+    base = [make_span(0, 4, "SYSTEM_KEYWORD", "FIRST_PASS")]
+
+    merged = add_spans(base, [
+        make_span(2, 6, "AI_BASIC", "BASIC_MODULE"),
+        make_span(6, 6, "AI_BASIC", "BASIC_MODULE"),
+        make_span(8, 10, "AI_BASIC", "BASIC_MODULE"),
+    ])
+
+    assert [(span["start"], span["end"]) for span in merged] == [(0, 4), (8, 10)]
@@ -0,0 +1,119 @@
+import os
+import sys
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.requests import ClientDisconnect
+
+from filter_api.core.execution import AdmittedStreamingResponse, ExecutionLayer
+
+
+SCOPE_24 = {"type": "http", "asgi": {"spec_version": "2.4"}}
+SCOPE_20 = {"type": "http"}
+
+
+async def _receive():
+    await asyncio.sleep(3600)
+
+
+async def _disconnected_receive():
+    return {"type": "http.disconnect"}
+
+
+async def _disconnected_send(message):
+    raise OSError("client disconnected")
+
+
+def _layer() -> ExecutionLayer:
+    return ExecutionLayer(cpu_workers=1, io_workers=1, max_inflight=1, max_queue=0)
+
+
+def test_release_is_idempotent():
+    async def scenario():
+        layer = _layer()
+        admission = await layer.admit().acquire()
+        admission.release()
+        admission.release()
+        return layer
+
+    layer = asyncio.run(scenario())
+    assert layer.get_stats()["inflight"] == 0
+    assert layer.get_stats()["completed"] == 1
+
+
+def test_disconnect_before_first_chunk_releases_slot():
+    """첫 프레임 전에 연결이 끊겨 본문 생성기가 시작되지 않아도 입장권이 반납되어야 함"""
+    started = []
+
+    async def frames():
+        started.append(True)
+        yield "never sent"
+
+    async def scenario():
+        layer = _layer()
+        admission = await layer.admit().acquire()
+        response = AdmittedStreamingResponse(frames(), admission, media_type="application/x-ndjson")
+        try:
+            await response(SCOPE_24, _receive, _disconnected_send)
+        except ClientDisconnect:
+            pass
+
+        # 반납되었으면 다음 요청이 바로 입장 가능
+        follow_up = await asyncio.wait_for(layer.admit().acquire(), timeout=1)
+        follow_up.release()
+        return layer
+
+    layer = asyncio.run(scenario())
+    assert not started
+    assert layer.get_stats()["inflight"] == 0
+
+
+def test_disconnect_mid_stream_closes_generator_and_releases_slot():
+    closed = []
+
+    async def frames():
+        try:
+            yield "first\n"
+            await asyncio.sleep(3600)
+            yield "second\n"
+        finally:
+            closed.append(True)
+
+    async def scenario():
+        layer = _layer()
+        admission = await layer.admit().acquire()
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        response = AdmittedStreamingResponse(frames(), admission, media_type="application/x-ndjson")
+        await response(SCOPE_20, _disconnected_receive, send)
+        return layer
+
+    layer = asyncio.run(scenario())
+    assert closed
+    assert layer.get_stats()["inflight"] == 0
+
+
+def test_completed_stream_releases_slot():
+    async def frames():
+        yield "a\n"
+        yield "b\n"
+
+    async def scenario():
+        layer = _layer()
+        admission = await layer.admit().acquire()
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        response = AdmittedStreamingResponse(frames(), admission, media_type="application/x-ndjson")
+        await response(SCOPE_24, _receive, send)
+        return layer, sent
+
+    layer, sent = asyncio.run(scenario())
+    assert [m.get("body") for m in sent if m["type"] == "http.response.body"] == [b"a\n", b"b\n", b""]
+    assert layer.get_stats()["inflight"] == 0
@@ -0,0 +1,59 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filter_api.core.hangul_normalizer import VariantIndex, consonant_distance, variant_key
+
+
+def _index(*words, max_distance=1, min_length=7) -> VariantIndex:
+    index = VariantIndex(max_distance, min_length)
+    for word, payload in words:
+        index.add(variant_key(word), payload)
+    return index
+
+
+def _lookup(index, word) -> list:
+    return [(payload, distance) for _, payload, distance in index.lookup(variant_key(word))]
+
+
+def test_consonant_edits_within_distance_are_found():
+    index = _index(("개새끼야", "dog"))
+
+    assert _lookup(index, "개새끼야") == [("dog", 0)]
+    assert _lookup(index, "개새키야") == [("dog", 1)]   # 자음 치환
+    assert _lookup(index, "개섹끼야") == [("dog", 1)]   # 자음 삽입
+    assert _lookup(index, "개새끼얌") == [("dog", 1)]   # 받침 추가
+
+
+def test_vowel_edits_are_not_matched():
+    index = _index(("개새끼야", "dog"))
+
+    assert _lookup(index, "개소끼야") == []
+    assert consonant_distance(variant_key("개새끼야"), variant_key("개소끼야"), 1) == 2
+
+
+def test_max_distance_limits_matches():
+    strict = _index(("개새끼야", "dog"), max_distance=0)
+    loose = _index(("개새끼야", "dog"), max_distance=2)
+
+    assert _lookup(strict, "개새키야") == []
+    assert _lookup(strict, "개새끼야") == [("dog", 0)]
+    assert _lookup(loose, "개섹끼얌") == [("dog", 2)]
+    assert _lookup(_index(("개새끼야", "dog")), "개섹끼얌") == []
+
+
+def test_short_keys_are_not_indexed():
+    index = _index(("가지", "sexual_m"), ("개새끼", "dog"), ("개새끼야", "dog"))
+
+    # 키 길이가 min_length(7) 미만인 단어는 근사 매칭하지 않음
+    assert len(index) == 1
+    assert _lookup(index, "가자") == []
+    assert _lookup(index, "개새키") == []
+
+
+def test_short_common_words_do_not_match_long_entries():
+    index = _index(("개새끼야", "dog"), ("씨발놈아", "fuck"), ("병신새끼", "asshole"))
+
+    for word in ["가지", "사과", "수박", "개나리", "병원", "새끼줄", "시발점", "개미야"]:
+        assert _lookup(index, word) == [], word
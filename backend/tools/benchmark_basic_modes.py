@@ -0,0 +1,137 @@
+"""
+Basic AI 모듈 판정 방식(word / sentence) 비교 벤치마크.
+1차 필터를 거친 댓글에 대해 각 방식의 댓글당 지연과 forward 입력 수, 기준 방식(word) 대비 적발 결과 일치율을 출력합니다.
+캐시와 스케줄러는 끄고 순수 추론 비용만 측정합니다.
+
+사용법: python tools/benchmark_basic_modes.py [테스트 파일 경로] [--modes word,sentence] [--model-dir 경로]
+"""
+import os
+import sys
+import time
+import argparse
+
+# backend 디렉토리를 경로에 추가
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(backend_dir)
+
+from filter_api.core.first_pass_filter import FirstPassFilter
+from filter_api.core.second_pass_filter import SecondPassFilter
+
+MODES = ("word", "sentence")
+
+
+def percentile(values: list, ratio: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def load_model(second_filter: SecondPassFilter, model_dir: str):
+    """기본 모듈 대신 지정한 디렉토리의 모델을 사용합니다."""
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+    module = AutoModelForSequenceClassification.from_pretrained(model_dir)
+    module.to(second_filter.device)
+    module.eval()
+    second_filter._set_basic_module(AutoTokenizer.from_pretrained(model_dir), module, "torch", model_dir)
+
+
+def run_mode(second_filter: SecondPassFilter, mode: str, texts: list) -> dict:
+    second_filter.basic_mode = mode
+
+    # forward 입력 수 집계를 위해 추론 함수를 감쌈
+    counter = {"inputs": 0}
+    infer = second_filter._infer_basic_batch
+
+    def counting_infer(tokens):
+        counter["inputs"] += len(tokens)
+        return infer(tokens)
+
+    second_filter._infer_basic_batch = counting_infer
+    try:
+        second_filter._score_candidates([texts[0]], [second_filter._candidate_positions(texts[0])])
+        counter["inputs"] = 0
+
+        latencies = []
+        detections = []
+        for text in texts:
+            start = time.perf_counter()
+            positions = second_filter._candidate_positions(text)
+            scores = second_filter._score_candidates([text], [positions])[0]
+            latencies.append((time.perf_counter() - start) * 1000)
+            detections.append(sorted(word for (word, _), score in zip(positions, scores) if score >= second_filter.basic_threshold))
+    finally:
+        second_filter._infer_basic_batch = infer
+
+    return {"latencies": latencies, "detections": detections, "inputs": counter["inputs"]}
+
+
+def compare(reference: list, candidate: list) -> dict:
+    """적발 여부(댓글 단위) 일치율과, 기준 대비 적발 단어의 재현율/정밀도를 계산합니다."""
+    flag_match = sum(1 for ref, cand in zip(reference, candidate) if bool(ref) == bool(cand))
+    ref_total = sum(len(ref) for ref in reference)
+    cand_total = sum(len(cand) for cand in candidate)
+    common = 0
+    for ref, cand in zip(reference, candidate):
+        remaining = list(cand)
+        for word in ref:
+            if word in remaining:
+                remaining.remove(word)
+                common += 1
+    return {
+        "flag_match": flag_match / len(reference) if reference else 1.0,
+        "recall": common / ref_total if ref_total else 1.0,
+        "precision": common / cand_total if cand_total else 1.0,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Basic AI 모듈 판정 방식 벤치마크")
+    parser.add_argument("path", nargs="?", default=os.path.join(backend_dir, "resources", "test_data", "test_comments.txt"))
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--model-dir", default="", help="기본 Basic 모듈 대신 사용할 모델 디렉토리")
+    parser.add_argument("--threshold", type=float, default=None, help="Basic 모듈 임계값 (기본: 설정값)")
+    parser.add_argument("--show-diff", type=int, default=10, help="기준과 다른 댓글을 몇 개까지 출력할지")
+    args = parser.parse_args()
+
+    with open(args.path, "r", encoding="utf-8") as f:
+        comments = [line.strip() for line in f if line.strip()]
+
+    first_filter = FirstPassFilter()
+    texts = [first_filter.run(comment).text_for_filtering for comment in comments]
+
+    second_filter = SecondPassFilter()
+    if args.model_dir:
+        load_model(second_filter, args.model_dir)
+    if second_filter.basic_module is None:
+        print("Basic 모듈이 로드되지 않았습니다. --model-dir로 모델을 지정하세요.", file=sys.stderr)
+        sys.exit(1)
+    if args.threshold is not None:
+        second_filter.basic_threshold = args.threshold
+    second_filter.token_cache = None
+    second_filter.scheduler = None
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip() in MODES]
+    results = {mode: run_mode(second_filter, mode, texts) for mode in modes}
+    reference_name = modes[0]
+    reference = results[reference_name]["detections"]
+
+    print("==========================================")
+    print(f"▶ Basic 모듈 판정 방식 벤치마크 ({len(texts)}건, 기준: {reference_name}, 임계값: {second_filter.basic_threshold})")
+    print("==========================================")
+    for mode, result in results.items():
+        latencies = result["latencies"]
+        parity = compare(reference, result["detections"])
+        flagged = sum(1 for words in result["detections"] if words)
+        print(f"[{mode}]")
+        print(f"  지연(ms): 평균 {sum(latencies) / len(latencies):.3f}, p50 {percentile(latencies, 0.5):.3f}, p95 {percentile(latencies, 0.95):.3f}")
+        print(f"  forward 입력 수: 댓글당 {result['inputs'] / len(texts):.2f}개, 적발 댓글 {flagged}건")
+        print(f"  기준 대비: 적발 여부 일치 {parity['flag_match']:.2%}, 재현율 {parity['recall']:.2%}, 정밀도 {parity['precision']:.2%}")
+
+        if mode != reference_name and args.show_diff > 0:
+            shown = 0
+            for comment, ref, cand in zip(comments, reference, result["detections"]):
+                if ref != cand:
+                    print(f"    - {comment[:40]} | {reference_name}: {ref} / {mode}: {cand}")
+                    shown += 1
+                    if shown >= args.show_diff:
+                        break
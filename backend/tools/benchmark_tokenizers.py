@@ -0,0 +1,95 @@
+"""
+1차 필터 토크나이저 백엔드 비교 벤치마크.
+각 백엔드의 초기화(콜드 스타트) 시간, 댓글당 처리 지연, 기준 백엔드(okt) 대비 적발 결과 일치율을 출력합니다.
+
+사용법: python tools/benchmark_tokenizers.py [테스트 파일 경로] [--backends okt,regex]
+"""
+import os
+import sys
+import time
+import argparse
+
+# backend 디렉토리를 경로에 추가
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(backend_dir)
+
+from filter_api.core.first_pass_filter import FirstPassFilter
+from filter_api.core.tokenizer_backends import TOKENIZERS
+
+
+def percentile(values: list, ratio: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def run_backend(name: str, comments: list) -> dict:
+    start = time.perf_counter()
+    tokenizer = TOKENIZERS[name]()
+    first_filter = FirstPassFilter(tokenizer=tokenizer)
+    first_filter.execute("더미 데이터")
+    cold_start = time.perf_counter() - start
+
+    latencies = []
+    detections = []
+    for comment in comments:
+        start = time.perf_counter()
+        result = first_filter.execute(comment)
+        latencies.append((time.perf_counter() - start) * 1000)
+        detections.append(sorted(item['word'] for item in result['detected_words']))
+
+    return {"cold_start": cold_start, "latencies": latencies, "detections": detections}
+
+
+def compare(reference: list, candidate: list) -> dict:
+    """댓글 단위 일치율과, 기준 대비 적발 단어의 재현율/정밀도를 계산합니다."""
+    same = sum(1 for ref, cand in zip(reference, candidate) if ref == cand)
+    ref_total = sum(len(ref) for ref in reference)
+    cand_total = sum(len(cand) for cand in candidate)
+    common = 0
+    for ref, cand in zip(reference, candidate):
+        remaining = list(cand)
+        for word in ref:
+            if word in remaining:
+                remaining.remove(word)
+                common += 1
+    return {
+        "comment_match": same / len(reference) if reference else 1.0,
+        "recall": common / ref_total if ref_total else 1.0,
+        "precision": common / cand_total if cand_total else 1.0,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="1차 필터 토크나이저 벤치마크")
+    parser.add_argument("path", nargs="?", default=os.path.join(backend_dir, "resources", "test_data", "test_comments.txt"))
+    parser.add_argument("--backends", default=",".join(TOKENIZERS.keys()))
+    parser.add_argument("--show-diff", type=int, default=10, help="기준과 다른 댓글을 몇 개까지 출력할지")
+    args = parser.parse_args()
+
+    with open(args.path, "r", encoding="utf-8") as f:
+        comments = [line.strip() for line in f if line.strip()]
+
+    backends = [name.strip() for name in args.backends.split(",") if name.strip() in TOKENIZERS]
+    results = {name: run_backend(name, comments) for name in backends}
+    reference_name = backends[0]
+    reference = results[reference_name]["detections"]
+
+    print("==========================================")
+    print(f"▶ 토크나이저 벤치마크 ({len(comments)}건, 기준: {reference_name})")
+    print("==========================================")
+    for name, result in results.items():
+        latencies = result["latencies"]
+        parity = compare(reference, result["detections"])
+        print(f"[{name}]")
+        print(f"  콜드 스타트: {result['cold_start']:.2f} sec")
+        print(f"  지연(ms): 평균 {sum(latencies) / len(latencies):.3f}, p50 {percentile(latencies, 0.5):.3f}, p95 {percentile(latencies, 0.95):.3f}")
+        print(f"  기준 대비: 댓글 일치 {parity['comment_match']:.2%}, 재현율 {parity['recall']:.2%}, 정밀도 {parity['precision']:.2%}")
+
+        if name != reference_name and args.show_diff > 0:
+            shown = 0
+            for comment, ref, cand in zip(comments, reference, result["detections"]):
+                if ref != cand:
+                    print(f"    - {comment[:40]} | {reference_name}: {ref} / {name}: {cand}")
+                    shown += 1
+                    if shown >= args.show_diff:
+                        break
@@ -0,0 +1,164 @@
+"""
+Basic AI 모듈을 ONNX로 export하고(선택적으로 동적 int8 양자화), PyTorch 모델 대비 확률 차이를 확인합니다.
+만들어진 모델은 BASIC_MODULE_RUNTIME=onnx 설정으로 SecondPassFilter에서 사용합니다.
+
+사용법:
+  python tools/export_basic_module.py [--quantize] [--model-dir 경로] [--output 경로]
+  python tools/export_basic_module.py --check-only [--corpus 테스트 파일 경로]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# backend 디렉토리를 경로에 추가
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(backend_dir)
+
+import torch
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+from config import config
+from filter_api.core.first_pass_filter import FirstPassFilter
+from filter_api.core.onnx_classifier import OnnxClassifier
+from filter_api.core.second_pass_filter import SecondPassFilter
+
+DEFAULT_MODEL_DIR = os.path.join(backend_dir, "resources", "modules", "basic_ai_module")
+
+
+class LogitsOnly(torch.nn.Module):
+    """export 그래프의 출력을 logits 하나로 고정하기 위한 래퍼"""
+
+    def __init__(self, model, input_names: list):
+        super().__init__()
+        self.model = model
+        self.input_names = input_names
+
+    def forward(self, *args):
+        return self.model(**dict(zip(self.input_names, args))).logits
+
+
+def export_onnx(model_dir: str, output_path: str, opset: int):
+    tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    model = AutoModelForSequenceClassification.from_pretrained(model_dir).eval()
+
+    sample = tokenizer(["예시 문장입니다", "짧은"], padding=True, return_tensors="pt")
+    input_names = list(sample.keys())
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    with torch.no_grad():
+        torch.onnx.export(
+            LogitsOnly(model, input_names),
+            tuple(sample[name] for name in input_names),
+            output_path,
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            dynamo=False,
+        )
+
+
+def quantize_onnx(input_path: str, output_path: str):
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(input_path, output_path, weight_type=QuantType.QInt8)
+
+
+def collect_inputs(corpus_path: str) -> list:
+    """테스트 댓글의 word 모드 후보 단어와 sentence 모드 문장(마스킹 토큰 제외)을 모읍니다."""
+    with open(corpus_path, "r", encoding="utf-8") as f:
+        comments = [line.strip() for line in f if line.strip()]
+
+    first_filter = FirstPassFilter()
+    inputs = []
+    for comment in comments:
+        text = first_filter.run(comment).text_for_filtering
+        inputs.extend(word for word, _ in SecondPassFilter._tokenize_with_positions(text))
+        sentence = " ".join(SecondPassFilter._strip_placeholders(text).split())
+        if sentence:
+            inputs.append(sentence)
+    return list(dict.fromkeys(inputs))
+
+
+def check_parity(model_dir: str, onnx_path: str, texts: list, batch_size: int, threshold: float) -> dict:
+    """같은 입력에 대한 PyTorch / ONNX 확률 차이와 임계값 판정이 뒤바뀐 수, 배치당 지연을 계산합니다."""
+    tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    torch_model = AutoModelForSequenceClassification.from_pretrained(model_dir).eval()
+    onnx_model = OnnxClassifier(onnx_path, num_threads=config.BASIC_ONNX_THREADS)
+
+    torch_probs, onnx_probs = [], []
+    torch_time = onnx_time = 0.0
+    for i in range(0, len(texts), batch_size):
+        chunk = texts[i:i + batch_size]
+
+        start = time.perf_counter()
+        inputs = tokenizer(chunk, truncation=True, padding=True, max_length=config.BASIC_MAX_LENGTH, return_tensors="pt")
+        with torch.no_grad():
+            torch_probs.extend(torch.softmax(torch_model(**inputs).logits, dim=-1)[:, 1].tolist())
+        torch_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        inputs = tokenizer(chunk, truncation=True, padding=True, max_length=config.BASIC_MAX_LENGTH, return_tensors="np")
+        onnx_probs.extend(onnx_model.predict_proba(inputs))
+        onnx_time += time.perf_counter() - start
+
+    diffs = sorted(abs(a - b) for a, b in zip(torch_probs, onnx_probs))
+    batches = max(1, -(-len(texts) // batch_size))
+    return {
+        "count": len(texts),
+        "max_diff": diffs[-1] if diffs else 0.0,
+        "mean_diff": sum(diffs) / len(diffs) if diffs else 0.0,
+        "p99_diff": diffs[min(len(diffs) - 1, int(len(diffs) * 0.99))] if diffs else 0.0,
+        "flips": sum(1 for a, b in zip(torch_probs, onnx_probs) if (a >= threshold) != (b >= threshold)),
+        "torch_ms": torch_time * 1000 / batches,
+        "onnx_ms": onnx_time * 1000 / batches,
+    }
+
+
+def weights_size(model_dir: str) -> int:
+    return sum(
+        os.path.getsize(os.path.join(model_dir, name))
+        for name in os.listdir(model_dir)
+        if name.endswith((".safetensors", ".bin"))
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Basic AI 모듈 ONNX export / 양자화 / 정합성 확인")
+    parser.add_argument("--model-dir", default=DEFAULT_MODEL_DIR)
+    parser.add_argument("--output", default="", help="ONNX 파일 경로 (기본: BASIC_ONNX_PATH 또는 <model-dir>/model.onnx)")
+    parser.add_argument("--quantize", action="store_true", help="동적 int8 양자화 적용")
+    parser.add_argument("--opset", type=int, default=17)
+    parser.add_argument("--check-only", action="store_true", help="export 없이 기존 ONNX 파일의 정합성만 확인")
+    parser.add_argument("--corpus", default=os.path.join(backend_dir, "resources", "test_data", "test_comments.txt"))
+    parser.add_argument("--batch-size", type=int, default=config.BASIC_BATCH_SIZE)
+    args = parser.parse_args()
+
+    output_path = args.output or config.BASIC_ONNX_PATH or os.path.join(args.model_dir, "model.onnx")
+
+    print("==========================================")
+    print("▶ Basic 모듈 ONNX export")
+    print("==========================================")
+    if not args.check_only:
+        start = time.perf_counter()
+        if args.quantize:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                fp32_path = os.path.join(tmp_dir, "model.fp32.onnx")
+                export_onnx(args.model_dir, fp32_path, args.opset)
+                quantize_onnx(fp32_path, output_path)
+        else:
+            export_onnx(args.model_dir, output_path, args.opset)
+        print(f"  ㄴ 저장: {output_path} ({'int8' if args.quantize else 'fp32'}, {time.perf_counter() - start:.1f} sec)")
+
+    print(f"  ㄴ 크기: PyTorch {weights_size(args.model_dir) / 1024 / 1024:.1f}MB -> ONNX {os.path.getsize(output_path) / 1024 / 1024:.1f}MB")
+
+    texts = collect_inputs(args.corpus)
+    parity = check_parity(args.model_dir, output_path, texts, max(1, args.batch_size), config.BASIC_THRESHOLD)
+
+    print(f"▶ 정합성 확인 ({parity['count']}개 입력, 임계값 {config.BASIC_THRESHOLD})")
+    print(f"  확률 차이: 최대 {parity['max_diff']:.5f}, 평균 {parity['mean_diff']:.5f}, p99 {parity['p99_diff']:.5f}")
+    print(f"  임계값 판정 불일치: {parity['flips']}건")
+    print(f"  배치당 지연(ms): PyTorch {parity['torch_ms']:.2f}, ONNX {parity['onnx_ms']:.2f} (x{parity['torch_ms'] / max(parity['onnx_ms'], 1e-9):.2f})")
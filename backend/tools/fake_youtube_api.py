@@ -0,0 +1,184 @@
+"""
+로컬 테스트용 YouTube Data API 가짜 서버.
+videos / commentThreads / comments(답글) 응답을 흉내 내며 ETag(If-None-Match → 304)와 페이지 토큰을 지원합니다.
+10번째 스레드마다 답글이 4~12개, 50번째 스레드마다 130개 달려 있습니다. (스레드 응답에는 답글 최대 5개 포함)
+실제 쿼터를 쓰지 않고 YouTubeClient의 응답 캐시, 재검증, 쿼터 기록을 확인할 때 사용합니다.
+
+사용법:
+  python tools/fake_youtube_api.py [--port 8021] [--comments 250]
+  YOUTUBE_API_BASE_URL=http://127.0.0.1:8021 YOUTUBE_API_KEY=test uvicorn main:app
+
+테스트용 엔드포인트:
+  GET  /_stats                          리소스별 요청 수와 304 응답 수
+  POST /_videos/{video_id}/comments     새 댓글 추가 (text 쿼리 파라미터), 이후 응답의 ETag가 바뀜
+"""
+import hashlib
+import json
+import argparse
+import datetime
+
+from fastapi import FastAPI, Header, Response
+
+app = FastAPI(title="Fake YouTube Data API")
+
+BASE_TIME = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+SAMPLE_TEXTS = ["좋은 영상 감사합니다", "야이 개새끼야 ㅋㅋ", "유익하네요", "니네 집 주소 다 털었다", "다음 편도 기대할게요"]
+INLINE_REPLIES = 5
+
+state = {"comments": {}, "default_count": 250, "requests": {}, "not_modified": 0}
+
+
+def _comments(video_id: str) -> list:
+    """영상별 댓글 목록 (처음 조회할 때 default_count개 생성, 오래된 순)"""
+    if video_id not in state["comments"]:
+        state["comments"][video_id] = [
+            _make_comment(video_id, index, SAMPLE_TEXTS[index % len(SAMPLE_TEXTS)])
+            for index in range(state["default_count"])
+        ]
+    return state["comments"][video_id]
+
+
+def _timestamp(minutes: float) -> str:
+    return (BASE_TIME + datetime.timedelta(minutes=minutes)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _reply_count(index: int) -> int:
+    if index % 50 == 0:
+        return 130
+    if index % 10 == 0:
+        return (index % 3 + 1) * 4
+    return 0
+
+
+def _replies(thread_id: str) -> list:
+    """스레드의 답글 목록 (작성순)"""
+    index = int(thread_id.rsplit("-c", 1)[1])
+    return [
+        {
+            "id": f"{thread_id}.r{number}",
+            "snippet": {
+                "parentId": thread_id,
+                "textOriginal": f"{SAMPLE_TEXTS[(index + number + 1) % len(SAMPLE_TEXTS)]} (답글 {number})",
+                "authorDisplayName": f"replier{number % 11}",
+                "publishedAt": _timestamp(index + (number + 1) / 1000),
+            },
+        }
+        for number in range(_reply_count(index))
+    ]
+
+
+def _make_comment(video_id: str, index: int, text: str) -> dict:
+    published_at = _timestamp(index)
+    return {
+        "id": f"{video_id}-c{index}",
+        "snippet": {
+            "videoId": video_id,
+            "topLevelComment": {
+                "id": f"{video_id}-c{index}",
+                "snippet": {
+                    "textOriginal": f"{text} #{index}",
+                    "authorDisplayName": f"user{index % 17}",
+                    "publishedAt": published_at,
+                    "updatedAt": published_at,
+                },
+            },
+            "totalReplyCount": _reply_count(index),
+        },
+    }
+
+
+def _respond(resource: str, body: dict, if_none_match: str) -> Response:
+    """본문 해시를 ETag로 붙이고, 요청의 If-None-Match와 같으면 304로 응답합니다."""
+    state["requests"][resource] = state["requests"].get(resource, 0) + 1
+
+    etag = '"' + hashlib.sha256(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest()[:16] + '"'
+    if if_none_match == etag:
+        state["not_modified"] += 1
+        return Response(status_code=304, headers={"ETag": etag})
+
+    body = dict(body, etag=etag)
+    return Response(json.dumps(body, ensure_ascii=False), media_type="application/json", headers={"ETag": etag})
+
+
+@app.get("/videos")
+def list_videos(id: str, part: str = "snippet", key: str = "", if_none_match: str = Header(None)):
+    body = {
+        "kind": "youtube#videoListResponse",
+        "items": [{
+            "id": id,
+            "snippet": {"title": f"Fake video {id}", "description": "", "tags": ["test"], "categoryId": "22"},
+            "topicDetails": {"topicCategories": []},
+        }],
+    }
+    return _respond("videos", body, if_none_match)
+
+
+@app.get("/commentThreads")
+def list_comment_threads(
+    videoId: str,
+    part: str = "snippet",
+    maxResults: int = 20,
+    order: str = "time",
+    pageToken: str = "",
+    key: str = "",
+    if_none_match: str = Header(None),
+):
+    comments = _comments(videoId)
+    # time: 최신순, relevance: 가짜 서버에서는 생성 순서
+    ordered = list(reversed(comments)) if order == "time" else list(comments)
+
+    offset = int(pageToken or 0)
+    items = ordered[offset:offset + maxResults]
+    if "replies" in part.split(","):
+        items = [
+            dict(item, replies={"comments": _replies(item["id"])[:INLINE_REPLIES]}) if item["snippet"]["totalReplyCount"] else item
+            for item in items
+        ]
+
+    body = {"kind": "youtube#commentThreadListResponse", "items": items}
+    if offset + maxResults < len(ordered):
+        body["nextPageToken"] = str(offset + maxResults)
+    return _respond("commentThreads", body, if_none_match)
+
+
+@app.get("/comments")
+def list_comments(
+    parentId: str,
+    part: str = "snippet",
+    maxResults: int = 20,
+    pageToken: str = "",
+    textFormat: str = "html",
+    key: str = "",
+    if_none_match: str = Header(None),
+):
+    replies = _replies(parentId)
+    offset = int(pageToken or 0)
+    body = {"kind": "youtube#commentListResponse", "items": replies[offset:offset + maxResults]}
+    if offset + maxResults < len(replies):
+        body["nextPageToken"] = str(offset + maxResults)
+    return _respond("comments", body, if_none_match)
+
+
+@app.post("/_videos/{video_id}/comments")
+def add_comment(video_id: str, text: str):
+    comments = _comments(video_id)
+    comments.append(_make_comment(video_id, len(comments), text))
+    return {"video_id": video_id, "total_comments": len(comments)}
+
+
+@app.get("/_stats")
+def get_stats():
+    return {"requests": state["requests"], "not_modified": state["not_modified"]}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="로컬 테스트용 YouTube Data API 가짜 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8021)
+    parser.add_argument("--comments", type=int, default=250, help="영상별로 생성할 댓글 수")
+    args = parser.parse_args()
+
+    state["default_count"] = max(0, args.comments)
+    uvicorn.run(app, host=args.host, port=args.port)
@@ -1,5 +1,5 @@
 import axios from 'axios';
-import type { YoutubeAnalysisResponse, SystemConfigResponse, SystemConfigUpdate, DictionaryRequest, DictionaryResponse, DictionaryUpdateResponse } from './types';
+import type { YoutubeAnalysisResponse, YoutubeAnalysisStreamFrame, SystemConfigResponse, SystemConfigUpdate, DictionaryRequest, DictionaryResponse, DictionaryUpdateResponse } from './types';
 
 const BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -25,6 +25,36 @@ export const fetchAnalysis = async (videoId: string): Promise<YoutubeAnalysisRes
   return response.data;
 };
 
+// 스트리밍 분석: 댓글이 판정되는 대로 프레임을 onFrame으로 전달 (NDJSON)
+export const streamAnalysis = async (
+  videoId: string,
+  onFrame: (frame: YoutubeAnalysisStreamFrame) => void,
+  signal?: AbortSignal,
+): Promise<void> => {
+  const params = new URLSearchParams({ video_id: videoId, max_pages: '1', format: 'ndjson' });
+  const response = await fetch(`${BASE_URL}/api/workflow/analyze-youtube/stream?${params}`, {
+    method: 'POST',
+    signal,
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`[API Error] ${response.status}`);
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += value;
+    const lines = buffer.split('\n');
+    buffer = lines.pop() ?? '';
+    for (const line of lines) {
+      if (line.trim()) onFrame(JSON.parse(line));
+    }
+  }
+  if (buffer.trim()) onFrame(JSON.parse(buffer));
+};
+
 // 2. 시스템 설정 조회 (GET)
 export const fetchSystemConfig = async (): Promise<SystemConfigResponse> => {
   const response = await client.get<SystemConfigResponse>('/api/system/config');
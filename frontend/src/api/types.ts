@@ -1,4 +1,6 @@
 export interface YoutubeCommentSummary {
+  comment_id: string;
+  parent_id: string | null; // 답글이면 최상위 댓글 ID
   author: string;
   published_at: string;
   original: string;
@@ -23,6 +25,14 @@ export interface YoutubeAnalysisResponse {
   results: YoutubeCommentSummary[];
 }
 
+// 스트리밍 분석(/api/workflow/analyze-youtube/stream) NDJSON 프레임
+export type YoutubeAnalysisStreamFrame =
+  | { event: 'video_info'; data: YoutubeAnalysisResponse['video_info'] }
+  | { event: 'comment'; data: YoutubeCommentSummary }
+  | { event: 'stats'; data: YoutubeAnalysisResponse['stats'] }
+  | { event: 'summary'; data: Pick<YoutubeAnalysisResponse, 'video_info' | 'stats'> }
+  | { event: 'error'; data: { detail: string } };
+
 export interface SystemConfigResponse {
   security_level: number;       // UI의 intensity (1~5)
   risk_threshold: number;       // 위험도 임계값
@@ -56,7 +56,7 @@ const ChatTab = () => {
 
   return (
     <div className="flex flex-col space-y-4 p-2">
-      {analysisData.results.map((comment, index) => {
+      {analysisData.results.map((comment) => {
        // =================================================================================
         // [Logic Alignment] 요구사항명세서 및 상세설계서 로직 구현
         // =================================================================================
@@ -84,7 +84,7 @@ const ChatTab = () => {
         // =================================================================================
 
         return (
-          <div key={index} className={`flex items-start space-x-3 p-2 rounded-lg transition-colors ${shouldBlur ? 'bg-red-50' : 'hover:bg-gray-50'}`}>
+          <div key={comment.comment_id} className={`flex items-start space-x-3 p-2 rounded-lg transition-colors ${comment.parent_id ? 'ml-10' : ''} ${shouldBlur ? 'bg-red-50' : 'hover:bg-gray-50'}`}>
             {/* 아바타 */}
             <div className={`w-10 h-10 rounded-full shrink-0 flex items-center justify-center text-white font-bold text-xs ${shouldBlur ? 'bg-red-300' : 'bg-indigo-400'}`}>
               {comment.author.substring(1, 3).toUpperCase()}
@@ -1,12 +1,42 @@
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { fetchAnalysis } from '../api/services';
-import type { AppSettings } from '../api/types';
+import { streamAnalysis } from '../api/services';
+import type { AppSettings, YoutubeAnalysisResponse } from '../api/types';
 
 // 1. 유튜브 분석 데이터 쿼리
+// 스트리밍 API로 받은 댓글을 stats 프레임마다 캐시에 반영하여, 분석이 끝나기 전에도 결과를 표시합니다.
 export const useYoutubeAnalysis = (videoId: string | null) => {
+  const queryClient = useQueryClient();
+  const queryKey = ['youtube-analysis', videoId];
+
   return useQuery({
-    queryKey: ['youtube-analysis', videoId],
-    queryFn: () => fetchAnalysis(videoId!),
+    queryKey,
+    queryFn: async ({ signal }) => {
+      const data: YoutubeAnalysisResponse = { video_info: {}, stats: {}, results: [] };
+      const publish = () => queryClient.setQueryData(queryKey, { ...data, results: [...data.results] });
+
+      await streamAnalysis(videoId!, (frame) => {
+        switch (frame.event) {
+          case 'video_info':
+            data.video_info = frame.data;
+            break;
+          case 'comment':
+            data.results.push(frame.data);
+            break;
+          case 'stats':
+            data.stats = frame.data;
+            publish();
+            break;
+          case 'summary':
+            data.video_info = frame.data.video_info;
+            data.stats = frame.data.stats;
+            break;
+          case 'error':
+            throw new Error(frame.data.detail);
+        }
+      }, signal);
+
+      return data;
+    },
     enabled: !!videoId,
     staleTime: 1000 * 60,
   });